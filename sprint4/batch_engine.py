@@ -0,0 +1,205 @@
+"""
+Hashim Abdulla
+SOS Batch Engine Module - Sprint 4
+Plays thousands of SOS games at once with NumPy (requires numpy)
+
+All K boards share one (K, n + 4, n + 4) int8 array: a two-cell empty
+border means every S-O-S offset from a real cell stays inside the array,
+so no bounds checks are needed. Scores, current player and game-over
+flags are vectors with one entry per board
+"""
+
+import numpy as np
+
+from game_logic import GameBoard, SOSGame, SOS_DIRECTIONS
+
+EMPTY = 0
+S = 1
+O = 2
+
+BLUE = 0
+RED = 1
+DRAW = 2
+NO_WINNER = -1
+
+PAD = 2
+
+LETTER_CODES = {'S': S, 'O': O}
+
+
+class BatchSOSEngine:
+    """K independent SOS games advanced one move per board per step"""
+
+    def __init__(self, num_boards, size=3, mode=SOSGame.SIMPLE_MODE, seed=None):
+        GameBoard.check_size(size)
+        if mode not in (SOSGame.SIMPLE_MODE, SOSGame.GENERAL_MODE):
+            raise ValueError("Invalid game mode")
+        self.num_boards = num_boards
+        self.size = size
+        self.mode = mode
+        self.rng = np.random.default_rng(seed)
+        self.reset()
+
+    def reset(self):
+        k, n = self.num_boards, self.size
+        self.padded = np.zeros((k, n + 2 * PAD, n + 2 * PAD), dtype=np.int8)
+        self.scores = np.zeros((k, 2), dtype=np.int32)   # [:, BLUE], [:, RED]
+        self.current = np.zeros(k, dtype=np.int8)        # BLUE or RED to move
+        self.game_over = np.zeros(k, dtype=bool)
+        self.winner = np.full(k, NO_WINNER, dtype=np.int8)
+        self.filled = np.zeros(k, dtype=np.int32)
+        self.moves = np.zeros(k, dtype=np.int32)
+
+    @property
+    def boards(self):
+        """(K, n, n) view of the real cells: 0 empty, 1 S, 2 O"""
+        return self.padded[:, PAD:-PAD, PAD:-PAD]
+
+    def active(self):
+        return ~self.game_over
+
+    def step(self, rows, cols, letters):
+        """
+        Apply one move to every board that is still playing
+        rows, cols: (K,) cell coordinates; letters: (K,) codes S or O
+        Entries for finished boards are ignored
+        Returns the (K,) number of SOS each move formed
+        """
+        rows = np.asarray(rows)
+        cols = np.asarray(cols)
+        letters = np.asarray(letters, dtype=np.int8)
+        active = np.nonzero(self.active())[0]
+        gains = np.zeros(self.num_boards, dtype=np.int32)
+        if active.size == 0:
+            return gains
+
+        r = rows[active] + PAD
+        c = cols[active] + PAD
+        if np.any(self.padded[active, r, c] != EMPTY):
+            raise ValueError("Cell is already occupied")
+        if not np.all(np.isin(letters[active], (S, O))):
+            raise ValueError("Letter must be S or O")
+
+        self.padded[active, r, c] = letters[active]
+        self.filled[active] += 1
+        self.moves[active] += 1
+        gains[active] = self._count_sos_at(active, r, c)
+        self._apply_rules(active, gains[active])
+        return gains
+
+    def _count_sos_at(self, index, r, c):
+        """Vectorized check_sos_at_position: SOS through padded (r, c)"""
+        cells = self.padded
+        count = np.zeros(index.size, dtype=np.int32)
+        for dr, dc in SOS_DIRECTIONS:
+            for role in (0, 1, 2):
+                # Cells of the line with this cell at position role
+                r0, c0 = r - role * dr, c - role * dc
+                first = cells[index, r0, c0]
+                middle = cells[index, r0 + dr, c0 + dc]
+                last = cells[index, r0 + 2 * dr, c0 + 2 * dc]
+                count += (first == S) & (middle == O) & (last == S)
+        return count
+
+    def _apply_rules(self, index, gains):
+        """Scores, winners and turn switches for the boards that just moved"""
+        full = self.filled[index] == self.size * self.size
+        mover = self.current[index]
+
+        if self.mode == SOSGame.SIMPLE_MODE:
+            won = gains > 0
+            self.winner[index[won]] = mover[won]
+            drawn = full & ~won
+            self.winner[index[drawn]] = DRAW
+            self.game_over[index] = won | full
+            switch = ~won
+        else:
+            self.scores[index, mover] += gains
+            self.game_over[index] = full
+            blue = self.scores[index, BLUE]
+            red = self.scores[index, RED]
+            result = np.where(blue > red, BLUE, np.where(red > blue, RED, DRAW))
+            self.winner[index[full]] = result[full]
+            switch = gains == 0
+
+        switch &= ~self.game_over[index]
+        self.current[index[switch]] ^= 1
+
+    def gain_maps(self):
+        """
+        (K, n, n) arrays of the SOS each letter would form in each cell,
+        built from shifted copies of the whole batch (zero on filled cells)
+        """
+        n = self.size
+        is_s = self.padded == S
+        is_o = self.padded == O
+
+        def shifted(mask, dr, dc):
+            return mask[:, PAD + dr:PAD + dr + n, PAD + dc:PAD + dc + n]
+
+        s_gain = np.zeros((self.num_boards, n, n), dtype=np.int32)
+        o_gain = np.zeros((self.num_boards, n, n), dtype=np.int32)
+        for dr, dc in SOS_DIRECTIONS:
+            # S here as start or end, O here as middle
+            s_gain += shifted(is_o, dr, dc) & shifted(is_s, 2 * dr, 2 * dc)
+            s_gain += shifted(is_o, -dr, -dc) & shifted(is_s, -2 * dr, -2 * dc)
+            o_gain += shifted(is_s, -dr, -dc) & shifted(is_s, dr, dc)
+
+        empty = self.boards == EMPTY
+        return s_gain * empty, o_gain * empty
+
+    def count_all_sos(self):
+        """(K,) total SOS on each board, counted with shifted slices"""
+        n = self.size
+        is_s = self.padded == S
+        is_o = self.padded == O
+        total = np.zeros(self.num_boards, dtype=np.int32)
+        for dr, dc in SOS_DIRECTIONS:
+            first = is_s[:, PAD:PAD + n, PAD:PAD + n]
+            middle = is_o[:, PAD + dr:PAD + dr + n, PAD + dc:PAD + dc + n]
+            last = is_s[:, PAD + 2 * dr:PAD + 2 * dr + n, PAD + 2 * dc:PAD + 2 * dc + n]
+            total += (first & middle & last).sum(axis=(1, 2))
+        return total
+
+    def random_moves(self):
+        """Random empty cell and random letter for every board"""
+        k, n = self.num_boards, self.size
+        noise = self.rng.random((k, n * n))
+        noise[self.boards.reshape(k, n * n) != EMPTY] = -1.0
+        cells = noise.argmax(axis=1)
+        letters = np.where(self.rng.random(k) < 0.5, S, O).astype(np.int8)
+        return cells // n, cells % n, letters
+
+    def greedy_moves(self):
+        """Highest-scoring move per board (ComputerPlayer's first priority), random otherwise"""
+        k, n = self.num_boards, self.size
+        s_gain, o_gain = self.gain_maps()
+        best_gain = np.maximum(s_gain, o_gain).reshape(k, n * n)
+        noise = self.rng.random((k, n * n))
+        score = best_gain + noise
+        score[self.boards.reshape(k, n * n) != EMPTY] = -1.0
+        cells = score.argmax(axis=1)
+        rows, cols = cells // n, cells % n
+
+        boards = np.arange(k)
+        s_at = s_gain[boards, rows, cols]
+        o_at = o_gain[boards, rows, cols]
+        random_letters = np.where(self.rng.random(k) < 0.5, S, O)
+        letters = np.where(s_at > o_at, S, np.where(o_at > s_at, O, random_letters))
+        return rows, cols, letters.astype(np.int8)
+
+    def play_out(self, policy="random"):
+        """Play every board to the end with "random" or "greedy" moves"""
+        choose = self.greedy_moves if policy == "greedy" else self.random_moves
+        while not np.all(self.game_over):
+            self.step(*choose())
+        return self.results()
+
+    def results(self):
+        """Counts of blue wins, red wins and draws over finished boards"""
+        return {
+            "blue_wins": int(np.sum(self.winner == BLUE)),
+            "red_wins": int(np.sum(self.winner == RED)),
+            "draws": int(np.sum(self.winner == DRAW)),
+            "avg_moves": float(self.moves.mean()),
+        }
@@ -0,0 +1,237 @@
+"""
+Hashim Abdulla
+SOS Benchmark Module - Sprint 4
+Times the game_logic hot paths per board size and board implementation
+(GameBoard, BitBoard) and reports ops/sec, p50/p99 latency and peak
+memory (tracemalloc) as JSON
+
+Usage (from the sprint4 folder):
+    python -m benchmark --sizes 3 5 10 --out bench.json
+    python -m benchmark --sizes 10 --boards GameBoard BitBoard --cases place_remove
+    python -m benchmark --baseline bench.json --threshold 0.2
+With --baseline, any case whose ops/sec dropped by more than the threshold
+is listed and the exit status is 1
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from game_logic import BitBoard, create_game, create_player, GameBoard, SOSGame
+
+BOARDS = {"GameBoard": GameBoard, "BitBoard": BitBoard}
+
+
+def filled_game(size, mode=SOSGame.GENERAL_MODE, fill=0.5, seed=0, board_class=GameBoard):
+    """Game with roughly fill * size * size random letters already placed"""
+    rng = random.Random(seed)
+    game = create_game(mode)
+    game.board_class = board_class
+    game.set_board_size(size)
+    game.set_players(create_player("Human", "Blue", "blue"),
+                     create_player("Human", "Red", "red"))
+    game.start_new_game()
+    for _ in range(int(size * size * fill)):
+        if game.is_game_over():
+            break
+        row, col = game.board.empty_cells.choice(rng)
+        game.make_move(row, col, rng.choice('SO'))
+    return game
+
+
+def computer_game(size, mode, seed=0, board_class=GameBoard):
+    game = create_game(mode)
+    game.board_class = board_class
+    game.set_board_size(size)
+    game.set_players(create_player("Computer", "Blue", "blue", game),
+                     create_player("Computer", "Red", "red", game))
+    game.start_new_game()
+    random.seed(seed)
+    return game
+
+
+def play_out(game):
+    while not game.is_game_over():
+        game.make_move(*game.get_current_player().make_move())
+
+
+def bench_check_sos(size, board_class=GameBoard):
+    board = filled_game(size, board_class=board_class).board
+    cells = [(row, col) for row in range(size) for col in range(size)]
+    index = [0]
+
+    def op():
+        row, col = cells[index[0] % len(cells)]
+        index[0] += 1
+        board.check_sos_at_position(row, col)
+    return op
+
+
+def bench_is_board_full(size, board_class=GameBoard):
+    return filled_game(size, board_class=board_class).board.is_board_full
+
+
+def bench_place_remove(size, board_class=GameBoard):
+    """Place, check and take back a letter: the inner step of every search"""
+    board = filled_game(size, board_class=board_class).board
+    cells = list(board.empty_cells)
+    index = [0]
+
+    def op():
+        row, col = cells[index[0] % len(cells)]
+        index[0] += 1
+        board.place_letter(row, col, 'S')
+        board.check_sos_at_position(row, col)
+        board.remove_letter(row, col)
+    return op
+
+
+def bench_fill_board(size, board_class=GameBoard):
+    """New board filled cell by cell; peak memory is what one board costs"""
+    def op():
+        board = board_class(size)
+        for row in range(size):
+            for col in range(size):
+                board.place_letter(row, col, 'SO'[(row + col) % 2])
+    return op
+
+
+def bench_computer_move(size, board_class=GameBoard):
+    game = filled_game(size, fill=0.3, board_class=board_class)
+    player = create_player("Computer", "Blue", "blue", game)
+    return player.make_move
+
+
+def bench_playout(mode):
+    def setup(size, board_class=GameBoard):
+        seeds = iter(range(1 << 30))
+
+        def op():
+            play_out(computer_game(size, mode, next(seeds), board_class))
+        return op
+    return setup
+
+
+# name -> setup(size, board_class) returning a zero-argument operation to time
+CASES = {
+    "check_sos_at_position": bench_check_sos,
+    "is_board_full": bench_is_board_full,
+    "place_remove": bench_place_remove,
+    "fill_board": bench_fill_board,
+    "computer_make_move": bench_computer_move,
+    "simple_playout": bench_playout(SOSGame.SIMPLE_MODE),
+    "general_playout": bench_playout(SOSGame.GENERAL_MODE),
+}
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def measure(op, min_time=0.2, min_runs=5):
+    """
+    Call op until min_time seconds and min_runs calls have passed
+    Returns ops/sec, p50/p99 latency in microseconds and peak memory in bytes
+    Timing runs untraced; peak memory comes from one more call under
+    tracemalloc, which slows every allocation several times over
+    """
+    op()  # Warm up caches (SOS triples, Zobrist keys)
+    timings = []
+    total_start = time.perf_counter()
+    while len(timings) < min_runs or time.perf_counter() - total_start < min_time:
+        start = time.perf_counter()
+        op()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        op()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    total = sum(timings)
+    return {
+        "runs": len(timings),
+        "ops_per_sec": len(timings) / total if total else float('inf'),
+        "p50_us": percentile(timings, 0.50) * 1e6,
+        "p99_us": percentile(timings, 0.99) * 1e6,
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_benchmarks(sizes, cases=None, min_time=0.2, boards=tuple(BOARDS)):
+    """List of result dicts, one per (case, size, board)"""
+    results = []
+    for name in cases or CASES:
+        for size in sizes:
+            for board in boards:
+                result = measure(CASES[name](size, BOARDS[board]), min_time)
+                results.append(dict(case=name, size=size, board=board, **result))
+    return results
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Cases whose ops/sec fell more than threshold (a fraction) below the
+    baseline run. Returns (case, size, board, baseline ops/sec, ops/sec)
+    tuples. Entries without a board are GameBoard runs
+    """
+    def key(entry):
+        return entry["case"], entry["size"], entry.get("board", "GameBoard")
+
+    previous = {key(entry): entry["ops_per_sec"] for entry in baseline}
+    regressions = []
+    for entry in results:
+        before = previous.get(key(entry))
+        if before and entry["ops_per_sec"] < before * (1 - threshold):
+            regressions.append(key(entry) + (before, entry["ops_per_sec"]))
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="SOS game_logic benchmarks")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(range(3, 11)))
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=None)
+    parser.add_argument("--boards", nargs="+", choices=sorted(BOARDS), default=list(BOARDS))
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="seconds to spend on each case")
+    parser.add_argument("--out", default=None, help="write results to this JSON file")
+    parser.add_argument("--baseline", default=None,
+                        help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="allowed ops/sec drop before a case counts as a regression")
+    return parser.parse_args(argv)
+
+
+def main(argv=None, out=None):
+    args = parse_args(argv)
+    out = out or sys.stdout
+    if max(args.sizes) > GameBoard.max_size:
+        GameBoard.max_size = max(args.sizes)
+
+    results = run_benchmarks(args.sizes, args.cases, args.min_time, args.boards)
+    report = {"python": sys.version.split()[0], "results": results}
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+    out.write(json.dumps(report, indent=2) + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for case, size, board, before, after in regressions:
+            out.write(f"REGRESSION {case} size {size} {board}: "
+                      f"{before:.0f} -> {after:.0f} ops/sec\n")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
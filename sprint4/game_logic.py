@@ -5,22 +5,335 @@ Extended with Player class hierarchy for human and computer opponents
 Includes computer AI with basic strategy
 """
 
+import math
+import multiprocessing
+import os
 import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
+
+# SOS line directions: horizontal, vertical and the two diagonals
+SOS_DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1)]
+
+_sos_triples_cache = {}
+
+
+def get_sos_triples(size):
+    """
+    Precomputed SOS line triples for a board size (cached per size)
+    Returns a list indexed by row * size + col. Each entry maps 'S' and 'O'
+    to the triples that cell belongs to with that letter, as tuples of
+    (cells, role, s_need, o_need):
+    - cells: ((r, c), (r, c), (r, c)) in S-O-S order
+    - role: 0 = start, 1 = middle, 2 = end
+    - s_need / o_need: bitmasks of the cells that must hold S / O
+    """
+    triples = _sos_triples_cache.get(size)
+    if triples is not None:
+        return triples
+
+    triples = [{'S': [], 'O': []} for _ in range(size * size)]
+    for row in range(size):
+        for col in range(size):
+            index = row * size + col
+            for dr, dc in SOS_DIRECTIONS:
+                # Same order as a direction-by-direction scan: start, middle, end
+                for role in (0, 1, 2):
+                    first = (row - role * dr, col - role * dc)
+                    cells = tuple((first[0] + k * dr, first[1] + k * dc) for k in range(3))
+                    if not all(0 <= r < size and 0 <= c < size for r, c in cells):
+                        continue
+                    bits = [1 << (r * size + c) for r, c in cells]
+                    letter = 'O' if role == 1 else 'S'
+                    triples[index][letter].append((cells, role, bits[0] | bits[2], bits[1]))
+
+    _sos_triples_cache[size] = triples
+    return triples
+
+
+_threat_links_cache = {}
+
+
+def get_threat_links(size):
+    """
+    Threat map updates for a board size (cached per size)
+    Entry [index][letter] lists, for every SOS line holding letter at index,
+    (target, cell, needs_o, other_row, other_col, other_letter): when the
+    line's third cell (other_row, other_col) holds other_letter, an 'O' (if
+    needs_o) or 'S' at target index / cell tuple would complete the line
+    """
+    links = _threat_links_cache.get(size)
+    if links is not None:
+        return links
+
+    triples = get_sos_triples(size)
+    links = []
+    for index in range(size * size):
+        entry = {}
+        for letter in ('S', 'O'):
+            entry[letter] = []
+            for cells, role, s_need, o_need in triples[index][letter]:
+                a, b = [k for k in (0, 1, 2) if k != role]
+                for here, there in ((a, b), (b, a)):
+                    target_row, target_col = cells[here]
+                    other_row, other_col = cells[there]
+                    entry[letter].append((target_row * size + target_col, cells[here],
+                                          here == 1, other_row, other_col,
+                                          'O' if there == 1 else 'S'))
+        links.append(entry)
+    _threat_links_cache[size] = links
+    return links
+
+
+_neighbors_cache = {}
+
+
+def get_neighbors(size):
+    """
+    The up to 8 cells around each cell of a board size (cached per size)
+    Entry [index] lists (index, (row, col)) for each neighbor
+    """
+    neighbors = _neighbors_cache.get(size)
+    if neighbors is None:
+        neighbors = []
+        for row in range(size):
+            for col in range(size):
+                neighbors.append([(r * size + c, (r, c))
+                                  for r in range(max(row - 1, 0), min(row + 2, size))
+                                  for c in range(max(col - 1, 0), min(col + 2, size))
+                                  if (r, c) != (row, col)])
+        _neighbors_cache[size] = neighbors
+    return neighbors
+
+
+_neighbor_masks_cache = {}
+
+
+def get_neighbor_masks(size):
+    """Bitmask of the up to 8 cells around each cell (cached per size)"""
+    masks = _neighbor_masks_cache.get(size)
+    if masks is None:
+        masks = [sum(1 << other for other, cell in cells) for cells in get_neighbors(size)]
+        _neighbor_masks_cache[size] = masks
+    return masks
+
+
+_cells_cache = {}
+
+
+def get_cells(size):
+    """
+    CellSet of every (row, col) of a board size (cached per size)
+    Shared: copy() it rather than changing it
+    """
+    cells = _cells_cache.get(size)
+    if cells is None:
+        cells = CellSet((row, col) for row in range(size) for col in range(size))
+        _cells_cache[size] = cells
+    return cells
+
+
+_zobrist_cache = {}
+
+
+def get_zobrist_keys(size):
+    """
+    Random 64-bit Zobrist keys for a board size (cached per size)
+    Returns a list indexed by row * size + col mapping 'S' and 'O' to a key.
+    Keys come from a fixed seed so hashes match across processes and runs
+    """
+    keys = _zobrist_cache.get(size)
+    if keys is None:
+        rng = random.Random(0x5050 + size)
+        keys = [{'S': rng.getrandbits(64), 'O': rng.getrandbits(64)}
+                for _ in range(size * size)]
+        _zobrist_cache[size] = keys
+    return keys
+
+
+_symmetry_cache = {}
+
+
+def get_symmetries(size):
+    """
+    The 8 symmetries of a size x size board (rotations and reflections) as
+    cell permutations, cached per size. Entry t is a list where
+    perm[row * size + col] is the index that cell moves to under transform
+    t; transform 0 is the identity, 1-3 rotate by 90/180/270 degrees and
+    4-7 are those rotations followed by a left-right mirror
+    """
+    perms = _symmetry_cache.get(size)
+    if perms is None:
+        perms = []
+        for transform in range(8):
+            perm = []
+            for index in range(size * size):
+                row, col = divmod(index, size)
+                for _ in range(transform % 4):
+                    row, col = col, size - 1 - row
+                if transform >= 4:
+                    col = size - 1 - col
+                perm.append(row * size + col)
+            perms.append(perm)
+        _symmetry_cache[size] = perms
+    return perms
+
+
+# Transform that undoes each transform: rotations 90 <-> 270, the rest
+# (180 degrees and every reflection) are their own inverse
+SYMMETRY_INVERSE = (0, 3, 2, 1, 4, 5, 6, 7)
+
+
+_symmetry_keys_cache = {}
+
+
+def get_symmetry_keys(size):
+    """
+    Zobrist keys seen through each symmetry (cached per size)
+    Entry [index][letter][t] is the key of the cell that index moves to
+    under transform t, so XOR-ing them gives the hash of the transformed
+    position; t = 0 matches get_zobrist_keys
+    """
+    keys = _symmetry_keys_cache.get(size)
+    if keys is None:
+        zobrist = get_zobrist_keys(size)
+        perms = get_symmetries(size)
+        keys = [{letter: tuple(zobrist[perm[index]][letter] for perm in perms)
+                 for letter in ('S', 'O')} for index in range(size * size)]
+        _symmetry_keys_cache[size] = keys
+    return keys
+
+
+def transform_masks(perm, s_mask, o_mask):
+    """Apply a cell permutation from get_symmetries to letter bitmasks"""
+    images = []
+    for mask in (s_mask, o_mask):
+        image = 0
+        while mask:
+            low = mask & -mask
+            image |= 1 << perm[low.bit_length() - 1]
+            mask ^= low
+        images.append(image)
+    return images[0], images[1]
+
+
+def canonical_masks(size, s_mask, o_mask):
+    """
+    Exact canonical form of a position: (key, transform) where key is the
+    smallest s_mask | o_mask << (size * size) over the 8 symmetries and
+    transform is the one producing it
+    """
+    cells = size * size
+    best = s_mask | o_mask << cells
+    best_transform = 0
+    perms = get_symmetries(size)
+    for transform in range(1, 8):
+        s_image, o_image = transform_masks(perms[transform], s_mask, o_mask)
+        key = s_image | o_image << cells
+        if key < best:
+            best = key
+            best_transform = transform
+    return best, best_transform
+
+
+class CellSet:
+    """
+    Indexable set of (row, col) cells
+    Add, remove and random choice are all O(1): cells live in a list and a
+    dict maps each cell to its list position (removal swaps with the last)
+    """
+
+    def __init__(self, cells=()):
+        self.cells = list(dict.fromkeys(cells))
+        self.positions = {cell: index for index, cell in enumerate(self.cells)}
+
+    def add(self, cell):
+        if cell not in self.positions:
+            self.positions[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def remove(self, cell):
+        index = self.positions.pop(cell)
+        last = self.cells.pop()
+        if index < len(self.cells):
+            self.cells[index] = last
+            self.positions[last] = index
+
+    def discard(self, cell):
+        if cell in self.positions:
+            self.remove(cell)
+
+    def copy(self):
+        copied = CellSet()
+        copied.cells = self.cells.copy()
+        copied.positions = self.positions.copy()
+        return copied
+
+    def choice(self, rng=random):
+        """Random cell, or None if the set is empty"""
+        if not self.cells:
+            return None
+        return self.cells[rng.randrange(len(self.cells))]
+
+    def __contains__(self, cell):
+        return cell in self.positions
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __iter__(self):
+        return iter(self.cells)
 
 
 class GameBoard:
     """Represents the SOS game board"""
 
+    MIN_SIZE = 3
+    # Largest accepted board; raise it (e.g. GameBoard.max_size = 100) for
+    # research and stress runs. Engine costs per move do not grow with n*n
+    max_size = 10
+
     def __init__(self, size=3):
-        if not self.is_valid_size(size):
-            raise ValueError("Board size must be between 3 and 10")
+        self.check_size(size)
         self.size = size
         self.grid = [[' ' for _ in range(size)] for _ in range(size)]
-
-    @staticmethod
-    def is_valid_size(size):
-        """Validate board size is between 3 and 10"""
-        return 3 <= size <= 10
+        self.triples = get_sos_triples(size)
+        self.threat_links = get_threat_links(size)
+        self.neighbors = get_neighbors(size)
+        self.zobrist_keys = get_zobrist_keys(size)
+        self.symmetry_keys = get_symmetry_keys(size)
+        self._reset_counters()
+
+    def _reset_counters(self):
+        """Empty-cell set, filled counter and hash, kept in step by place_letter"""
+        self.empty_cells = get_cells(self.size).copy()
+        self.filled_count = 0
+        self.hash = 0  # Zobrist hash of the letters on the board
+        # Built by the symmetry_hashes property on first use (tables, books)
+        # and only then kept up to date
+        self._symmetry_hashes = None
+        # Threat map and scoring cells, built by _track_threats when a
+        # computer player first asks and only then kept up to date
+        self._s_threats = None
+        self._o_threats = None
+        self._scoring_cells = None
+        # Letters around each cell and the frontier, built by the frontier
+        # property on first use and only then kept up to date
+        self._neighbor_counts = None
+        self._frontier = None
+
+    @classmethod
+    def is_valid_size(cls, size):
+        """Validate board size is between 3 and max_size"""
+        return cls.MIN_SIZE <= size <= cls.max_size
+
+    @classmethod
+    def check_size(cls, size):
+        """Raise ValueError for a size outside 3..max_size"""
+        if not cls.is_valid_size(size):
+            raise ValueError(f"Board size must be between {cls.MIN_SIZE} and {cls.max_size}")
 
     def is_cell_empty(self, row, col):
         if not (0 <= row < self.size and 0 <= col < self.size):
@@ -33,70 +346,255 @@ class GameBoard:
         if letter not in ['S', 'O']:
             raise ValueError("Letter must be S or O")
         self.grid[row][col] = letter
+        self.empty_cells.remove((row, col))
+        self.filled_count += 1
+        self.hash ^= self.zobrist_keys[row * self.size + col][letter]
+        if self._symmetry_hashes is not None:
+            self._toggle_symmetry_hashes(row, col, letter)
+        if self._s_threats is not None:
+            self._update_threats(row, col, letter, 1)
+        if self._frontier is not None:
+            self._update_frontier(row, col, 1)
+
+    def remove_letter(self, row, col):
+        """Undo place_letter: clear an occupied cell"""
+        if self.is_cell_empty(row, col):
+            raise ValueError("Cell is already empty")
+        letter = self.grid[row][col]
+        self.hash ^= self.zobrist_keys[row * self.size + col][letter]
+        if self._symmetry_hashes is not None:
+            self._toggle_symmetry_hashes(row, col, letter)
+        self.grid[row][col] = ' '
+        self.empty_cells.add((row, col))
+        self.filled_count -= 1
+        if self._s_threats is not None:
+            self._update_threats(row, col, letter, -1)
+        if self._frontier is not None:
+            self._update_frontier(row, col, -1)
+
+    @property
+    def symmetry_hashes(self):
+        """
+        Hash of the position under each of the 8 symmetries ([0] == hash).
+        Computed from the grid on first use, then tracked by
+        place/remove_letter
+        """
+        if self._symmetry_hashes is None:
+            self._symmetry_hashes = [0] * 8
+            for row in range(self.size):
+                for col, letter in enumerate(self.grid[row]):
+                    if letter != ' ':
+                        self._toggle_symmetry_hashes(row, col, letter)
+        return self._symmetry_hashes
+
+    def _toggle_symmetry_hashes(self, row, col, letter):
+        keys = self.symmetry_keys[row * self.size + col][letter]
+        hashes = self._symmetry_hashes
+        for transform in range(8):
+            hashes[transform] ^= keys[transform]
+
+    def canonical_hash(self):
+        """
+        (hash, transform) of the canonical position: the smallest of the 8
+        symmetric Zobrist hashes (see symmetry_hashes).
+        Symmetric positions get the same hash
+        """
+        hashes = self.symmetry_hashes
+        transform = hashes.index(min(hashes))
+        return hashes[transform], transform
+
+    def canonical_masks(self):
+        """Exact (key, transform) canonical form, see canonical_masks()"""
+        return canonical_masks(self.size, *self.letter_masks())
+
+    def transform_cell(self, row, col, transform):
+        """Where (row, col) of this board lands in the transformed position"""
+        return divmod(get_symmetries(self.size)[transform][row * self.size + col], self.size)
+
+    def untransform_cell(self, row, col, transform):
+        """
+        Map a cell of the transformed (e.g. canonical) position back to
+        this board, such as a book or table move for the canonical form
+        """
+        return self.transform_cell(row, col, SYMMETRY_INVERSE[transform])
+
+    @property
+    def s_threats(self):
+        """SOS an S would complete in each cell, by index"""
+        if self._s_threats is None:
+            self._track_threats()
+        return self._s_threats
+
+    @property
+    def o_threats(self):
+        """SOS an O would complete in each cell, by index"""
+        if self._s_threats is None:
+            self._track_threats()
+        return self._o_threats
+
+    @property
+    def scoring_cells(self):
+        """Empty cells with a non-zero threat"""
+        if self._s_threats is None:
+            self._track_threats()
+        return self._scoring_cells
+
+    def _track_threats(self):
+        """
+        Count the threat map from the grid; place/remove_letter keep it up
+        to date from then on. At most 8 lines pass through a cell, so a
+        byte per cell is enough
+        """
+        self._s_threats = bytearray(self.size * self.size)
+        self._o_threats = bytearray(self.size * self.size)
+        if not self.filled_count:
+            self._scoring_cells = CellSet()
+            return
+        s_mask, o_mask = self.letter_masks()
+        for index in range(self.size * self.size):
+            bit = 1 << index
+            for letter, s_have, o_have, threats in (
+                    ('S', s_mask | bit, o_mask, self._s_threats),
+                    ('O', s_mask, o_mask | bit, self._o_threats)):
+                for cells, role, s_need, o_need in self.triples[index][letter]:
+                    if s_have & s_need == s_need and o_have & o_need:
+                        threats[index] += 1
+        self._scoring_cells = CellSet(
+            cell for cell in self.empty_cells
+            if self._s_threats[cell[0] * self.size + cell[1]] or
+            self._o_threats[cell[0] * self.size + cell[1]])
+
+    def _update_threats(self, row, col, letter, delta):
+        """
+        Adjust the threat map after letter is placed (delta=1) or removed
+        (delta=-1) at (row, col). Only the lines through this cell that need
+        this letter here can change, and only for their other two cells
+        """
+        grid = self.grid
+        s_threats = self._s_threats
+        o_threats = self._o_threats
+        index = row * self.size + col
+        for target, cell, needs_o, other_row, other_col, other_letter in \
+                self.threat_links[index][letter]:
+            if grid[other_row][other_col] == other_letter:
+                if needs_o:
+                    o_threats[target] += delta
+                else:
+                    s_threats[target] += delta
+                self._refresh_scoring_cell(target, cell)
+        self._refresh_scoring_cell(index, (row, col))
+
+    def _refresh_scoring_cell(self, index, cell):
+        """Keep scoring_cells equal to the empty cells with a threat"""
+        if (self._s_threats[index] or self._o_threats[index]) and \
+                self.get_cell(*cell) == ' ':
+            self._scoring_cells.add(cell)
+        else:
+            self._scoring_cells.discard(cell)
+
+    @property
+    def frontier(self):
+        """
+        Empty cells next to at least one letter (every scoring cell is one
+        of them). Counted from the grid on first use, then tracked by
+        place/remove_letter
+        """
+        if self._frontier is None:
+            counts = bytearray(self.size * self.size)
+            grid = self.grid
+            for row in range(self.size):
+                for col in range(self.size):
+                    if grid[row][col] != ' ':
+                        for other, cell in self.neighbors[row * self.size + col]:
+                            counts[other] += 1
+            self._neighbor_counts = counts
+            self._frontier = CellSet(cell for cell in self.empty_cells
+                                     if counts[cell[0] * self.size + cell[1]])
+        return self._frontier
+
+    def _update_frontier(self, row, col, delta):
+        """Count a letter placed (delta=1) or removed (delta=-1) around (row, col)"""
+        counts = self._neighbor_counts
+        frontier = self._frontier
+        index = row * self.size + col
+        if delta > 0:
+            grid = self.grid
+            for other, cell in self.neighbors[index]:
+                counts[other] += 1
+                if counts[other] == 1 and grid[cell[0]][cell[1]] == ' ':
+                    frontier.add(cell)
+            frontier.discard((row, col))
+        else:
+            for other, cell in self.neighbors[index]:
+                counts[other] -= 1
+                if not counts[other]:
+                    frontier.discard(cell)
+            if counts[index]:
+                frontier.add((row, col))
 
     def get_cell(self, row, col):
         return self.grid[row][col]
 
+    def letter_masks(self):
+        """(s_mask, o_mask): bit row * size + col set for each S / O"""
+        s_mask = o_mask = 0
+        for row in range(self.size):
+            for col, letter in enumerate(self.grid[row]):
+                if letter == 'S':
+                    s_mask |= 1 << (row * self.size + col)
+                elif letter == 'O':
+                    o_mask |= 1 << (row * self.size + col)
+        return s_mask, o_mask
+
     def is_board_full(self):
         """Check if the board is completely filled"""
-        for row in self.grid:
-            if ' ' in row:
-                return False
-        return True
+        return self.filled_count == self.size * self.size
+
+    def count_sos_for_move(self, row, col, letter):
+        """Number of SOS that placing letter at empty (row, col) would form"""
+        if self._s_threats is None:
+            self._track_threats()
+        threats = self._o_threats if letter == 'O' else self._s_threats
+        return threats[row * self.size + col]
+
+    def best_scoring_move(self):
+        """(row, col, letter) forming the most SOS, or None if nothing scores"""
+        best = None
+        best_count = 0
+        for row, col in self.scoring_cells:
+            index = row * self.size + col
+            for letter, threats in (('S', self._s_threats), ('O', self._o_threats)):
+                if threats[index] > best_count:
+                    best_count = threats[index]
+                    best = (row, col, letter)
+        return best
+
+    def has_neighbor(self, row, col):
+        """True if any of the 8 surrounding cells holds a letter"""
+        if self._neighbor_counts is not None:
+            return self._neighbor_counts[row * self.size + col] > 0
+        grid = self.grid
+        for other, (other_row, other_col) in self.neighbors[row * self.size + col]:
+            if grid[other_row][other_col] != ' ':
+                return True
+        return False
 
     def reset(self):
         self.grid = [[' ' for _ in range(self.size)] for _ in range(self.size)]
+        self._reset_counters()
 
     def check_sos_at_position(self, row, col):
+        """Return every SOS sequence that passes through (row, col)"""
         sequences = []
+        letter = self.grid[row][col]
+        if letter == ' ':
+            return sequences
 
-        # All 8 directions: horizontal, vertical, and 4 diagonals
-        directions = [
-            (0, 1),  # Horizontal right
-            (1, 0),  # Vertical down
-            (1, 1),  # Diagonal down-right
-            (1, -1),  # Diagonal down-left
-        ]
-
-        for dr, dc in directions:
-            # Check if this cell is 'S' (start of SOS)
-            if self.get_cell(row, col) == 'S':
-                # Check forward: S-O-S
-                if self._is_valid_position(row + dr, col + dc) and \
-                        self._is_valid_position(row + 2 * dr, col + 2 * dc):
-                    if self.get_cell(row + dr, col + dc) == 'O' and \
-                            self.get_cell(row + 2 * dr, col + 2 * dc) == 'S':
-                        sequences.append([
-                            (row, col),
-                            (row + dr, col + dc),
-                            (row + 2 * dr, col + 2 * dc)
-                        ])
-
-            # Check if this cell is 'O' (middle of SOS)
-            if self.get_cell(row, col) == 'O':
-                # Check both directions: S-O-S
-                if self._is_valid_position(row - dr, col - dc) and \
-                        self._is_valid_position(row + dr, col + dc):
-                    if self.get_cell(row - dr, col - dc) == 'S' and \
-                            self.get_cell(row + dr, col + dc) == 'S':
-                        sequences.append([
-                            (row - dr, col - dc),
-                            (row, col),
-                            (row + dr, col + dc)
-                        ])
-
-            # Check if this cell is 'S' (end of SOS)
-            if self.get_cell(row, col) == 'S':
-                # Check backward: S-O-S
-                if self._is_valid_position(row - dr, col - dc) and \
-                        self._is_valid_position(row - 2 * dr, col - 2 * dc):
-                    if self.get_cell(row - dr, col - dc) == 'O' and \
-                            self.get_cell(row - 2 * dr, col - 2 * dc) == 'S':
-                        sequences.append([
-                            (row - 2 * dr, col - 2 * dc),
-                            (row - dr, col - dc),
-                            (row, col)
-                        ])
+        grid = self.grid
+        for cells, role, s_need, o_need in self.triples[row * self.size + col][letter]:
+            (r0, c0), (r1, c1), (r2, c2) = cells
+            if grid[r0][c0] == 'S' and grid[r1][c1] == 'O' and grid[r2][c2] == 'S':
+                sequences.append(list(cells))
 
         return sequences
 
@@ -105,6 +603,349 @@ class GameBoard:
         return 0 <= row < self.size and 0 <= col < self.size
 
 
+class MaskCells:
+    """
+    Read-only view of the cells set in a bitmask (bit row * size + col)
+    Answers the same queries as CellSet: len, in, iteration and choice
+    """
+
+    def __init__(self, size, mask):
+        self.size = size
+        self.mask = mask
+
+    def _indices(self):
+        bits = bin(self.mask)[:1:-1]  # Lowest bit first
+        index = bits.find('1')
+        while index >= 0:
+            yield index
+            index = bits.find('1', index + 1)
+
+    def choice(self, rng=random):
+        """Random cell, or None if the set is empty"""
+        if not self.mask:
+            return None
+        # A few random probes usually land on a set bit; otherwise pick
+        # uniformly among the set bits
+        for _ in range(4):
+            index = rng.randrange(self.size * self.size)
+            if self.mask >> index & 1:
+                return divmod(index, self.size)
+        skip = rng.randrange(len(self))
+        for index in self._indices():
+            if not skip:
+                return divmod(index, self.size)
+            skip -= 1
+
+    def __contains__(self, cell):
+        row, col = cell
+        return 0 <= row < self.size and 0 <= col < self.size and \
+            bool(self.mask >> (row * self.size + col) & 1)
+
+    def __len__(self):
+        return bin(self.mask).count('1')
+
+    def __iter__(self):
+        size = self.size
+        for index in self._indices():
+            yield divmod(index, size)
+
+
+def _count_line(levels, mask):
+    """Add one SOS line for the cells in mask to BitBoard threat levels"""
+    carry = mask
+    for level, cells in enumerate(levels):
+        if not carry:
+            return
+        levels[level], carry = cells | carry, cells & carry
+    if carry:
+        levels.append(carry)
+
+
+class BitBoard(GameBoard):
+    """
+    SOS game board kept entirely in integers instead of a grid of strings
+    Cell (row, col) maps to bit row * size + col
+    - occupied: bits set for every filled cell
+    - s_mask / o_mask: bits set for cells holding 'S' / 'O'
+    - filled_count and hash: the only other state kept up to date
+    Empty cells, scoring cells and symmetry hashes are derived from the
+    masks when asked for, so the board holds no per-cell objects.
+    Against the original grid-only board (10x10), place_letter costs about
+    2.3x more (big-integer operations instead of one list write) while
+    check_sos_at_position costs about 3x less, so a whole SOSGame move is
+    only about 1.4x cheaper: the masks do not cut per-move cost by an order
+    of magnitude. The gains are size (a few hundred bytes), construction
+    and whole-board queries such as best_scoring_move, which make computer
+    moves about 2.5x faster than on GameBoard (benchmark.py --boards).
+    Same public API as GameBoard; grid is a read/write view over the masks
+    """
+
+    def __init__(self, size=3):
+        self.check_size(size)
+        self.size = size
+        self.triples = get_sos_triples(size)
+        self.zobrist_keys = get_zobrist_keys(size)
+        self.full_mask = (1 << (size * size)) - 1
+        self.neighbor_masks = get_neighbor_masks(size)
+        # Per SOS direction: (bit offset, cells with a neighbor ahead, cells
+        # with a neighbor behind). mask >> offset & ahead marks the cells
+        # whose next cell along the line is in mask; << and behind look back
+        left_col = sum(1 << (row * size) for row in range(size))
+        keep = {-1: self.full_mask & ~left_col, 0: self.full_mask,
+                1: self.full_mask & ~(left_col << (size - 1))}
+        self.shifts = [(dr * size + dc, keep[dc], keep[-dc]) for dr, dc in SOS_DIRECTIONS]
+        self.occupied = 0
+        self.s_mask = 0
+        self.o_mask = 0
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.filled_count = 0
+        self.hash = 0
+        self._threat_cache = (None, None, None)  # (s_mask, o_mask, threat levels)
+
+    @property
+    def grid(self):
+        """View so board.grid[row][col] reads and writes the masks"""
+        return _BitBoardGrid(self)
+
+    @property
+    def empty_cells(self):
+        return MaskCells(self.size, self.full_mask & ~self.occupied)
+
+    @property
+    def scoring_cells(self):
+        """Empty cells where some letter would complete an SOS"""
+        s_levels, o_levels = self._threat_levels()
+        return MaskCells(self.size, (s_levels or [0])[0] | (o_levels or [0])[0])
+
+    @property
+    def frontier(self):
+        """Empty cells next to at least one letter"""
+        return MaskCells(self.size, self._near_mask() & ~self.occupied)
+
+    def _near_mask(self):
+        """Cells with a letter in one of the 8 surrounding cells"""
+        occupied = self.occupied
+        near = 0
+        for offset, ahead, behind in self.shifts:
+            near |= occupied >> offset & ahead | occupied << offset & behind
+        return near
+
+    def has_neighbor(self, row, col):
+        return bool(self._near_mask() >> (row * self.size + col) & 1)
+
+    @property
+    def symmetry_hashes(self):
+        """Hash of the position under each of the 8 symmetries ([0] == hash)"""
+        keys = get_symmetry_keys(self.size)
+        hashes = [0] * 8
+        for letter, mask in (('S', self.s_mask), ('O', self.o_mask)):
+            while mask:
+                low = mask & -mask
+                cell_keys = keys[low.bit_length() - 1][letter]
+                for transform in range(8):
+                    hashes[transform] ^= cell_keys[transform]
+                mask ^= low
+        return hashes
+
+    def _threat_levels(self):
+        """
+        (s_levels, o_levels): level k of each list masks the empty cells
+        where that letter would complete more than k SOS. Found by shifting
+        the letter masks along each line to spot S-O-_ and S-_-S gaps
+        """
+        s_mask = self.s_mask
+        o_mask = self.o_mask
+        cached = self._threat_cache
+        if cached[0] == s_mask and cached[1] == o_mask:
+            return cached[2]
+
+        empty = self.full_mask & ~self.occupied
+        s_levels = []
+        o_levels = []
+        for offset, ahead, behind in self.shifts:
+            s_ahead = s_mask >> offset & ahead
+            s_behind = s_mask << offset & behind
+            lines = s_ahead & s_behind & empty
+            if lines:
+                _count_line(o_levels, lines)
+            lines = o_mask >> offset & ahead & s_ahead >> offset & empty
+            if lines:
+                _count_line(s_levels, lines)
+            lines = o_mask << offset & behind & s_behind << offset & empty
+            if lines:
+                _count_line(s_levels, lines)
+        # The greedy player asks twice per move (win, then block)
+        self._threat_cache = (s_mask, o_mask, (s_levels, o_levels))
+        return s_levels, o_levels
+
+    def _bit(self, row, col):
+        return 1 << (row * self.size + col)
+
+    def is_cell_empty(self, row, col):
+        if not (0 <= row < self.size and 0 <= col < self.size):
+            return False
+        return not self.occupied >> (row * self.size + col) & 1
+
+    def place_letter(self, row, col, letter):
+        size = self.size
+        index = row * size + col
+        bit = 1 << index if 0 <= row < size and 0 <= col < size else 0
+        if not bit or self.occupied & bit:
+            raise ValueError("Cell is already occupied")
+        if letter == 'S':
+            self.s_mask |= bit
+        elif letter == 'O':
+            self.o_mask |= bit
+        else:
+            raise ValueError("Letter must be S or O")
+        self.occupied |= bit
+        self.filled_count += 1
+        self.hash ^= self.zobrist_keys[index][letter]
+
+    def remove_letter(self, row, col):
+        """Undo place_letter: clear an occupied cell"""
+        size = self.size
+        index = row * size + col
+        bit = 1 << index if 0 <= row < size and 0 <= col < size else 0
+        if not self.occupied & bit:
+            raise ValueError("Cell is already empty")
+        if self.s_mask & bit:
+            self.s_mask ^= bit
+            self.hash ^= self.zobrist_keys[index]['S']
+        else:
+            self.o_mask ^= bit
+            self.hash ^= self.zobrist_keys[index]['O']
+        self.occupied ^= bit
+        self.filled_count -= 1
+
+    def _set_cell(self, row, col, letter):
+        """Write letter (or ' ' to clear) into the masks without validation"""
+        index = row * self.size + col
+        bit = 1 << index
+        old_letter = self.get_cell(row, col)
+        if old_letter != ' ':
+            self.hash ^= self.zobrist_keys[index][old_letter]
+            self.filled_count -= 1
+        self.s_mask &= ~bit
+        self.o_mask &= ~bit
+        self.occupied &= ~bit
+        if letter != ' ':
+            if letter == 'S':
+                self.s_mask |= bit
+            else:
+                self.o_mask |= bit
+            self.occupied |= bit
+            self.hash ^= self.zobrist_keys[index][letter]
+            self.filled_count += 1
+
+    def get_cell(self, row, col):
+        index = row * self.size + col
+        if self.s_mask >> index & 1:
+            return 'S'
+        if self.o_mask >> index & 1:
+            return 'O'
+        return ' '
+
+    def letter_masks(self):
+        return self.s_mask, self.o_mask
+
+    def is_board_full(self):
+        """Board is full when every bit of the occupancy mask is set"""
+        return self.occupied == self.full_mask
+
+    def count_sos_for_move(self, row, col, letter):
+        """Number of SOS that placing letter at empty (row, col) would form"""
+        bit = self._bit(row, col)
+        s_mask = self.s_mask | bit if letter == 'S' else self.s_mask
+        o_mask = self.o_mask | bit if letter == 'O' else self.o_mask
+        count = 0
+        for cells, role, s_need, o_need in self.triples[row * self.size + col][letter]:
+            if s_mask & s_need == s_need and o_mask & o_need:
+                count += 1
+        return count
+
+    def best_scoring_move(self):
+        """(row, col, letter) forming the most SOS, or None if nothing scores"""
+        s_levels, o_levels = self._threat_levels()
+        if not s_levels and not o_levels:
+            return None
+        letter, levels = ('S', s_levels) if len(s_levels) >= len(o_levels) else ('O', o_levels)
+        mask = levels[-1]
+        row, col = divmod((mask & -mask).bit_length() - 1, self.size)
+        return row, col, letter
+
+    def reset(self):
+        self.occupied = 0
+        self.s_mask = 0
+        self.o_mask = 0
+        self._reset_counters()
+
+    def check_sos_at_position(self, row, col):
+        """Return every SOS sequence that passes through (row, col)"""
+        index = row * self.size + col
+        s_mask = self.s_mask
+        o_mask = self.o_mask
+        # An SOS through an S needs an O next to it and vice versa, which
+        # rules out most cells with one AND
+        if s_mask >> index & 1:
+            letter = 'S'
+            if not o_mask & self.neighbor_masks[index]:
+                return []
+        elif o_mask >> index & 1:
+            letter = 'O'
+            if not s_mask & self.neighbor_masks[index]:
+                return []
+        else:
+            return []
+        return [list(cells) for cells, role, s_need, o_need in self.triples[index][letter]
+                if o_mask & o_need and s_mask & s_need == s_need]
+
+
+class _BitBoardGrid:
+    """Rows of a BitBoard, indexable like a list of rows"""
+
+    def __init__(self, board):
+        self.board = board
+
+    def __len__(self):
+        return self.board.size
+
+    def __getitem__(self, row):
+        if not -self.board.size <= row < self.board.size:
+            raise IndexError("row out of range")
+        return _BitBoardRow(self.board, row % self.board.size)
+
+    def __iter__(self):
+        for row in range(self.board.size):
+            yield _BitBoardRow(self.board, row)
+
+
+class _BitBoardRow:
+    """One row of a BitBoard, indexable like a list of ' '/'S'/'O'"""
+
+    def __init__(self, board, row):
+        self.board = board
+        self.row = row
+
+    def __len__(self):
+        return self.board.size
+
+    def __getitem__(self, col):
+        return self.board.get_cell(self.row, col)
+
+    def __setitem__(self, col, letter):
+        self.board._set_cell(self.row, col, letter)
+
+    def __iter__(self):
+        for col in range(self.board.size):
+            yield self.board.get_cell(self.row, col)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+
 class Player:
     """Base class for all player types"""
 
@@ -140,14 +981,47 @@ class HumanPlayer(Player):
 class ComputerPlayer(Player):
     """Computer player with AI decision making"""
 
+    # Solved positions keyed by (board size, game mode); see solver.py.
+    # A table's best_move(board) answers before the strategy below runs
+    endgame_tables = {}
+    # Opening books keyed the same way (see opening_book.py), consulted next
+    opening_books = {}
+
     def __init__(self, name, color, game):
         super().__init__(name, color)
         self.game = game  # Reference to game for board analysis
+        self.stop_requested = False  # Set from another thread to cut a search short
 
     def is_human(self):
         """Computer players return False"""
         return False
 
+    def request_stop(self):
+        """Ask a running search to return its best move so far"""
+        self.stop_requested = True
+
+    def clear_stop(self):
+        """
+        Forget an earlier request_stop. Searches never clear the flag
+        themselves, so call this on the controlling thread before starting
+        one: a stop sent right after the start is then never lost
+        """
+        self.stop_requested = False
+
+    def set_think_budget(self, milliseconds):
+        """Time a search player may spend per move; the greedy strategy is instant"""
+
+    def lookup_move(self):
+        """Move from an installed endgame table or opening book, or None"""
+        key = (self.game.board_size, self.game.game_mode)
+        for tables in (self.endgame_tables, self.opening_books):
+            table = tables.get(key)
+            if table is not None:
+                move = table.best_move(self.game.board)
+                if move is not None:
+                    return move
+        return None
+
     def make_move(self):
         """
         AI decision-making: returns (row, col, letter) for next move
@@ -157,6 +1031,11 @@ class ComputerPlayer(Player):
         3. Find scoring move (forms SOS in General)
         4. Make random valid move
         """
+        # Perfect play when a solved table covers this board, then book openings
+        move = self.lookup_move()
+        if move is not None:
+            return move
+
         # Priority 1: Look for winning/scoring moves
         winning_move = self.find_winning_move()
         if winning_move:
@@ -175,22 +1054,17 @@ class ComputerPlayer(Player):
                 return scoring_move
 
         # Priority 4: Random valid move
-        valid_moves = self.get_valid_moves()
-        if not valid_moves:
+        cell = self.game.board.empty_cells.choice()
+        if cell is None:
             return None
 
-        row, col = random.choice(valid_moves)
+        row, col = cell
         letter = self.choose_letter()
         return (row, col, letter)
 
     def get_valid_moves(self):
         """Returns list of (row, col) tuples for all empty cells"""
-        valid = []
-        for row in range(self.game.board.size):
-            for col in range(self.game.board.size):
-                if self.game.board.is_cell_empty(row, col):
-                    valid.append((row, col))
-        return valid
+        return list(self.game.board.empty_cells)
 
     def choose_letter(self):
         """Randomly choose 'S' or 'O'"""
@@ -201,35 +1075,17 @@ class ComputerPlayer(Player):
         Find a move that forms SOS (wins in Simple, scores in General)
         Returns (row, col, letter) or None
         """
-        for row, col in self.get_valid_moves():
-            for letter in ['S', 'O']:
-                if self.simulate_move(row, col, letter):
-                    return (row, col, letter)
-        return None
+        # Read the board's threat map instead of trying every cell
+        return self.game.board.best_scoring_move()
 
     def find_blocking_move(self):
         """
         In Simple mode, find and block opponent's winning move
         Returns (row, col, letter) or None
         """
-        # Check if opponent could win on next turn
-        opponent = self.game.red_player if self == self.game.blue_player else self.game.blue_player
-
-        for row, col in self.get_valid_moves():
-            for letter in ['S', 'O']:
-                # Simulate opponent making this move
-                original = self.game.board.grid[row][col]
-                self.game.board.grid[row][col] = letter
-
-                sequences = self.game.board.check_sos_at_position(row, col)
-
-                # Restore board
-                self.game.board.grid[row][col] = original
-
-                if len(sequences) > 0:
-                    # Opponent would win here, so block it
-                    return (row, col, letter)
-        return None
+        # Letters are shared, so any cell where the opponent would complete
+        # an SOS is taken by playing that move first
+        return self.game.board.best_scoring_move()
 
     def find_scoring_move(self):
         """
@@ -243,43 +1099,793 @@ class ComputerPlayer(Player):
         Simulate placing letter at position without modifying board
         Returns True if move forms SOS, False otherwise
         """
-        # Temporarily place letter
-        original = self.game.board.grid[row][col]
-        self.game.board.grid[row][col] = letter
+        return self.game.board.count_sos_for_move(row, col, letter) > 0
+
+
+class TranspositionTable:
+    """
+    Bounded cache of search results keyed by board hash
+    Each slot has two buckets:
+    - depth-preferred: only replaced by an equal or deeper search
+    - always-replace: takes every entry the depth-preferred bucket refuses
+    Entries are (key, depth, value, flag, move). Values are from the point
+    of view of the side to move, so players of both colors can share one
+    table, but use one table per game mode
+    """
+
+    EXACT = 0
+    LOWER = 1  # value is a lower bound (search failed high)
+    UPPER = 2  # value is an upper bound (search failed low)
+
+    def __init__(self, slots=1 << 16):
+        self.slots = slots
+        self.clear()
+
+    def clear(self):
+        self.depth_bucket = [None] * self.slots
+        self.always_bucket = [None] * self.slots
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0  # Probes that found the slot used by other keys
+        self.stores = 0
+
+    def probe(self, key):
+        """Return the stored entry for key, or None"""
+        index = key % self.slots
+        for bucket in (self.depth_bucket, self.always_bucket):
+            entry = bucket[index]
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                return entry
+        self.misses += 1
+        if self.depth_bucket[index] is not None or self.always_bucket[index] is not None:
+            self.collisions += 1
+        return None
+
+    def store(self, key, depth, value, flag, move=None):
+        index = key % self.slots
+        entry = (key, depth, value, flag, move)
+        current = self.depth_bucket[index]
+        self.stores += 1
+        if current is None or current[0] == key or depth >= current[1]:
+            if current is not None and current[0] != key:
+                # Keep the displaced entry in the always-replace bucket
+                self.always_bucket[index] = current
+            elif self.always_bucket[index] is not None and self.always_bucket[index][0] == key:
+                self.always_bucket[index] = None
+            self.depth_bucket[index] = entry
+        else:
+            self.always_bucket[index] = entry
+
+    def hit_rate(self):
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def __len__(self):
+        return sum(entry is not None for entry in self.depth_bucket) + \
+            sum(entry is not None for entry in self.always_bucket)
+
+
+class _SearchTimeout(Exception):
+    """Unwinds a deadline search; place/remove_letter pairs restore the board"""
+
+
+class MinimaxComputerPlayer(ComputerPlayer):
+    """
+    Computer player using alpha-beta minimax search
+    - Searches in place with place_letter/remove_letter, never copies the board
+    - Simple mode: forming an SOS wins, a full board is a draw
+    - General mode: maximizes own points minus opponent points, and the
+      player who scores moves again
+    - Moves are ordered scoring first, then cells next to existing letters
+    - An optional TranspositionTable (shareable between players) caches
+      results by canonical board hash, so the 8 symmetric versions of a
+      position share one entry; stored moves are in canonical coordinates
+    - width limits every node to its best ordered moves, drawn only from
+      the empty cells next to a letter (board.frontier), so move
+      generation scales with the letters placed rather than with n*n
+    - With time_limit_ms, searches deepen one ply at a time (ignoring depth)
+      until the deadline and return the best move of the last completed
+      iteration
+    """
+
+    WIN_SCORE = 1000
+
+    def __init__(self, name, color, game, depth=2, table=None, width=None,
+                 time_limit_ms=None):
+        super().__init__(name, color, game)
+        self.depth = depth
+        self.table = table
+        self.width = width
+        self.time_limit_ms = time_limit_ms
+        self.deadline = None      # perf_counter() time the running search must stop at
+        self.nodes = 0            # Nodes visited by the last make_move
+        self.depth_reached = 0    # Deepest completed search of the last make_move
+        self.nodes_per_second = 0.0
+
+    def set_think_budget(self, milliseconds):
+        self.time_limit_ms = milliseconds
+
+    def make_move(self):
+        """
+        Returns the best (row, col, letter) found within the depth or time
+        limit; the time limit covers the whole call, lookups and move
+        ordering included
+        """
+        start = time.perf_counter()
+        board = self.game.board
+        if board.is_board_full():
+            return None
+
+        self.nodes = 0
+        move = self.lookup_move()
+        if move is not None:
+            self.depth_reached = 0
+            return move
+
+        moves = self.ordered_moves(shuffle=True)
+        results = self.search_moves(moves, start)
+        return results[-1][1] if results else moves[0][1:]
+
+    def search_moves(self, moves, start=None):
+        """
+        Search the given root (gain, row, col, letter) moves from the current
+        position. Returns (depth, best move, value) for the fixed depth, or
+        for every completed iteration when time_limit_ms is set
+        start: perf_counter() time the time limit counts from (default now)
+        """
+        if start is None:
+            start = time.perf_counter()
+        if self.time_limit_ms is None:
+            self.deadline = None
+            best_move, value = self._search_root(moves, self.depth)
+            results = [(self.depth, best_move, value)]
+        else:
+            self.deadline = start + self.time_limit_ms / 1000
+            results = self._iterative_deepening(moves)
+        self.depth_reached = results[-1][0] if results else 0
+
+        elapsed = time.perf_counter() - start
+        self.nodes_per_second = self.nodes / elapsed if elapsed > 0 else 0.0
+        return results
+
+    def _iterative_deepening(self, moves):
+        """Depth 1, 2, ... until the deadline; partial iterations are discarded"""
+        results = []
+        for depth in range(1, len(self.game.board.empty_cells) + 1):
+            try:
+                best_move, value = self._search_root(moves, depth)
+            except _SearchTimeout:
+                break
+            results.append((depth, best_move, value))
+            if value >= self.WIN_SCORE or time.perf_counter() >= self.deadline:
+                break
+            # Search the best move first next time, for earlier cutoffs
+            for index, move in enumerate(moves):
+                if move[1:] == best_move:
+                    moves.insert(0, moves.pop(index))
+                    break
+        return results
+
+    def _search_root(self, moves, depth):
+        """(best move, value) of a fixed-depth search over the root moves"""
+        best_move = moves[0][1:]
+        alpha = -float('inf')
+        beta = float('inf')
+
+        for gain, row, col, letter in moves:
+            if self.stop_requested:
+                if self.deadline is not None:
+                    raise _SearchTimeout()
+                break
+            value = self._search_move(row, col, letter, gain, depth, alpha, beta)
+            if value > alpha:
+                alpha = value
+                best_move = (row, col, letter)
+
+        return best_move, alpha
+
+    def ordered_moves(self, shuffle=False):
+        """
+        All (gain, row, col, letter) moves, best candidates first
+        gain is the number of SOS the move forms. With width set, only the
+        frontier is scored (every scoring cell is on it), or width random
+        cells while the board has no letters yet
+        """
+        board = self.game.board
+        if self.width is None:
+            cells = list(board.empty_cells)
+        elif len(board.frontier):
+            cells = list(board.frontier)
+        else:
+            cells = list({board.empty_cells.choice() for _ in range(self.width)})
+        if shuffle:
+            random.shuffle(cells)
+
+        moves = []
+        for row, col in cells:
+            near = board.has_neighbor(row, col)
+            for letter in ('S', 'O'):
+                gain = board.count_sos_for_move(row, col, letter)
+                moves.append((gain, near, row, col, letter))
+        moves.sort(key=lambda move: (move[0], move[1]), reverse=True)
+        if self.width is not None:
+            moves = moves[:self.width]
+        return [(gain, row, col, letter) for gain, near, row, col, letter in moves]
+
+    def _search_move(self, row, col, letter, gain, depth, alpha, beta):
+        """Value of playing a move for the side to move (negamax)"""
+        board = self.game.board
+        simple = self.game.game_mode == SOSGame.SIMPLE_MODE
+
+        if simple and gain:
+            # Forming an SOS ends a simple game; prefer quicker wins
+            return self.WIN_SCORE + depth
+
+        board.place_letter(row, col, letter)
+        try:
+            if gain:
+                # General mode: scorer keeps the turn
+                return gain + self._negamax(depth - 1, alpha - gain, beta - gain)
+            return -self._negamax(depth - 1, -beta, -alpha)
+        finally:
+            board.remove_letter(row, col)
+
+    def _negamax(self, depth, alpha, beta):
+        """Best achievable value for the side to move from here"""
+        self.nodes += 1
+        if self.deadline is not None and (self.stop_requested or
+                                          time.perf_counter() >= self.deadline):
+            raise _SearchTimeout()
+        board = self.game.board
+        if depth <= 0 or board.is_board_full():
+            return 0
+
+        table = self.table
+        hash_move = None
+        if table is not None:
+            key, transform = board.canonical_hash()
+            entry = table.probe(key)
+            if entry is not None:
+                key, entry_depth, value, flag, hash_move = entry
+                if entry_depth >= depth:
+                    if flag == TranspositionTable.EXACT:
+                        return value
+                    if flag == TranspositionTable.LOWER and value >= beta:
+                        return value
+                    if flag == TranspositionTable.UPPER and value <= alpha:
+                        return value
+
+        moves = self.ordered_moves()
+        if hash_move is not None:
+            # Try the stored best move first
+            hash_move = board.untransform_cell(hash_move[0], hash_move[1],
+                                               transform) + (hash_move[2],)
+            for index, move in enumerate(moves):
+                if move[1:] == hash_move:
+                    moves.insert(0, moves.pop(index))
+                    break
+
+        original_alpha = alpha
+        best = -float('inf')
+        best_move = None
+        for gain, row, col, letter in moves:
+            value = self._search_move(row, col, letter, gain, depth, alpha, beta)
+            if value > best:
+                best = value
+                best_move = (row, col, letter)
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break
+
+        if table is not None:
+            if best <= original_alpha:
+                flag = TranspositionTable.UPPER
+            elif best >= beta:
+                flag = TranspositionTable.LOWER
+            else:
+                flag = TranspositionTable.EXACT
+            row, col = board.transform_cell(best_move[0], best_move[1], transform)
+            table.store(key, depth, best, flag, (row, col, best_move[2]))
+        return best
+
+
+def _rebuild_game(mode, size, max_size, move_log):
+    """Fresh copy of a game in a worker process, replayed from its move log"""
+    GameBoard.max_size = max(GameBoard.max_size, max_size)
+    game = create_game(mode)
+    game.set_board_size(size)
+    game.set_players(HumanPlayer("Blue", "blue"), HumanPlayer("Red", "red"))
+    game.start_new_game()
+    for row, col, letter, scored in move_log:
+        game.make_move(row, col, letter)
+    return game
+
 
-        # Check for SOS
-        sequences = self.game.board.check_sos_at_position(row, col)
+# Seconds a parallel search waits past its time limit for results to arrive
+SEARCH_GRACE = 0.05
+
+_search_pool = None
+_search_pool_workers = 0
+_search_pool_lock = threading.Lock()
+
+
+def _search_pool_context():
+    """
+    Start method for search workers. The pool is often created from a
+    non-main thread (GUI worker, server executor) and forking a threaded
+    process can deadlock the child, so workers come from a forkserver
+    (preloading this module) or are spawned where there is none
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context('spawn')
 
-        # Restore original state
-        self.game.board.grid[row][col] = original
 
-        return len(sequences) > 0
+def search_pool(workers):
+    """
+    Process pool shared by every parallel search player, created on first
+    use and replaced by a larger one when a player asks for more workers.
+    One pool serves all games in the process, so players need no cleanup;
+    its processes exit with the interpreter
+    """
+    global _search_pool, _search_pool_workers
+    with _search_pool_lock:
+        if _search_pool is None or _search_pool_workers < workers:
+            _release_search_pool()
+            _search_pool = ProcessPoolExecutor(max_workers=workers,
+                                               mp_context=_search_pool_context())
+            _search_pool_workers = workers
+        return _search_pool
 
 
-def create_player(player_type, name, color, game=None):
+def discard_search_pool():
+    """
+    Stop handing work to the shared pool; the next search starts a fresh
+    one. Work already queued or running there (a running share cannot be
+    cancelled) finishes in the background, then its processes exit
+    """
+    with _search_pool_lock:
+        _release_search_pool()
+
+
+def _release_search_pool():
+    global _search_pool, _search_pool_workers
+    if _search_pool is not None:
+        _search_pool.shutdown(wait=False)
+        _search_pool = None
+        _search_pool_workers = 0
+
+
+def _in_worker_process():
+    """True inside a multiprocessing child (e.g. a tournament worker)"""
+    return multiprocessing.parent_process() is not None
+
+
+def _gather(futures, deadline, player):
+    """
+    Results of the futures that finish before deadline (perf_counter()
+    time, None for no limit) or player.request_stop(), in submit order.
+    Unfinished shares are cancelled; if any was already running, the
+    shared pool is discarded so the next search does not queue behind it
+    """
+    pending = set(futures)
+    while pending and not player.stop_requested:
+        timeout = 0.05
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.perf_counter())
+            if timeout <= 0:
+                break
+        done, pending = wait(pending, timeout=timeout)
+    running = [future for future in pending if not future.cancel()]
+    if running:
+        discard_search_pool()
+    return [future.result() for future in futures
+            if future.done() and not future.cancelled() and future.exception() is None]
+
+
+def _search_share(mode, size, max_size, move_log, moves, depth, width, time_limit_ms):
+    """
+    Process pool entry point for ParallelMinimaxComputerPlayer: search one
+    share of the root moves on a private board copy
+    Returns (MinimaxComputerPlayer.search_moves results, nodes)
+    """
+    game = _rebuild_game(mode, size, max_size, move_log)
+    searcher = MinimaxComputerPlayer("Searcher", "blue", game, depth=depth,
+                                     width=width, time_limit_ms=time_limit_ms)
+    results = searcher.search_moves(list(moves))
+    return results, searcher.nodes
+
+
+class ParallelMinimaxComputerPlayer(MinimaxComputerPlayer):
+    """
+    Minimax player that splits the root moves across worker processes
+    - Ordered root moves are dealt round-robin so every worker gets a mix
+      of strong and weak candidates
+    - Each worker rebuilds the game from move_log and searches its share
+      (to depth, or by iterative deepening within time_limit_ms)
+    - The move comes from the deepest depth every answering worker completed
+    - Workers come from the shared search_pool(); inside a worker process
+      (e.g. a tournament game) the search runs serially instead of
+      nesting pools
+    - There is no table option: a transposition table cannot be shared
+      with the worker processes, so shares search without one
+    """
+
+    def __init__(self, name, color, game, depth=2, width=None, time_limit_ms=None,
+                 workers=None):
+        super().__init__(name, color, game, depth, None, width, time_limit_ms)
+        self.workers = workers or os.cpu_count() or 1
+
+    def make_move(self):
+        if self.workers <= 1 or _in_worker_process():
+            return super().make_move()
+
+        start = time.perf_counter()
+        board = self.game.board
+        if board.is_board_full():
+            return None
+
+        self.nodes = 0
+        move = self.lookup_move()
+        if move is not None:
+            self.depth_reached = 0
+            return move
+
+        moves = self.ordered_moves(shuffle=True)
+        pool = search_pool(self.workers)
+        game = self.game
+        time_limit_ms = self.time_limit_ms
+        if time_limit_ms is not None:
+            # Workers get what is left after lookups and move ordering
+            time_limit_ms = max(0.0, time_limit_ms - (time.perf_counter() - start) * 1000)
+        futures = [pool.submit(_search_share, game.game_mode, game.board_size,
+                               GameBoard.max_size, list(game.move_log),
+                               moves[index::self.workers], self.depth,
+                               self.width, time_limit_ms)
+                   for index in range(min(self.workers, len(moves)))]
+        deadline = None
+        if self.time_limit_ms is not None:
+            deadline = start + self.time_limit_ms / 1000 + SEARCH_GRACE
+        answered = _gather(futures, deadline, self)
+
+        elapsed = time.perf_counter() - start
+        self.nodes = sum(nodes for results, nodes in answered)
+        self.nodes_per_second = self.nodes / elapsed if elapsed > 0 else 0.0
+        return self._combine([results for results, nodes in answered], moves)
+
+    def _combine(self, worker_results, moves):
+        """Best move at the deepest depth completed by every worker that answered"""
+        worker_results = [results for results in worker_results if results]
+        if not worker_results:
+            self.depth_reached = 0
+            return moves[0][1:]
+        depth = min(results[-1][0] for results in worker_results)
+        candidates = [entry for results in worker_results
+                      for entry in results if entry[0] == depth]
+        depth, best_move, value = max(candidates, key=lambda entry: entry[2])
+        self.depth_reached = depth
+        return best_move
+
+
+class _MCTSNode:
+    """Search tree node: the position reached by playing move"""
+
+    def __init__(self, move, parent, player, untried):
+        self.move = move          # (row, col, letter) leading here
+        self.parent = parent
+        self.player = player      # Player who made move
+        self.untried = untried    # Moves not yet expanded from here
+        self.children = []
+        self.visits = 0
+        self.wins = 0.0           # Results from player's point of view
+
+    def best_child(self, exploration):
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child:
+                   child.wins / child.visits +
+                   exploration * math.sqrt(log_visits / child.visits))
+
+
+class MCTSComputerPlayer(ComputerPlayer):
+    """
+    Computer player using Monte Carlo Tree Search (UCT)
+    - Each iteration selects down the tree, expands one move, plays a random
+      rollout to the end of the game and backs up the result
+    - Moves are played and undone in place with push_move/pop_move
+    - Stops at time_limit seconds or after iterations, whichever comes first;
+      a rollout still running at the deadline is abandoned; at least one
+      of the two limits is required
+    """
+
+    ROLLOUT_SAMPLES = 4  # Cells tried per rollout move when looking for an SOS
+
+    def __init__(self, name, color, game, time_limit=1.0, iterations=None,
+                 exploration=1.4, seed=None):
+        if time_limit is None and iterations is None:
+            raise ValueError("MCTS needs a time_limit or an iterations limit")
+        super().__init__(name, color, game)
+        self.time_limit = time_limit
+        self.max_iterations = iterations
+        self.exploration = exploration
+        # Without a seed, draw one from the module generator so random.seed()
+        # makes whole games reproducible
+        self.rng = random.Random(seed if seed is not None else random.getrandbits(64))
+        self.deadline = None              # perf_counter() time the running search must stop at
+        self.iterations = 0               # Iterations run by the last make_move
+        self.iterations_per_second = 0.0
+
+    def set_think_budget(self, milliseconds):
+        self.time_limit = milliseconds / 1000
+
+    def make_move(self):
+        """Returns the most visited root move after the search budget"""
+        start = time.perf_counter()
+        if self.game.board.is_board_full() or self.game.is_game_over():
+            return None
+
+        move = self.lookup_move()
+        if move is not None:
+            return move
+
+        root = self.search(start)
+        if not root.children:
+            # No iteration finished (iterations=0 or no time left)
+            return self.rng.choice(root.untried)
+        best = max(root.children, key=lambda child: child.visits)
+        return best.move
+
+    def search(self, start=None):
+        """
+        Run UCT iterations from the current position and return the root
+        start: perf_counter() time the time limit counts from (default now)
+        """
+        if start is None:
+            start = time.perf_counter()
+        root = _MCTSNode(None, None, None, self.legal_moves())
+        self.deadline = start + self.time_limit if self.time_limit is not None else None
+        self.iterations = 0
+
+        while True:
+            if self.max_iterations is not None and self.iterations >= self.max_iterations:
+                break
+            if self.out_of_time():
+                break
+            try:
+                self.run_iteration(root)
+            except _SearchTimeout:
+                break
+            self.iterations += 1
+
+        elapsed = time.perf_counter() - start
+        self.iterations_per_second = self.iterations / elapsed if elapsed > 0 else 0.0
+        return root
+
+    def out_of_time(self):
+        """True once the deadline has passed or a stop was requested"""
+        return self.stop_requested or \
+            self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def run_iteration(self, root):
+        """
+        One select / expand / rollout / backpropagate pass
+        Raises _SearchTimeout (with the game restored and nothing backed up)
+        if the rollout runs past the deadline
+        """
+        game = self.game
+        depth = len(game.undo_stack)
+        try:
+            self._iterate(root)
+        finally:
+            while len(game.undo_stack) > depth:
+                game.pop_move()
+
+    def _iterate(self, root):
+        """run_iteration without the undo: leaves its moves pushed"""
+        game = self.game
+        node = root
+
+        # Selection
+        while not node.untried and node.children:
+            node = node.best_child(self.exploration)
+            game.push_move(*node.move)
+
+        # Expansion
+        if node.untried and not game.is_game_over():
+            index = self.rng.randrange(len(node.untried))
+            move = node.untried[index]
+            node.untried[index] = node.untried[-1]
+            node.untried.pop()
+            mover = game.current_player
+            game.push_move(*move)
+            child = _MCTSNode(move, node, mover,
+                              [] if game.is_game_over() else self.legal_moves())
+            node.children.append(child)
+            node = child
+
+        # Rollout
+        self.rollout()
+        winner = game.winner
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if winner == "Draw":
+                node.wins += 0.5
+            elif winner is node.player:
+                node.wins += 1.0
+            node = node.parent
+
+    def rollout(self):
+        """
+        Play to the end of the game; returns moves pushed
+        Each move samples a few random cells and takes the first one that
+        forms an SOS, otherwise plays a random letter in a random cell.
+        Raises _SearchTimeout past the deadline or after request_stop
+        """
+        game = self.game
+        board = game.board
+        rng = self.rng
+        pushed = 0
+        while not game.game_over:
+            if self.out_of_time():
+                raise _SearchTimeout()
+            move = None
+            for _ in range(self.ROLLOUT_SAMPLES):
+                row, col = board.empty_cells.choice(rng)
+                if board.count_sos_for_move(row, col, 'S'):
+                    move = (row, col, 'S')
+                    break
+                if board.count_sos_for_move(row, col, 'O'):
+                    move = (row, col, 'O')
+                    break
+            if move is None:
+                row, col = board.empty_cells.choice(rng)
+                move = (row, col, 'S' if rng.random() < 0.5 else 'O')
+            game.push_move(*move)
+            pushed += 1
+        return pushed
+
+    def legal_moves(self):
+        """All (row, col, letter) moves from the current position"""
+        return [(row, col, letter) for row, col in self.game.board.empty_cells
+                for letter in ('S', 'O')]
+
+
+def _mcts_root_visits(mode, size, max_size, move_log, time_limit, iterations,
+                      exploration, seed):
+    """
+    Process pool entry point for ParallelMCTSComputerPlayer: grow one
+    independent tree on a private game copy
+    Returns ({move: root visit count}, iterations run)
+    """
+    game = _rebuild_game(mode, size, max_size, move_log)
+    searcher = MCTSComputerPlayer("Searcher", "blue", game, time_limit=time_limit,
+                                  iterations=iterations, exploration=exploration, seed=seed)
+    root = searcher.search()
+    return {child.move: child.visits for child in root.children}, searcher.iterations
+
+
+class ParallelMCTSComputerPlayer(MCTSComputerPlayer):
+    """
+    Root-parallel MCTS: every worker process grows its own tree from the
+    current position with a different seed, and the root visit counts of
+    all trees are summed to pick the move. No tree is shared, so workers
+    never lock; time_limit and iterations apply to each worker
+    - Workers come from the shared search_pool(); inside a worker process
+      the search runs serially instead of nesting pools
+    - With a time_limit, trees not returned SEARCH_GRACE after it are left
+      out of the vote. A share still running then keeps its process until
+      its own limit passes, so the pool is discarded and the next move
+      starts on fresh workers rather than queueing behind it
+    """
+
+    def __init__(self, name, color, game, time_limit=1.0, iterations=None,
+                 exploration=1.4, seed=None, workers=None):
+        super().__init__(name, color, game, time_limit, iterations, exploration, seed)
+        self.workers = workers or os.cpu_count() or 1
+        self.visits = {}  # Summed root visit counts of the last make_move
+
+    def make_move(self):
+        if self.workers <= 1 or _in_worker_process():
+            return super().make_move()
+
+        start = time.perf_counter()
+        if self.game.board.is_board_full() or self.game.is_game_over():
+            return None
+
+        move = self.lookup_move()
+        if move is not None:
+            return move
+
+        pool = search_pool(self.workers)
+        game = self.game
+        time_limit = self.time_limit
+        deadline = None
+        if time_limit is not None:
+            deadline = start + time_limit + SEARCH_GRACE
+            time_limit = max(0.0, time_limit - (time.perf_counter() - start))
+        futures = [pool.submit(_mcts_root_visits, game.game_mode, game.board_size,
+                               GameBoard.max_size, list(game.move_log),
+                               time_limit, self.max_iterations,
+                               self.exploration, self.rng.getrandbits(64))
+                   for _ in range(self.workers)]
+
+        self.visits = {}
+        self.iterations = 0
+        for visits, iterations in _gather(futures, deadline, self):
+            self.iterations += iterations
+            for move, count in visits.items():
+                self.visits[move] = self.visits.get(move, 0) + count
+        elapsed = time.perf_counter() - start
+        self.iterations_per_second = self.iterations / elapsed if elapsed > 0 else 0.0
+
+        if not self.visits:
+            # Stopped or out of time before any worker answered
+            return self.rng.choice(self.legal_moves())
+        return max(self.visits, key=self.visits.get)
+
+
+def create_player(player_type, name, color, game=None, **options):
     """
     Factory function to create player instances
-    player_type: "Human" or "Computer"
+    player_type: "Human" or a key of COMPUTER_PLAYER_TYPES
     name: Player name (e.g., "Blue", "Red")
     color: Player color ("blue" or "red")
-    game: Reference to game (required for ComputerPlayer)
+    game: Reference to game (required for computer players)
+    options: extra settings for search players (e.g. depth=3, time_limit=0.5)
     """
     if player_type == "Human":
         return HumanPlayer(name, color)
-    elif player_type == "Computer":
+    elif player_type in COMPUTER_PLAYER_TYPES:
         if game is None:
             raise ValueError("Computer player requires game reference")
-        return ComputerPlayer(name, color, game)
+        return COMPUTER_PLAYER_TYPES[player_type](name, color, game, **options)
     else:
         raise ValueError(f"Invalid player type: {player_type}")
 
 
+# Computer strategies selectable through create_player
+COMPUTER_PLAYER_TYPES = {
+    "Computer": ComputerPlayer,
+    "Minimax": MinimaxComputerPlayer,
+    "ParallelMinimax": ParallelMinimaxComputerPlayer,
+    "MCTS": MCTSComputerPlayer,
+    "ParallelMCTS": ParallelMCTSComputerPlayer,
+}
+
+
+class _NoPhaseTimer:
+    """Phase timer for moves nobody measures: every call is a no-op"""
+
+    __slots__ = ()
+
+    def lap(self, phase):
+        pass
+
+    def stop(self):
+        pass
+
+
+NO_PHASE_TIMER = _NoPhaseTimer()
+
+
 class SOSGame:
     """Base class for SOS game with Template Method pattern"""
 
     SIMPLE_MODE = "Simple"
     GENERAL_MODE = "General"
 
+    # Board implementation used by start_new_game (GameBoard or BitBoard)
+    board_class = GameBoard
+
+    # Optional phase timer (see instrumentation.Instrumentation.attach);
+    # when None moves run with NO_PHASE_TIMER
+    instrumentation = None
+
     def __init__(self):
         self.board = None
         self.board_size = 3
@@ -289,10 +1895,11 @@ class SOSGame:
         self.game_started = False
         self.game_over = False
         self.winner = None  # Can be blue_player, red_player, or "Draw"
+        self.undo_stack = []  # Entries recorded by push_move
+        self.move_log = []    # (row, col, letter, scored) for every move made
 
     def set_board_size(self, size):
-        if not GameBoard.is_valid_size(size):
-            raise ValueError("Board size must be between 3 and 10")
+        self.board_class.check_size(size)
         self.board_size = size
 
     def set_players(self, blue_player, red_player):
@@ -302,18 +1909,26 @@ class SOSGame:
 
     def start_new_game(self):
         """Initialize a new game - common for both modes"""
-        self.board = GameBoard(self.board_size)
+        self.board = self.board_class(self.board_size)
         self.current_player = self.blue_player
         self.blue_player.reset_score()
         self.red_player.reset_score()
         self.game_started = True
         self.game_over = False
         self.winner = None
+        self.undo_stack = []
+        self.move_log = []
 
     def make_move(self, row, col, letter):
         """
         Template Method for making a move Common flow
         """
+        if self.instrumentation is None:
+            self._make_move(row, col, letter)
+        else:
+            self._make_move(row, col, letter, self.instrumentation.phase_timer())
+
+    def check_move_allowed(self, row, col):
         if not self.game_started:
             raise RuntimeError("Game has not been started")
 
@@ -323,22 +1938,63 @@ class SOSGame:
         if not self.board.is_cell_empty(row, col):
             raise ValueError("Cell is already occupied")
 
+    def _make_move(self, row, col, letter, timer=NO_PHASE_TIMER):
+        """
+        The move flow; timer.lap(phase) closes each phase for the
+        instrumentation. Untimed moves (including push_move) keep the no-op
+        default timer
+        """
+        self.check_move_allowed(row, col)
+
         # Place the letter
         self.board.place_letter(row, col, letter)
+        timer.lap('placement')
 
         # Check for SOS sequences formed by this move
         sos_sequences = self.board.check_sos_at_position(row, col)
+        timer.lap('sos_detection')
 
         # Handle SOS sequences (different for Simple vs General)
         sos_found = len(sos_sequences) > 0
+        self.move_log.append((row, col, letter, sos_found))
         self.handle_sos_found(sos_found, sos_sequences)
+        timer.lap('handle_sos_found')
 
         # Check if game is over (different for Simple vs General)
         self.check_game_over()
+        timer.lap('check_game_over')
 
         # Switch turns if appropriate (different for Simple vs General)
         if not self.game_over:
             self.handle_turn_switch(sos_found)
+        timer.lap('turn_switch')
+        timer.stop()
+
+    def push_move(self, row, col, letter):
+        """
+        Make a move that can be taken back with pop_move
+        Records a compact undo entry: cell, both scores, current player,
+        game_over and winner
+        """
+        entry = (row, col, self.blue_player.score, self.red_player.score,
+                 self.current_player, self.game_over, self.winner)
+        # Search moves are covered by the ai_decision timing, not per phase
+        self._make_move(row, col, letter)
+        self.undo_stack.append(entry)
+
+    def pop_move(self):
+        """Undo the last push_move, restoring board, scores and turn"""
+        if not self.undo_stack:
+            raise RuntimeError("No move to undo")
+        row, col, blue_score, red_score, current_player, game_over, winner = \
+            self.undo_stack.pop()
+        self.board.remove_letter(row, col)
+        self.move_log.pop()
+        self.blue_player.score = blue_score
+        self.red_player.score = red_score
+        self.current_player = current_player
+        self.game_over = game_over
+        self.winner = winner
 
     def handle_sos_found(self, sos_found, sequences):
 
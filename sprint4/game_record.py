@@ -0,0 +1,279 @@
+"""
+Hashim Abdulla
+SOS Game Record Module - Sprint 4
+Compact binary format for finished games built from SOSGame.move_log
+
+A record file is a sequence of games. Each game is:
+- header: magic b'SOS1', version, board size, mode, has-seed flag,
+  seed (int64), player type name lengths, then the two UTF-8 names
+- move count (uint32)
+- one uint16 per move: cell index (row * size + col) in the low 14 bits,
+  bit 14 set for 'O', bit 15 set when the move formed an SOS
+
+An archive is a record file plus an index file (path + '.idx') holding
+one uint64 byte offset per game, so GameArchive can mmap both and jump
+straight to game k
+"""
+
+import mmap
+import os
+import struct
+
+from game_logic import create_game, create_player, SOSGame
+
+MAGIC = b'SOS1'
+VERSION = 1
+
+HEADER = struct.Struct('<4sBBBBqBB')
+COUNT = struct.Struct('<I')
+MOVE = struct.Struct('<H')
+OFFSET = struct.Struct('<Q')
+
+MODE_CODES = {SOSGame.SIMPLE_MODE: 0, SOSGame.GENERAL_MODE: 1}
+MODES = {code: mode for mode, code in MODE_CODES.items()}
+
+CELL_BITS = 0x3FFF
+O_BIT = 0x4000
+SCORED_BIT = 0x8000
+
+
+class GameRecord:
+    """One decoded game: settings plus (row, col, letter, scored) moves"""
+
+    def __init__(self, size, mode, blue_type, red_type, seed, moves):
+        self.size = size
+        self.mode = mode
+        self.blue_type = blue_type
+        self.red_type = red_type
+        self.seed = seed
+        self.moves = moves
+
+    def replay(self):
+        """
+        Rebuild the game with create_game and play every move again
+        Raises ValueError if a move's scoring flag does not match
+        """
+        game = create_game(self.mode)
+        game.set_board_size(self.size)
+        game.set_players(create_player("Human", "Blue", "blue"),
+                         create_player("Human", "Red", "red"))
+        game.start_new_game()
+        for row, col, letter, scored in self.moves:
+            game.make_move(row, col, letter)
+            if game.move_log[-1][3] != scored:
+                raise ValueError("Record does not match replay")
+        return game
+
+
+def encode_move(size, row, col, letter, scored):
+    value = row * size + col
+    if value > CELL_BITS:
+        raise ValueError("Board too large for the record format")
+    if letter == 'O':
+        value |= O_BIT
+    if scored:
+        value |= SCORED_BIT
+    return value
+
+
+def decode_move(size, value):
+    index = value & CELL_BITS
+    letter = 'O' if value & O_BIT else 'S'
+    return index // size, index % size, letter, bool(value & SCORED_BIT)
+
+
+def encode_moves(size, moves):
+    """Pack (row, col, letter, scored) moves into bytes"""
+    count = len(moves)
+    values = [encode_move(size, *move) for move in moves]
+    return struct.pack('<%dH' % count, *values)
+
+
+def decode_moves(size, data):
+    """Unpack bytes (or a memoryview) produced by encode_moves"""
+    count = len(data) // MOVE.size
+    return [decode_move(size, value) for value in struct.unpack('<%dH' % count, data)]
+
+
+def encode_header(size, mode, blue_type, red_type, seed=None):
+    blue = blue_type.encode('utf-8')
+    red = red_type.encode('utf-8')
+    return HEADER.pack(MAGIC, VERSION, size, MODE_CODES[mode],
+                       seed is not None, seed or 0, len(blue), len(red)) + blue + red
+
+
+def encode_game(game, blue_type, red_type, seed=None):
+    """Full binary record for a game's move log"""
+    return (encode_header(game.board_size, game.game_mode, blue_type, red_type, seed) +
+            COUNT.pack(len(game.move_log)) +
+            encode_moves(game.board_size, game.move_log))
+
+
+class GameRecordWriter:
+    """Streaming appender: each write_game adds one record to the file"""
+
+    def __init__(self, path):
+        self.file = open(path, 'ab')
+        self.games_written = 0
+
+    def write_game(self, game, blue_type, red_type, seed=None):
+        self.file.write(encode_game(game, blue_type, red_type, seed))
+        self.games_written += 1
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _read_exact(stream, count):
+    data = stream.read(count)
+    if len(data) != count:
+        raise ValueError("Truncated game record")
+    return data
+
+
+def read_game_header(stream):
+    """
+    Read one header and move count from a binary stream
+    Returns (size, mode, blue_type, red_type, seed, move_count) or None at end of file
+    """
+    data = stream.read(HEADER.size)
+    if not data:
+        return None
+    if len(data) != HEADER.size:
+        raise ValueError("Truncated game record")
+    magic, version, size, mode, has_seed, seed, blue_len, red_len = HEADER.unpack(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not an SOS game record")
+    blue_type = _read_exact(stream, blue_len).decode('utf-8')
+    red_type = _read_exact(stream, red_len).decode('utf-8')
+    move_count = COUNT.unpack(_read_exact(stream, COUNT.size))[0]
+    return size, MODES[mode], blue_type, red_type, seed if has_seed else None, move_count
+
+
+def iter_records(stream):
+    """Generator of GameRecord objects from an open binary stream"""
+    while True:
+        header = read_game_header(stream)
+        if header is None:
+            return
+        size, mode, blue_type, red_type, seed, move_count = header
+        moves = decode_moves(size, _read_exact(stream, move_count * MOVE.size))
+        yield GameRecord(size, mode, blue_type, red_type, seed, moves)
+
+
+def read_games(path):
+    """Generator of GameRecord objects from a record file"""
+    with open(path, 'rb') as stream:
+        yield from iter_records(stream)
+
+
+def index_path(path):
+    return str(path) + '.idx'
+
+
+class GameArchiveWriter:
+    """Appends game records to an archive and their offsets to its index"""
+
+    def __init__(self, path):
+        self.data = open(path, 'ab')
+        self.index = open(index_path(path), 'ab')
+        self.data.seek(0, os.SEEK_END)
+        self.offset = self.data.tell()
+
+    def write_game(self, game, blue_type, red_type, seed=None):
+        record = encode_game(game, blue_type, red_type, seed)
+        self.data.write(record)
+        self.index.write(OFFSET.pack(self.offset))
+        self.offset += len(record)
+
+    def close(self):
+        self.data.close()
+        self.index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class GameArchive:
+    """
+    Random access to an archive through mmap
+    Game k is located through the index without reading earlier games;
+    move_bytes(k) is a memoryview into the mapped file (no copy)
+    """
+
+    def __init__(self, path):
+        self.data_file = open(path, 'rb')
+        self.index_file = open(index_path(path), 'rb')
+        self.data = self._map(self.data_file)
+        self.index = self._map(self.index_file)
+        self.count = len(self.index) // OFFSET.size
+
+    @staticmethod
+    def _map(file):
+        if os.fstat(file.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        return self.count
+
+    def offset(self, k):
+        if not 0 <= k < self.count:
+            raise IndexError("Game index out of range")
+        return OFFSET.unpack_from(self.index, k * OFFSET.size)[0]
+
+    def header(self, k):
+        """(size, mode, blue_type, red_type, seed, move_count, moves_offset) of game k"""
+        position = self.offset(k)
+        magic, version, size, mode, has_seed, seed, blue_len, red_len = \
+            HEADER.unpack_from(self.data, position)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not an SOS game record")
+        position += HEADER.size
+        blue_type = bytes(self.data[position:position + blue_len]).decode('utf-8')
+        position += blue_len
+        red_type = bytes(self.data[position:position + red_len]).decode('utf-8')
+        position += red_len
+        move_count = COUNT.unpack_from(self.data, position)[0]
+        position += COUNT.size
+        return (size, MODES[mode], blue_type, red_type,
+                seed if has_seed else None, move_count, position)
+
+    def move_bytes(self, k):
+        """Packed moves of game k as a zero-copy memoryview"""
+        header = self.header(k)
+        move_count, start = header[5], header[6]
+        return memoryview(self.data)[start:start + move_count * MOVE.size]
+
+    def game(self, k):
+        """Decode game k into a GameRecord"""
+        size, mode, blue_type, red_type, seed, move_count, start = self.header(k)
+        moves = decode_moves(size, self.move_bytes(k))
+        return GameRecord(size, mode, blue_type, red_type, seed, moves)
+
+    def close(self):
+        """Release the maps; memoryviews from move_bytes must be released first"""
+        for mapped in (self.data, self.index):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+        self.data_file.close()
+        self.index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
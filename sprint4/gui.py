@@ -1,29 +1,55 @@
 """
 Hashim Abdulla
 SOS Game GUI Module - Sprint 4
-Extended with player type selection (Human/Computer) and automated computer moves
+Extended with player type selection (Human, greedy Computer, Minimax or MCTS
+search) and automated computer moves
+Computer decisions run on a worker thread so the window stays responsive
+Large boards scroll inside a fixed viewport and can be zoomed (Ctrl+wheel or +/-)
 """
 
+import argparse
+import queue
+import threading
+import time
 import tkinter as tk
 from tkinter import messagebox
-from game_logic import create_game, create_player, SOSGame
+from game_logic import create_game, create_player, GameBoard, SOSGame
 
 
 class SOSGUI:
     """Main GUI class for SOS Game"""
 
-    def __init__(self, root):
+    POLL_MS = 30  # How often the Tk loop checks for a finished computer move
+    MAX_CELL_SIZE = 60  # Cell size in pixels for small boards
+    MAX_BOARD_PIXELS = 600  # Larger boards shrink their cells to fit this
+    MIN_CELL_SIZE = 12  # Below this the board scrolls instead of shrinking
+    ZOOM_STEP = 1.25
+    THINK_MS = 500  # Default time a computer move takes, search included
+    # (value, label) of the player types offered for each side
+    PLAYER_TYPES = (('Human', "Human"), ('Computer', "Computer"),
+                    ('Minimax', "Minimax search"), ('MCTS', "MCTS search"))
+
+    def __init__(self, root, think_ms=THINK_MS):
         self.root = root
         self.root.title("SOS Game - Hashim Abdulla")
         self.game = None  # Will be created when game starts
+        self.think_ms = think_ms
 
         # GUI state
-        self.board_buttons = []
+        self.board_size = 3
+        self.cell_size = self.MAX_CELL_SIZE
         self.blue_letter_var = tk.StringVar(value='S')
         self.red_letter_var = tk.StringVar(value='S')
         self.blue_player_type_var = tk.StringVar(value='Human')
         self.red_player_type_var = tk.StringVar(value='Human')
-        self.sos_lines = []  # Store drawn SOS lines for visualization
+        self.sos_lines = []  # Canvas line items drawn over completed SOS
+        self.drawn_moves = []  # (row, col, letter, color, sequences) to redraw on zoom
+
+        # Background computer moves
+        self.computer_results = queue.Queue()  # (job, move) from worker threads
+        self.computer_job = 0  # Bumped to discard results of cancelled searches
+        self.thinking_player = None  # Computer player currently searching
+        self.think_started = 0.0  # perf_counter() when the current search began
 
         self.create_widgets()
 
@@ -59,10 +85,17 @@ class SOSGUI:
 
         tk.Label(size_frame, text="Board size:").pack(side=tk.LEFT, padx=5)
         self.size_var = tk.StringVar(value='3')
-        size_spinbox = tk.Spinbox(size_frame, from_=3, to=10, width=5,
+        size_spinbox = tk.Spinbox(size_frame, from_=GameBoard.MIN_SIZE,
+                                  to=GameBoard.max_size, width=5,
                                   textvariable=self.size_var)
         size_spinbox.pack(side=tk.LEFT, padx=5)
 
+        tk.Label(size_frame, text="Think time (ms):").pack(side=tk.LEFT, padx=5)
+        self.think_var = tk.StringVar(value=str(self.think_ms))
+        think_spinbox = tk.Spinbox(size_frame, from_=0, to=60000, increment=100,
+                                   width=6, textvariable=self.think_var)
+        think_spinbox.pack(side=tk.LEFT, padx=5)
+
         # New Game button
         new_game_btn = tk.Button(top_frame, text="New Game",
                                  command=self.start_new_game,
@@ -81,15 +114,7 @@ class SOSGUI:
                  font=('Arial', 14, 'bold')).pack(pady=10)
 
         # Blue player type selection
-        blue_human_radio = tk.Radiobutton(left_panel, text="Human",
-                                          variable=self.blue_player_type_var,
-                                          value='Human', font=('Arial', 11))
-        blue_human_radio.pack(anchor='w')
-
-        blue_computer_radio = tk.Radiobutton(left_panel, text="Computer",
-                                             variable=self.blue_player_type_var,
-                                             value='Computer', font=('Arial', 11))
-        blue_computer_radio.pack(anchor='w', pady=(0, 10))
+        self.create_player_type_radios(left_panel, self.blue_player_type_var)
 
         # Blue letter selection
         blue_s = tk.Radiobutton(left_panel, text="S", variable=self.blue_letter_var,
@@ -105,9 +130,32 @@ class SOSGUI:
                                          fg='blue', font=('Arial', 12))
         self.blue_score_label.pack(pady=10)
 
-        # Center - Board
-        self.board_frame = tk.Frame(game_frame, bg='white')
-        self.board_frame.grid(row=0, column=1, padx=20)
+        # Center - Board, scrollable when it outgrows the viewport
+        board_frame = tk.Frame(game_frame)
+        board_frame.grid(row=0, column=1, padx=20)
+        self.board_canvas = tk.Canvas(board_frame, bg='white', highlightthickness=0)
+        x_scroll = tk.Scrollbar(board_frame, orient=tk.HORIZONTAL,
+                                command=self.board_canvas.xview)
+        y_scroll = tk.Scrollbar(board_frame, orient=tk.VERTICAL,
+                                command=self.board_canvas.yview)
+        self.board_canvas.config(xscrollcommand=x_scroll.set,
+                                 yscrollcommand=y_scroll.set)
+        self.board_canvas.grid(row=0, column=0)
+        y_scroll.grid(row=0, column=1, sticky='ns')
+        x_scroll.grid(row=1, column=0, sticky='ew')
+        self.board_canvas.bind('<Button-1>', self.on_canvas_click)
+        self.board_canvas.bind('<Control-MouseWheel>',
+                               lambda e: self.zoom(self.ZOOM_STEP if e.delta > 0
+                                                   else 1 / self.ZOOM_STEP))
+        self.board_canvas.bind('<Control-Button-4>', lambda e: self.zoom(self.ZOOM_STEP))
+        self.board_canvas.bind('<Control-Button-5>', lambda e: self.zoom(1 / self.ZOOM_STEP))
+
+        zoom_frame = tk.Frame(board_frame)
+        zoom_frame.grid(row=2, column=0, pady=5)
+        tk.Button(zoom_frame, text="-", width=3,
+                  command=lambda: self.zoom(1 / self.ZOOM_STEP)).pack(side=tk.LEFT, padx=2)
+        tk.Button(zoom_frame, text="+", width=3,
+                  command=lambda: self.zoom(self.ZOOM_STEP)).pack(side=tk.LEFT, padx=2)
 
         # Right panel - Red player
         right_panel = tk.Frame(game_frame, width=150)
@@ -117,15 +165,7 @@ class SOSGUI:
                  font=('Arial', 14, 'bold')).pack(pady=10)
 
         # Red player type selection
-        red_human_radio = tk.Radiobutton(right_panel, text="Human",
-                                         variable=self.red_player_type_var,
-                                         value='Human', font=('Arial', 11))
-        red_human_radio.pack(anchor='w')
-
-        red_computer_radio = tk.Radiobutton(right_panel, text="Computer",
-                                            variable=self.red_player_type_var,
-                                            value='Computer', font=('Arial', 11))
-        red_computer_radio.pack(anchor='w', pady=(0, 10))
+        self.create_player_type_radios(right_panel, self.red_player_type_var)
 
         # Red letter selection
         red_s = tk.Radiobutton(right_panel, text="S", variable=self.red_letter_var,
@@ -149,18 +189,39 @@ class SOSGUI:
         # Create initial board
         self.create_board_display(3)
 
+    def create_player_type_radios(self, panel, variable):
+        """One radio button per entry of PLAYER_TYPES"""
+        for index, (value, label) in enumerate(self.PLAYER_TYPES):
+            radio = tk.Radiobutton(panel, text=label, variable=variable,
+                                   value=value, font=('Arial', 11))
+            last = index == len(self.PLAYER_TYPES) - 1
+            radio.pack(anchor='w', pady=(0, 10) if last else 0)
+
     def validate_board_size(self):
         """Validate the board size input"""
+        low, high = GameBoard.MIN_SIZE, GameBoard.max_size
         try:
             size = int(self.size_var.get())
-            if not (3 <= size <= 10):
+            if not GameBoard.is_valid_size(size):
                 messagebox.showerror("Invalid Input",
-                                     "Board size must be between 3 and 10")
+                                     f"Board size must be between {low} and {high}")
                 return None
             return size
         except ValueError:
             messagebox.showerror("Invalid Input",
-                                 "Board size must be a number between 3 and 10")
+                                 f"Board size must be a number between {low} and {high}")
+            return None
+
+    def validate_think_time(self):
+        """Validate the think time input (milliseconds, 0 or more)"""
+        try:
+            think_ms = int(self.think_var.get())
+            if think_ms < 0:
+                raise ValueError
+            return think_ms
+        except ValueError:
+            messagebox.showerror("Invalid Input",
+                                 "Think time must be a whole number of milliseconds")
             return None
 
     def start_new_game(self):
@@ -169,6 +230,13 @@ class SOSGUI:
         size = self.validate_board_size()
         if size is None:
             return
+        think_ms = self.validate_think_time()
+        if think_ms is None:
+            return
+        self.think_ms = think_ms
+
+        # Drop any search still running for the previous game
+        self.cancel_computer_move()
 
         try:
             # Create game instance
@@ -183,6 +251,10 @@ class SOSGUI:
             blue_player = create_player(blue_type, "Blue", "blue", self.game)
             red_player = create_player(red_type, "Red", "red", self.game)
 
+            for player in (blue_player, red_player):
+                if not player.is_human():
+                    player.set_think_budget(self.think_ms)
+
             self.game.set_players(blue_player, red_player)
             self.game.start_new_game()
 
@@ -196,8 +268,8 @@ class SOSGUI:
         self.update_scores()
 
         mode_text = self.game.game_mode
-        blue_type_text = "Human" if blue_player.is_human() else "Computer"
-        red_type_text = "Human" if red_player.is_human() else "Computer"
+        blue_type_text = dict(self.PLAYER_TYPES)[blue_type]
+        red_type_text = dict(self.PLAYER_TYPES)[red_type]
 
         messagebox.showinfo("New Game",
                             f"New {mode_text} game started!\n"
@@ -210,24 +282,79 @@ class SOSGUI:
             self.schedule_computer_move()
 
     def create_board_display(self, size):
-        """Create the board grid of buttons"""
-        # Clear existing board
-        for widget in self.board_frame.winfo_children():
-            widget.destroy()
-
-        self.board_buttons = []
-
-        for row in range(size):
-            button_row = []
-            for col in range(size):
-                btn = tk.Button(self.board_frame, text=' ',
-                                width=4, height=2,
-                                font=('Arial', 18, 'bold'),
-                                bg='white',
-                                command=lambda r=row, c=col: self.on_cell_click(r, c))
-                btn.grid(row=row, column=col, padx=2, pady=2)
-                button_row.append(btn)
-            self.board_buttons.append(button_row)
+        """Draw an empty size x size grid on the board canvas"""
+        self.board_size = size
+        self.drawn_moves = []
+        self.cell_size = max(self.MIN_CELL_SIZE,
+                             min(self.MAX_CELL_SIZE, self.MAX_BOARD_PIXELS // size))
+        self.redraw_board()
+
+    def redraw_board(self):
+        """Draw the grid and every placed move at the current cell size"""
+        canvas = self.board_canvas
+        canvas.delete('all')
+        self.sos_lines = []
+
+        size = self.board_size
+        pixels = size * self.cell_size
+        # The viewport stays at most MAX_BOARD_PIXELS; the rest scrolls
+        view = min(pixels, self.MAX_BOARD_PIXELS) + 1
+        canvas.config(width=view, height=view, scrollregion=(0, 0, pixels + 1, pixels + 1))
+        for i in range(size + 1):
+            offset = i * self.cell_size
+            canvas.create_line(0, offset, pixels, offset, fill='gray')
+            canvas.create_line(offset, 0, offset, pixels, fill='gray')
+
+        for move in self.drawn_moves:
+            self.render_move(*move)
+
+    def zoom(self, factor):
+        """Scale the cells by factor and redraw from the stored moves"""
+        cell_size = int(round(self.cell_size * factor))
+        if cell_size == self.cell_size:
+            cell_size += 1 if factor > 1 else -1
+        cell_size = max(self.MIN_CELL_SIZE, min(2 * self.MAX_CELL_SIZE, cell_size))
+        if cell_size != self.cell_size:
+            self.cell_size = cell_size
+            self.redraw_board()
+
+    def cell_at(self, x, y):
+        """Map canvas pixel coordinates to (row, col), or None outside the grid"""
+        row = int(y // self.cell_size)
+        col = int(x // self.cell_size)
+        if 0 <= row < self.board_size and 0 <= col < self.board_size:
+            return row, col
+        return None
+
+    def cell_center(self, row, col):
+        half = self.cell_size / 2
+        return col * self.cell_size + half, row * self.cell_size + half
+
+    def on_canvas_click(self, event):
+        """Translate a canvas click into a cell click"""
+        cell = self.cell_at(self.board_canvas.canvasx(event.x),
+                            self.board_canvas.canvasy(event.y))
+        if cell is not None:
+            self.on_cell_click(*cell)
+
+    def draw_move(self, row, col, letter, color):
+        """Draw a placed letter and a line over every SOS it completed"""
+        sequences = self.game.board.check_sos_at_position(row, col)
+        self.drawn_moves.append((row, col, letter, color, sequences))
+        self.render_move(row, col, letter, color, sequences)
+
+    def render_move(self, row, col, letter, color, sequences):
+        x, y = self.cell_center(row, col)
+        font_size = max(6, int(self.cell_size * 0.45))
+        self.board_canvas.create_text(x, y, text=letter, fill=color,
+                                      font=('Arial', font_size, 'bold'))
+
+        for sequence in sequences:
+            x1, y1 = self.cell_center(*sequence[0])
+            x2, y2 = self.cell_center(*sequence[-1])
+            line = self.board_canvas.create_line(x1, y1, x2, y2, fill=color,
+                                                 width=max(1, self.cell_size // 15))
+            self.sos_lines.append(line)
 
     def on_cell_click(self, row, col):
         """Handle cell click event - only for human players"""
@@ -236,6 +363,13 @@ class SOSGUI:
                                    "Please start a new game first")
             return
 
+        # A running search plays moves on the game (game_over can flicker),
+        # so check the flag before reading any game state
+        if self.thinking_player is not None:
+            messagebox.showinfo("Computer Turn",
+                                "It's the computer's turn. Please wait.")
+            return
+
         if self.game.is_game_over():
             messagebox.showinfo("Game Over",
                                 "Game has ended. Start a new game to play again.")
@@ -258,12 +392,8 @@ class SOSGUI:
         try:
             self.game.make_move(row, col, letter)
 
-            # Update the button display
-            self.board_buttons[row][col].config(
-                text=letter,
-                fg=current_player.color,
-                state='disabled'
-            )
+            # Draw the letter and any SOS lines
+            self.draw_move(row, col, letter, current_player.color)
 
             # Update scores
             self.update_scores()
@@ -285,14 +415,13 @@ class SOSGUI:
             messagebox.showerror("Error", str(e))
 
     def schedule_computer_move(self):
-        """Schedule computer move with delay for visual smoothness"""
+        """Start the computer move once Tk is idle; it lands after think_ms"""
         if self.game and not self.game.is_game_over():
-            # 500ms delay to make moves visible
-            self.root.after(500, self.execute_computer_move)
+            self.root.after_idle(self.execute_computer_move)
 
     def execute_computer_move(self):
-        """Execute computer player's move"""
-        if self.game is None or self.game.is_game_over():
+        """Start the computer player's decision on a worker thread"""
+        if self.game is None or self.game.is_game_over() or self.thinking_player:
             return
 
         current_player = self.game.get_current_player()
@@ -301,8 +430,69 @@ class SOSGUI:
         if current_player.is_human():
             return
 
-        # Get computer's move decision
-        move = current_player.make_move()
+        self.thinking_player = current_player
+        self.think_started = time.perf_counter()
+        self.turn_label.config(
+            text=f"Current turn: {current_player.name.lower()} (Computer) - thinking...",
+            fg=current_player.color
+        )
+
+        job = self.computer_job
+        current_player.clear_stop()
+        worker = threading.Thread(target=self.computer_worker,
+                                  args=(job, current_player), daemon=True)
+        worker.start()
+        self.root.after(self.POLL_MS, self.poll_computer_move)
+
+    def computer_worker(self, job, player):
+        """Worker thread: run the search and hand the result to the Tk thread"""
+        try:
+            move = player.make_move()
+        except Exception as e:
+            move = e
+        self.computer_results.put((job, move))
+
+    def poll_computer_move(self):
+        """Tk thread: apply the computer move once the worker has finished"""
+        while True:
+            try:
+                job, move = self.computer_results.get_nowait()
+            except queue.Empty:
+                break
+            if job == self.computer_job:
+                # Fast decisions still take the full think budget, so every
+                # computer move lands at the same predictable pace
+                elapsed_ms = (time.perf_counter() - self.think_started) * 1000
+                remaining_ms = int(self.think_ms - elapsed_ms)
+                if remaining_ms > 0:
+                    self.root.after(remaining_ms, self.apply_computer_move, job, move)
+                else:
+                    self.finish_computer_move(move)
+                return
+
+        if self.thinking_player is not None:
+            self.root.after(self.POLL_MS, self.poll_computer_move)
+
+    def apply_computer_move(self, job, move):
+        """Delayed finish_computer_move, skipped if the search was cancelled"""
+        if job == self.computer_job:
+            self.finish_computer_move(move)
+
+    def cancel_computer_move(self):
+        """Stop waiting for the running search and discard its result"""
+        self.computer_job += 1
+        if self.thinking_player is not None:
+            self.thinking_player.request_stop()
+            self.thinking_player = None
+
+    def finish_computer_move(self, move):
+        """Apply a finished computer decision to the game and the board"""
+        current_player = self.thinking_player
+        self.thinking_player = None
+
+        if isinstance(move, Exception):
+            messagebox.showerror("Error", f"Computer move failed: {str(move)}")
+            return
 
         if move is None:
             # No valid moves (shouldn't happen, but handle gracefully)
@@ -315,12 +505,8 @@ class SOSGUI:
             # Make the move
             self.game.make_move(row, col, letter)
 
-            # Update the button display
-            self.board_buttons[row][col].config(
-                text=letter,
-                fg=current_player.color,
-                state='disabled'
-            )
+            # Draw the letter and any SOS lines
+            self.draw_move(row, col, letter, current_player.color)
 
             # Update scores
             self.update_scores()
@@ -384,10 +570,19 @@ class SOSGUI:
         messagebox.showinfo("Game Over", message)
 
 
-def main():
+def main(argv=None):
     """Main entry point for the application"""
+    parser = argparse.ArgumentParser(description="SOS game")
+    parser.add_argument("--max-size", type=int, default=None,
+                        help="raise the board size limit (default 10)")
+    parser.add_argument("--think-ms", type=int, default=SOSGUI.THINK_MS,
+                        help="time each computer move takes in milliseconds")
+    args = parser.parse_args(argv)
+    if args.max_size is not None:
+        GameBoard.max_size = args.max_size
+
     root = tk.Tk()
-    app = SOSGUI(root)
+    app = SOSGUI(root, think_ms=args.think_ms)
     root.mainloop()
 
 
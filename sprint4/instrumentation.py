@@ -0,0 +1,197 @@
+"""
+Hashim Abdulla
+SOS Instrumentation Module - Sprint 4
+Opt-in per-phase latency histograms for SOSGame.make_move and computer
+player decisions, written to a pluggable sink
+
+Phases: placement, sos_detection, handle_sos_found, check_game_over,
+turn_switch, make_move (whole move) and ai_decision (ComputerPlayer.make_move)
+
+Usage:
+    metrics = Instrumentation(PrometheusSink("sos.prom"))
+    metrics.attach(game)   # after game.set_players(...)
+    ...
+    metrics.flush()
+A game without attached instrumentation runs the same move flow with a
+no-op phase timer (game_logic.NO_PHASE_TIMER)
+"""
+
+import bisect
+import json
+import time
+
+# Upper bucket bounds in seconds (1us .. 1s, 1-2-5 steps); larger values
+# land in the overflow (+Inf) bucket
+BUCKET_BOUNDS = tuple(float(f"{base}e{exponent}") for exponent in range(-6, 0)
+                      for base in (1, 2, 5)) + (1.0,)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram: count, sum, max and bucket counts"""
+
+    def __init__(self, bounds=BUCKET_BOUNDS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, fraction):
+        """Upper bound of the bucket holding the given quantile (max for +Inf)"""
+        if self.count == 0:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+            "p50": self.quantile(0.50),
+            "p99": self.quantile(0.99),
+            "buckets": list(self.counts),
+        }
+
+
+class PhaseTimer:
+    """Records the time since the previous lap under each phase name"""
+
+    __slots__ = ('record', 'start', 'last')
+
+    def __init__(self, record):
+        self.record = record
+        self.start = self.last = time.perf_counter()
+
+    def lap(self, phase):
+        now = time.perf_counter()
+        self.record(phase, now - self.last)
+        self.last = now
+
+    def stop(self):
+        """Record the whole move as the make_move phase"""
+        self.record('make_move', self.last - self.start)
+
+
+class Instrumentation:
+    """Phase name -> Histogram, flushed to a sink on demand"""
+
+    def __init__(self, sink=None):
+        self.sink = sink
+        self.histograms = {}
+
+    def record(self, phase, seconds):
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            histogram = self.histograms[phase] = Histogram()
+        histogram.record(seconds)
+
+    def phase_timer(self):
+        """Timer for one SOSGame move (see SOSGame._make_move)"""
+        return PhaseTimer(self.record)
+
+    def attach(self, game):
+        """
+        Time every make_move of game, and the decisions of its computer
+        players (call after set_players)
+        """
+        game.instrumentation = self
+        for player in (game.blue_player, game.red_player):
+            if player is not None and not player.is_human():
+                self.attach_player(player)
+
+    def attach_player(self, player):
+        """Wrap one computer player's make_move with an ai_decision timer"""
+        decide = type(player).make_move.__get__(player)
+
+        def timed_make_move():
+            start = time.perf_counter()
+            try:
+                return decide()
+            finally:
+                self.record('ai_decision', time.perf_counter() - start)
+        player.make_move = timed_make_move
+
+    @staticmethod
+    def detach(game):
+        game.instrumentation = None
+        for player in (game.blue_player, game.red_player):
+            if player is not None:
+                player.__dict__.pop('make_move', None)
+
+    def snapshot(self):
+        return {phase: histogram.snapshot()
+                for phase, histogram in sorted(self.histograms.items())}
+
+    def flush(self):
+        """Hand the current snapshot to the sink (if any) and return it"""
+        snapshot = self.snapshot()
+        if self.sink is not None:
+            self.sink.write(snapshot)
+        return snapshot
+
+    def reset(self):
+        self.histograms = {}
+
+
+class MemorySink:
+    """Keeps every flushed snapshot in a list"""
+
+    def __init__(self):
+        self.snapshots = []
+
+    def write(self, snapshot):
+        self.snapshots.append(snapshot)
+
+
+class JsonLinesSink:
+    """Appends one JSON line per flush: {"time": ..., "phases": {...}}"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, snapshot):
+        with open(self.path, 'a') as f:
+            f.write(json.dumps({"time": time.time(), "phases": snapshot}) + "\n")
+
+
+class PrometheusSink:
+    """
+    Rewrites a Prometheus text-format file on each flush, for the node
+    exporter textfile collector or any scraper that reads files
+    """
+
+    METRIC = "sos_phase_duration_seconds"
+
+    def __init__(self, path, bounds=BUCKET_BOUNDS):
+        self.path = path
+        self.bounds = bounds
+
+    def format(self, snapshot):
+        lines = [f"# HELP {self.METRIC} Duration of SOS move phases",
+                 f"# TYPE {self.METRIC} histogram"]
+        for phase, data in snapshot.items():
+            cumulative = 0
+            for bound, count in zip(self.bounds + (float('inf'),), data["buckets"]):
+                cumulative += count
+                le = "+Inf" if bound == float('inf') else repr(bound)
+                lines.append(f'{self.METRIC}_bucket{{phase="{phase}",le="{le}"}} {cumulative}')
+            lines.append(f'{self.METRIC}_sum{{phase="{phase}"}} {data["sum"]!r}')
+            lines.append(f'{self.METRIC}_count{{phase="{phase}"}} {data["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, snapshot):
+        with open(self.path, 'w') as f:
+            f.write(self.format(snapshot))
@@ -0,0 +1,195 @@
+"""
+Hashim Abdulla
+SOS Opening Book Module - Sprint 4
+Win statistics for the first moves of self-played games, keyed by
+canonical position hash, so ComputerPlayer can skip searching openings
+
+Each book covers one board size and mode and the first `plies` moves of
+a game. Positions are stored through GameBoard.canonical_hash() and moves
+in canonical coordinates, so the 8 symmetric versions of an opening share
+statistics. Points are counted from the mover's side: 2 for a win, 1 for
+a draw, 0 for a loss
+
+A book file is a header (magic b'SOSB', version, size, mode, plies, count)
+followed by count entries of (hash uint64, move uint16, games uint32,
+points uint32). Moves use the game_record encoding (cell index, O bit)
+
+Usage (from the sprint4 folder):
+    python -m opening_book --size 5 --mode General --games 2000 --out book5g.bin
+    python -m opening_book --size 5 --mode General --records games.sos --out book5g.bin
+"""
+
+import argparse
+import struct
+import sys
+
+from game_logic import ComputerPlayer, create_game, create_player, SOSGame
+from game_record import CELL_BITS, MODE_CODES, MODES, O_BIT, read_games
+from selfplay import run_games
+
+MAGIC = b'SOSB'
+VERSION = 1
+HEADER = struct.Struct('<4sBBBBI')
+ENTRY = struct.Struct('<QHII')
+
+
+class OpeningBook:
+    """
+    stats: canonical hash -> {encoded move: [games, points]}
+    min_games: moves seen in fewer games are not played from the book
+    """
+
+    def __init__(self, size, mode, plies=4, min_games=5):
+        self.size = size
+        self.mode = mode
+        self.plies = plies
+        self.min_games = min_games
+        self.stats = {}
+
+    def encode_move(self, row, col, letter):
+        return (row * self.size + col) | (O_BIT if letter == 'O' else 0)
+
+    def decode_move(self, value):
+        row, col = divmod(value & CELL_BITS, self.size)
+        return row, col, 'O' if value & O_BIT else 'S'
+
+    def canonical_move(self, board, row, col, letter):
+        """
+        (canonical hash, encoded move) for a move on board. Positions with
+        symmetries of their own reach the canonical form through several
+        transforms; taking the smallest resulting move keeps equivalent
+        moves in one entry
+        """
+        key = board.canonical_hash()[0]
+        moves = []
+        for transform, image_hash in enumerate(board.symmetry_hashes):
+            if image_hash == key:
+                moves.append(self.encode_move(*board.transform_cell(row, col, transform),
+                                              letter))
+        return key, min(moves)
+
+    def add_game(self, moves, winner):
+        """
+        Count the opening of one finished game
+        moves: (row, col, letter, ...) in play order; winner: "Blue", "Red" or "Draw"
+        """
+        game = create_game(self.mode)
+        game.set_board_size(self.size)
+        game.set_players(create_player("Human", "Blue", "blue"),
+                         create_player("Human", "Red", "red"))
+        game.start_new_game()
+
+        for row, col, letter, *_ in moves[:self.plies]:
+            key, move = self.canonical_move(game.board, row, col, letter)
+            entry = self.stats.setdefault(key, {}).setdefault(move, [0, 0])
+            entry[0] += 1
+            mover = game.current_player.name
+            entry[1] += 1 if winner == "Draw" else 2 if winner == mover else 0
+            game.make_move(row, col, letter)
+
+    def write_game(self, game, blue_type=None, red_type=None, seed=None):
+        """GameRecordWriter-style hook so selfplay can feed the book directly"""
+        winner = game.get_winner()
+        self.add_game(game.move_log, winner if winner == "Draw" else winner.name)
+
+    def add_records(self, records):
+        """Count games from game_record.GameRecord objects of this size and mode"""
+        for record in records:
+            if record.size == self.size and record.mode == self.mode:
+                winner = record.replay().get_winner()
+                self.add_game(record.moves, winner if winner == "Draw" else winner.name)
+
+    def best_move(self, board):
+        """
+        Highest scoring book move for board as (row, col, letter), or None
+        past the book's plies or for positions the book has not seen enough
+        """
+        if board.size != self.size or board.filled_count >= self.plies:
+            return None
+        key, transform = board.canonical_hash()
+        moves = self.stats.get(key)
+        if not moves:
+            return None
+
+        best = None
+        best_rate = -1.0
+        for move, (games, points) in moves.items():
+            if games >= self.min_games and points / games > best_rate:
+                best_rate = points / games
+                best = move
+        if best is None:
+            return None
+        row, col, letter = self.decode_move(best)
+        row, col = board.untransform_cell(row, col, transform)
+        if not board.is_cell_empty(row, col):
+            return None  # Hash collision with a different position
+        return row, col, letter
+
+    def __len__(self):
+        return len(self.stats)
+
+    def save(self, path):
+        entries = sorted((key, move, games, points)
+                         for key, moves in self.stats.items()
+                         for move, (games, points) in moves.items())
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.size, MODE_CODES[self.mode],
+                                self.plies, len(entries)))
+            for entry in entries:
+                f.write(ENTRY.pack(*entry))
+
+    @classmethod
+    def load(cls, path, min_games=5):
+        with open(path, 'rb') as f:
+            magic, version, size, mode, plies, count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("Not an SOS opening book")
+            data = f.read(count * ENTRY.size)
+        if len(data) != count * ENTRY.size:
+            raise ValueError("Truncated opening book")
+        book = cls(size, MODES[mode], plies, min_games)
+        for key, move, games, points in ENTRY.iter_unpack(data):
+            book.stats.setdefault(key, {})[move] = [games, points]
+        return book
+
+
+def install(book):
+    """Let every ComputerPlayer open from this book for its size and mode"""
+    ComputerPlayer.opening_books[(book.size, book.mode)] = book
+
+
+def uninstall(size, mode):
+    ComputerPlayer.opening_books.pop((size, mode), None)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build an SOS opening book")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--mode", default=SOSGame.SIMPLE_MODE,
+                        choices=[SOSGame.SIMPLE_MODE, SOSGame.GENERAL_MODE])
+    parser.add_argument("--plies", type=int, default=4, help="opening moves to keep")
+    parser.add_argument("--games", type=int, default=0, help="self-play games to add")
+    parser.add_argument("--blue", default="Computer", help="self-play blue player type")
+    parser.add_argument("--red", default="Computer", help="self-play red player type")
+    parser.add_argument("--seed", type=int, default=None, help="base self-play seed")
+    parser.add_argument("--records", nargs="+", default=[],
+                        help="game record files to add")
+    parser.add_argument("--out", required=True, help="book file to write")
+    return parser.parse_args(argv)
+
+
+def main(argv=None, out=None):
+    args = parse_args(argv)
+    out = out or sys.stdout
+    book = OpeningBook(args.size, args.mode, args.plies)
+    for path in args.records:
+        book.add_records(read_games(path))
+    for _ in run_games(args.games, args.blue, args.red, args.size, args.mode,
+                       seed=args.seed, writer=book):
+        pass
+    book.save(args.out)
+    out.write(f"{len(book)} positions -> {args.out}\n")
+
+
+if __name__ == "__main__":
+    main()
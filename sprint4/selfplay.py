@@ -0,0 +1,135 @@
+"""
+Hashim Abdulla
+SOS Self-Play Module - Sprint 4
+Headless game loop for computer vs computer games (no Tk import)
+
+Usage (from the sprint4 folder):
+    python -m selfplay --games 100 --blue Minimax --red Computer --size 5 --mode General
+Each finished game is written to stdout as one JSON line
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from game_logic import create_game, create_player, GameBoard, SOSGame
+from game_record import GameRecordWriter
+from instrumentation import Instrumentation, JsonLinesSink
+from solver import load_tables
+
+
+def play_game(blue_type, red_type, size=3, mode=SOSGame.SIMPLE_MODE,
+              blue_options=None, red_options=None, seed=None, writer=None,
+              instrumentation=None):
+    """
+    Play one computer vs computer game to the end
+    Returns a result dict: winner ("Blue", "Red" or "Draw"), scores,
+    move count and duration in seconds
+    writer: optional GameRecordWriter that archives the finished game
+    instrumentation: optional Instrumentation that times every move phase
+    """
+    if seed is not None:
+        # ComputerPlayer draws from the module-level random generator
+        random.seed(seed)
+
+    game = create_game(mode)
+    game.set_board_size(size)
+    blue = create_player(blue_type, "Blue", "blue", game, **(blue_options or {}))
+    red = create_player(red_type, "Red", "red", game, **(red_options or {}))
+    if blue.is_human() or red.is_human():
+        raise ValueError("Self-play needs two computer players")
+    game.set_players(blue, red)
+    game.start_new_game()
+    if instrumentation is not None:
+        instrumentation.attach(game)
+
+    moves = 0
+    start = time.perf_counter()
+    while not game.is_game_over():
+        move = game.get_current_player().make_move()
+        if move is None:
+            raise RuntimeError("Computer could not find valid move")
+        game.make_move(*move)
+        moves += 1
+    duration = time.perf_counter() - start
+    if writer is not None:
+        writer.write_game(game, blue_type, red_type, seed)
+
+    winner = game.get_winner()
+    return {
+        "blue": blue_type,
+        "red": red_type,
+        "size": size,
+        "mode": mode,
+        "seed": seed,
+        "winner": winner if winner == "Draw" else winner.name,
+        "blue_score": blue.score,
+        "red_score": red.score,
+        "moves": moves,
+        "duration": round(duration, 6),
+    }
+
+
+def run_games(games, blue_type, red_type, size=3, mode=SOSGame.SIMPLE_MODE,
+              blue_options=None, red_options=None, seed=None, writer=None,
+              instrumentation=None):
+    """Generator of result dicts for a series of games (game i uses seed + i)"""
+    for index in range(games):
+        game_seed = None if seed is None else seed + index
+        result = play_game(blue_type, red_type, size, mode,
+                           blue_options, red_options, game_seed, writer,
+                           instrumentation)
+        result["game"] = index
+        yield result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Headless SOS self-play")
+    parser.add_argument("--games", type=int, default=1, help="number of games")
+    parser.add_argument("--blue", default="Computer", help="blue player type")
+    parser.add_argument("--red", default="Computer", help="red player type")
+    parser.add_argument("--size", type=int, default=3, help="board size")
+    parser.add_argument("--mode", default=SOSGame.SIMPLE_MODE,
+                        choices=[SOSGame.SIMPLE_MODE, SOSGame.GENERAL_MODE])
+    parser.add_argument("--blue-options", type=json.loads, default=None,
+                        help='JSON player settings, e.g. \'{"depth": 3}\'')
+    parser.add_argument("--red-options", type=json.loads, default=None,
+                        help="JSON player settings for red")
+    parser.add_argument("--seed", type=int, default=None, help="base random seed")
+    parser.add_argument("--record", default=None,
+                        help="append every game to this binary record file")
+    parser.add_argument("--metrics", default=None,
+                        help="append per-phase move timings to this JSON lines file")
+    parser.add_argument("--tables", nargs="+", default=[],
+                        help="endgame table files for ComputerPlayer (see solver.py)")
+    parser.add_argument("--max-size", type=int, default=None,
+                        help="raise the board size limit (default 10)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None, out=None):
+    """Command line entry point: stream one JSON line per game"""
+    args = parse_args(argv)
+    out = out or sys.stdout
+    if args.max_size is not None:
+        GameBoard.max_size = args.max_size
+    load_tables(args.tables)
+    writer = GameRecordWriter(args.record) if args.record else None
+    metrics = Instrumentation(JsonLinesSink(args.metrics)) if args.metrics else None
+    try:
+        for result in run_games(args.games, args.blue, args.red, args.size, args.mode,
+                                args.blue_options, args.red_options, args.seed, writer,
+                                metrics):
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if writer is not None:
+            writer.close()
+        if metrics is not None:
+            metrics.flush()
+
+
+if __name__ == "__main__":
+    main()
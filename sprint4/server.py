@@ -0,0 +1,279 @@
+"""
+Hashim Abdulla
+SOS Game Server Module - Sprint 4
+Asyncio server hosting many SimpleGame/GeneralGame sessions in one process
+
+Clients talk newline-delimited JSON over TCP or a Unix socket:
+    {"type": "new_game", "mode": "General", "size": 5, "blue": "Human", "red": "Minimax"}
+    {"type": "join", "game_id": 1}
+    {"type": "move", "game_id": 1, "row": 0, "col": 2, "letter": "S"}
+    {"type": "state", "game_id": 1}
+Every accepted move is broadcast to all clients in that game as a delta.
+Computer decisions run in an executor so a slow search never blocks the loop.
+A game is dropped when its last client disconnects, and a finished game
+nobody watches is dropped when its computer turns end. Player options
+are limited to PLAYER_OPTIONS so no request can start an unbounded search
+
+Usage (from the sprint4 folder):
+    python -m server --port 8765
+    python -m server --unix /tmp/sos.sock
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from game_logic import (COMPUTER_PLAYER_TYPES, MinimaxComputerPlayer, create_game,
+                        create_player)
+
+# Search options a client may set: name -> (type, lowest, highest)
+PLAYER_OPTIONS = {
+    "depth": (int, 1, 8),
+    "width": (int, 1, 200),
+    "time_limit_ms": (int, 1, 10000),
+    "time_limit": (float, 0.001, 10.0),
+    "iterations": (int, 0, 1000000),
+    "exploration": (float, 0.0, 10.0),
+    "seed": (int, 0, 2 ** 64 - 1),
+    "workers": (int, 1, os.cpu_count() or 1),
+}
+# Minimax players get this time limit unless the request sets a smaller one
+MAX_THINK_MS = 10000
+
+
+class GameSession:
+    """One hosted game and the clients watching it"""
+
+    def __init__(self, game_id, game):
+        self.game_id = game_id
+        self.game = game
+        self.clients = set()
+        self.thinking = False  # A computer move is being computed
+        self.task = None       # Background computer turns
+        self.snapshot = self.build_state()
+
+    def state(self):
+        """
+        State after the last accepted move. Searches play moves in place on
+        the game, so it is not read directly while a computer is thinking
+        """
+        return self.snapshot
+
+    def build_state(self):
+        game = self.game
+        return {
+            "type": "state",
+            "game_id": self.game_id,
+            "mode": game.game_mode,
+            "size": game.board_size,
+            "board": ["".join(row) for row in game.board.grid],
+            "blue": player_info(game.blue_player),
+            "red": player_info(game.red_player),
+            "current": game.current_player.name,
+            "game_over": game.game_over,
+            "winner": winner_name(game),
+        }
+
+
+def player_options(player_type, options):
+    """Checked constructor options for one player of a new_game request"""
+    if not isinstance(options, dict):
+        raise ValueError("Player options must be a JSON object")
+    checked = {}
+    for key, value in options.items():
+        if key not in PLAYER_OPTIONS:
+            raise ValueError(f"Unknown player option: {key}")
+        kind, low, high = PLAYER_OPTIONS[key]
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or \
+                (kind is int and not isinstance(value, int)) or not low <= value <= high:
+            raise ValueError(f"Option {key} must be a number from {low} to {high}")
+        checked[key] = value
+    player_class = COMPUTER_PLAYER_TYPES.get(player_type)
+    if player_class is not None and issubclass(player_class, MinimaxComputerPlayer):
+        checked.setdefault("time_limit_ms", MAX_THINK_MS)
+    return checked
+
+
+def player_info(player):
+    return {"type": "Human" if player.is_human() else type(player).__name__,
+            "score": player.score}
+
+
+def winner_name(game):
+    winner = game.get_winner()
+    if winner is None or winner == "Draw":
+        return winner
+    return winner.name
+
+
+class GameServer:
+    """Routes client requests to game sessions and broadcasts move deltas"""
+
+    def __init__(self, executor=None):
+        self.sessions = {}
+        self.game_ids = itertools.count(1)
+        self.executor = executor or ThreadPoolExecutor()
+
+    async def handle_client(self, reader, writer):
+        """Connection handler for asyncio.start_server / start_unix_server"""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    reply = await self.handle_request(request, writer)
+                except (ValueError, RuntimeError, KeyError, TypeError) as e:
+                    reply = {"type": "error", "message": str(e)}
+                if reply is not None:
+                    await send(writer, reply)
+        finally:
+            for session in list(self.sessions.values()):
+                if writer in session.clients:
+                    session.clients.discard(writer)
+                    if not session.clients:
+                        self.drop_session(session)
+            writer.close()
+
+    async def handle_request(self, request, writer=None):
+        """Handle one decoded request; returns the direct reply (or None)"""
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object")
+        kind = request.get("type")
+        if kind == "new_game":
+            return await self.new_game(request, writer)
+        if kind == "join":
+            session = self.get_session(request)
+            session.clients.add(writer)
+            return session.state()
+        if kind == "state":
+            return self.get_session(request).state()
+        if kind == "move":
+            await self.human_move(request)
+            return None
+        raise ValueError(f"Unknown request type: {kind}")
+
+    def drop_session(self, session):
+        """Forget a session, cancelling its computer turns and any running search"""
+        self.sessions.pop(session.game_id, None)
+        if session.task is not None and not session.task.done():
+            session.task.cancel()
+        for player in (session.game.blue_player, session.game.red_player):
+            if not player.is_human():
+                player.request_stop()
+
+    def get_session(self, request):
+        session = self.sessions.get(request.get("game_id"))
+        if session is None:
+            raise ValueError("Unknown game")
+        return session
+
+    async def new_game(self, request, writer=None):
+        game = create_game(request.get("mode", "Simple"))
+        game.set_board_size(int(request.get("size", 3)))
+        options = request.get("options", {})
+        if not isinstance(options, dict):
+            raise ValueError("Options must be a JSON object")
+        blue_type = request.get("blue", "Human")
+        red_type = request.get("red", "Human")
+        game.set_players(
+            create_player(blue_type, "Blue", "blue", game,
+                          **player_options(blue_type, options.get("blue", {}))),
+            create_player(red_type, "Red", "red", game,
+                          **player_options(red_type, options.get("red", {}))))
+        game.start_new_game()
+
+        session = GameSession(next(self.game_ids), game)
+        self.sessions[session.game_id] = session
+        if writer is not None:
+            session.clients.add(writer)
+        # Blue may be a computer player; its moves follow the reply
+        session.task = asyncio.ensure_future(self.play_computer_turns(session))
+        return dict(session.state(), type="game_created")
+
+    async def human_move(self, request):
+        session = self.get_session(request)
+        game = session.game
+        if session.thinking or (not game.is_game_over() and
+                                not game.current_player.is_human()):
+            raise RuntimeError("It's the computer's turn. Please wait.")
+        await self.apply_move(session, int(request["row"]), int(request["col"]),
+                              request["letter"])
+        session.task = asyncio.ensure_future(self.play_computer_turns(session))
+
+    async def apply_move(self, session, row, col, letter):
+        """Validate through SOSGame.make_move and broadcast the delta"""
+        game = session.game
+        player = game.current_player
+        game.make_move(row, col, letter)
+        session.snapshot = session.build_state()
+        delta = {
+            "type": "move",
+            "game_id": session.game_id,
+            "row": row,
+            "col": col,
+            "letter": letter,
+            "player": player.name,
+            "scored": game.move_log[-1][3],
+            "scores": {"Blue": game.blue_player.score, "Red": game.red_player.score},
+            "current": game.current_player.name,
+            "game_over": game.game_over,
+            "winner": winner_name(game),
+        }
+        await self.broadcast(session, delta)
+
+    async def play_computer_turns(self, session):
+        """Run computer moves (in the executor) until a human is to move"""
+        game = session.game
+        loop = asyncio.get_running_loop()
+        while not game.is_game_over() and not game.current_player.is_human():
+            session.thinking = True
+            try:
+                move = await loop.run_in_executor(self.executor,
+                                                  game.current_player.make_move)
+            finally:
+                session.thinking = False
+            if move is None:
+                break
+            await self.apply_move(session, *move)
+        if game.is_game_over() and not session.clients:
+            self.sessions.pop(session.game_id, None)
+
+    async def broadcast(self, session, message):
+        for writer in list(session.clients):
+            try:
+                await send(writer, message)
+            except ConnectionError:
+                session.clients.discard(writer)
+
+
+async def send(writer, message):
+    writer.write((json.dumps(message) + "\n").encode('utf-8'))
+    await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=8765, unix_path=None):
+    server = GameServer()
+    if unix_path:
+        listener = await asyncio.start_unix_server(server.handle_client, path=unix_path)
+    else:
+        listener = await asyncio.start_server(server.handle_client, host, port)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SOS multi-game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", default=None, help="serve on a Unix socket path")
+    args = parser.parse_args(argv)
+    asyncio.run(serve(args.host, args.port, args.unix))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Hashim Abdulla
+SOS Solver Module - Sprint 4
+Exact game values for small boards, saved as endgame tables that
+ComputerPlayer answers from without searching
+
+Positions are keyed by their canonical form: the smallest of the 8
+symmetric (s_mask, o_mask) pairs packed as s_mask | o_mask << (n * n).
+Values are from the point of view of the player to move:
+- Simple mode: 1 win, 0 draw, -1 loss
+- General mode: the best final score difference still to be gained
+  (whoever moves). The winner of a position with score lead d is the
+  sign of d + value, so one table serves every score
+Neither depends on which color is to move, so colors share entries.
+Each entry also keeps a best move in canonical coordinates, so playing
+from a table is a lookup with no search
+
+A table file is a header (magic b'SOST', version, size, mode, count)
+followed by the sorted uint64 keys, the int8 values and the uint8 best
+moves (cell index << 1 | 1 for O)
+
+Usage (from the sprint4 folder):
+    python -m solver --size 3 --mode General --out sos3g.tbl
+    python -m solver --size 4 --mode Simple --out sos4s.tbl   # about ten minutes
+"""
+
+import argparse
+import struct
+import sys
+from array import array
+
+from game_logic import (ComputerPlayer, GameBoard, SOSGame, canonical_masks,
+                        get_sos_triples, get_symmetries)
+
+MAGIC = b'SOST'
+VERSION = 2
+HEADER = struct.Struct('<4sBBBI')
+
+MODE_CODES = {SOSGame.SIMPLE_MODE: 0, SOSGame.GENERAL_MODE: 1}
+MODES = {code: mode for mode, code in MODE_CODES.items()}
+
+LETTERS = ('S', 'O')
+
+
+class Solver:
+    """
+    Memoized negamax over canonical positions of one board size and mode
+    values: canonical key -> value; moves: canonical key -> best move
+    (index << 1 | letter code, canonical coordinates); filled by solve and
+    by load. Every move of a solved position is solved too, so the table
+    covers any line of play from it
+    """
+
+    def __init__(self, size, mode, values=None, moves=None):
+        GameBoard.check_size(size)
+        if mode not in MODE_CODES:
+            raise ValueError("Invalid game mode")
+        self.size = size
+        self.mode = mode
+        self.cells = size * size
+        self.full = (1 << self.cells) - 1
+        self.values = values if values is not None else {}
+        self.moves = moves if moves is not None else {}
+        self.perms = get_symmetries(size)
+        # needs[index][letter] -> (s_need, o_need) masks completing an SOS
+        triples = get_sos_triples(size)
+        self.needs = [[[(s_need, o_need) for _, _, s_need, o_need in triples[index][letter]]
+                       for letter in LETTERS] for index in range(self.cells)]
+
+    def canonical_key(self, s_mask, o_mask):
+        return canonical_masks(self.size, s_mask, o_mask)[0]
+
+    def gain(self, s_mask, o_mask, index, letter_code):
+        """SOS formed by a letter just placed at index (already in the masks)"""
+        count = 0
+        for s_need, o_need in self.needs[index][letter_code]:
+            if s_mask & s_need == s_need and o_mask & o_need == o_need:
+                count += 1
+        return count
+
+    def children(self, s_mask, o_mask):
+        """(index, letter_code, child s_mask, child o_mask, gain) for every move"""
+        occupied = s_mask | o_mask
+        for index in range(self.cells):
+            bit = 1 << index
+            if occupied & bit:
+                continue
+            for letter_code, child_s, child_o in ((0, s_mask | bit, o_mask),
+                                                  (1, s_mask, o_mask | bit)):
+                yield index, letter_code, child_s, child_o, \
+                    self.gain(child_s, child_o, index, letter_code)
+
+    def move_value(self, child_s, child_o, gain):
+        """Value of a move for the player making it"""
+        if self.mode == SOSGame.SIMPLE_MODE:
+            if gain:
+                return 1
+            if child_s | child_o == self.full:
+                return 0
+            return -self.solve(child_s, child_o)
+        if gain:
+            # The scorer moves again
+            return gain + self.solve(child_s, child_o)
+        return -self.solve(child_s, child_o)
+
+    def solve(self, s_mask=0, o_mask=0):
+        """Value of a position for the player to move (see module docstring)"""
+        if s_mask | o_mask == self.full:
+            return 0
+        key, transform = canonical_masks(self.size, s_mask, o_mask)
+        value = self.values.get(key)
+        if value is not None:
+            return value
+
+        best = None
+        best_move = None
+        for index, letter_code, child_s, child_o, gain in self.children(s_mask, o_mask):
+            value = self.move_value(child_s, child_o, gain)
+            if best is None or value > best:
+                best = value
+                best_move = self.perms[transform][index] << 1 | letter_code
+        self.values[key] = best
+        self.moves[key] = best_move
+        return best
+
+    def best_move(self, board):
+        """
+        (row, col, letter) with the best value for the player to move, or
+        None for another size or a position the table does not hold
+        """
+        if board.size != self.size:
+            return None
+        key, transform = board.canonical_masks()
+        move = self.moves.get(key)
+        if move is None:
+            return None
+        row, col = divmod(move >> 1, self.size)
+        row, col = board.untransform_cell(row, col, transform)
+        return row, col, LETTERS[move & 1]
+
+    def save(self, path):
+        keys = sorted(self.values)
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.size, MODE_CODES[self.mode], len(keys)))
+            array('Q', keys).tofile(f)
+            array('b', [self.values[key] for key in keys]).tofile(f)
+            array('B', [self.moves[key] for key in keys]).tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            magic, version, size, mode, count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("Not an SOS endgame table")
+            keys = array('Q')
+            keys.fromfile(f, count)
+            values = array('b')
+            values.fromfile(f, count)
+            moves = array('B')
+            moves.fromfile(f, count)
+        return cls(size, MODES[mode], dict(zip(keys, values)), dict(zip(keys, moves)))
+
+
+def install(solver):
+    """
+    Let every ComputerPlayer use this solver for its size and mode
+    (solve() it or load a table first: moves are only looked up)
+    """
+    ComputerPlayer.endgame_tables[(solver.size, solver.mode)] = solver
+
+
+def uninstall(size, mode):
+    ComputerPlayer.endgame_tables.pop((size, mode), None)
+
+
+def load_tables(paths):
+    """Load and install table files; returns the solvers"""
+    solvers = [Solver.load(path) for path in paths]
+    for solver in solvers:
+        install(solver)
+    return solvers
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Solve small SOS boards exactly")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--mode", default=SOSGame.SIMPLE_MODE,
+                        choices=[SOSGame.SIMPLE_MODE, SOSGame.GENERAL_MODE])
+    parser.add_argument("--out", required=True, help="table file to write")
+    return parser.parse_args(argv)
+
+
+def main(argv=None, out=None):
+    args = parse_args(argv)
+    out = out or sys.stdout
+    solver = Solver(args.size, args.mode)
+    value = solver.solve()
+    solver.save(args.out)
+    out.write(f"{args.size}x{args.size} {args.mode}: value {value}, "
+              f"{len(solver.values)} positions -> {args.out}\n")
+
+
+if __name__ == "__main__":
+    main()
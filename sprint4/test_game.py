@@ -6,8 +6,32 @@ Using pytest framework
 Sprint 4 increment adds tests for player hierarchy (Human/Computer)
 """
 
+import asyncio
+import concurrent.futures
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
 import pytest
-from game_logic import (GameBoard, Player, HumanPlayer, ComputerPlayer,
+import benchmark
+import game_logic
+import game_record
+import instrumentation
+import opening_book
+import selfplay
+import server
+import solver
+import tournament
+from game_logic import (GameBoard, BitBoard, CellSet, MaskCells, get_sos_triples, get_symmetries,
+                        SYMMETRY_INVERSE, Player, HumanPlayer,
+                        ComputerPlayer, MinimaxComputerPlayer, MCTSComputerPlayer,
+                        TranspositionTable,
                         SimpleGame, GeneralGame, create_game, create_player, SOSGame)
 
 class TestGameBoard:
@@ -127,6 +151,222 @@ class TestGameBoard:
         assert len(sequences) == 0
 
 
+class TestBitBoard(TestGameBoard):
+    """Runs the GameBoard tests against the bitmask-backed BitBoard"""
+
+    @pytest.fixture(autouse=True)
+    def use_bitboard(self, monkeypatch):
+        monkeypatch.setitem(globals(), 'GameBoard', BitBoard)
+
+    def test_masks_track_letters(self):
+        board = BitBoard(3)
+        board.place_letter(0, 0, 'S')
+        board.place_letter(1, 2, 'O')
+        assert board.s_mask == 0b000000001
+        assert board.o_mask == 0b000100000
+        assert board.occupied == board.s_mask | board.o_mask
+
+    def test_grid_view_writes_masks(self):
+        board = BitBoard(3)
+        board.grid[2][1] = 'O'
+        assert board.get_cell(2, 1) == 'O'
+        board.grid[2][1] = ' '
+        assert board.is_cell_empty(2, 1)
+        assert board.occupied == 0
+
+    def test_matches_gameboard_on_random_boards(self):
+        """Both boards report the same SOS sequences for every cell"""
+        rng = random.Random(7)
+        for size in (3, 5, 8):
+            plain = game_logic.GameBoard(size)
+            bits = BitBoard(size)
+            for row in range(size):
+                for col in range(size):
+                    letter = rng.choice(['S', 'O', ' '])
+                    if letter != ' ':
+                        plain.place_letter(row, col, letter)
+                        bits.place_letter(row, col, letter)
+            for row in range(size):
+                for col in range(size):
+                    assert bits.check_sos_at_position(row, col) == \
+                        plain.check_sos_at_position(row, col)
+
+    def test_state_is_integers(self):
+        """No per-cell objects: everything else is derived from the masks"""
+        board = BitBoard(6)
+        board.place_letter(2, 3, 'S')
+        for name in ('occupied', 's_mask', 'o_mask', 'filled_count', 'hash'):
+            assert isinstance(vars(board)[name], int)
+        assert 'empty_cells' not in vars(board)
+        assert 'symmetry_hashes' not in vars(board)
+
+    def test_scoring_cells_match_gameboard(self):
+        rng = random.Random(3)
+        for size in (3, 5, 8):
+            plain = game_logic.GameBoard(size)
+            bits = BitBoard(size)
+            for row, col in rng.sample([(r, c) for r in range(size) for c in range(size)],
+                                       size * size // 2):
+                letter = rng.choice(['S', 'O'])
+                plain.place_letter(row, col, letter)
+                bits.place_letter(row, col, letter)
+            assert set(bits.scoring_cells) == set(plain.scoring_cells)
+            assert set(bits.empty_cells) == set(plain.empty_cells)
+            assert bits.symmetry_hashes == plain.symmetry_hashes
+            best = plain.best_scoring_move()
+            if best is None:
+                assert bits.best_scoring_move() is None
+            else:
+                assert plain.count_sos_for_move(*bits.best_scoring_move()) == \
+                    plain.count_sos_for_move(*best)
+
+    def test_mask_cells(self):
+        cells = MaskCells(3, 0b100000101)
+        assert list(cells) == [(0, 0), (0, 2), (2, 2)]
+        assert len(cells) == 3
+        assert (0, 2) in cells
+        assert (1, 1) not in cells and (3, 0) not in cells
+        rng = random.Random(0)
+        assert {cells.choice(rng) for _ in range(200)} == set(cells)
+        assert MaskCells(3, 0).choice(rng) is None
+
+    def test_game_with_bitboard(self):
+        """Full computer game runs on a BitBoard"""
+        game = GeneralGame()
+        game.board_class = BitBoard
+        game.set_board_size(5)
+        blue = create_player("Computer", "Blue", "blue", game)
+        red = create_player("Computer", "Red", "red", game)
+        game.set_players(blue, red)
+        game.start_new_game()
+        assert isinstance(game.board, BitBoard)
+
+        while not game.is_game_over():
+            row, col, letter = game.get_current_player().make_move()
+            game.make_move(row, col, letter)
+
+        assert game.board.is_board_full()
+
+
+class TestSosTriples:
+    """Tests for the precomputed per-size SOS triple table"""
+
+    def test_table_cached_per_size(self):
+        assert get_sos_triples(5) is get_sos_triples(5)
+        assert GameBoard(5).triples is BitBoard(5).triples
+        assert len(get_sos_triples(12)) == 144
+
+    def test_center_cell_roles(self):
+        """Centre of a 3x3 board is only ever the middle of a line"""
+        entry = get_sos_triples(3)[4]
+        assert entry['S'] == []
+        assert len(entry['O']) == 4
+        assert all(role == 1 for _, role, _, _ in entry['O'])
+
+    def test_corner_cell_roles(self):
+        """Corner of a 3x3 board starts three lines and is never a middle"""
+        entry = get_sos_triples(3)[0]
+        assert entry['O'] == []
+        cells = [c for c, _, _, _ in entry['S']]
+        assert ((0, 0), (0, 1), (0, 2)) in cells
+        assert ((0, 0), (1, 1), (2, 2)) in cells
+        assert len(cells) == 3
+
+    def test_triple_masks(self):
+        cells, role, s_need, o_need = get_sos_triples(3)[2]['S'][0]
+        assert cells == ((0, 0), (0, 1), (0, 2))
+        assert role == 2
+        assert s_need == 0b101
+        assert o_need == 0b010
+
+
+class TestEmptyCellTracking:
+    """Tests for the incremental empty-cell set and filled counter"""
+
+    def test_cell_set_add_remove(self):
+        cells = CellSet([(0, 0), (0, 1), (1, 1)])
+        cells.remove((0, 0))
+        assert len(cells) == 2
+        assert (0, 0) not in cells
+        assert sorted(cells) == [(0, 1), (1, 1)]
+        cells.add((0, 0))
+        cells.add((0, 0))
+        assert len(cells) == 3
+
+    def test_cell_set_choice(self):
+        cells = CellSet([(2, 2)])
+        assert cells.choice() == (2, 2)
+        cells.remove((2, 2))
+        assert cells.choice() is None
+
+    @pytest.mark.parametrize("board_type", [GameBoard, BitBoard])
+    def test_board_counters_follow_moves(self, board_type):
+        board = board_type(4)
+        assert len(board.empty_cells) == 16
+        board.place_letter(1, 2, 'S')
+        board.place_letter(3, 3, 'O')
+        assert board.filled_count == 2
+        assert (1, 2) not in board.empty_cells
+        assert len(board.empty_cells) == 14
+
+        board.reset()
+        assert board.filled_count == 0
+        assert len(board.empty_cells) == 16
+
+    @pytest.mark.parametrize("board_type", [GameBoard, BitBoard])
+    def test_frontier_follows_moves(self, board_type):
+        board = board_type(4)
+        assert len(board.frontier) == 0
+        board.place_letter(0, 0, 'S')
+        assert set(board.frontier) == {(0, 1), (1, 0), (1, 1)}
+        assert board.has_neighbor(1, 1) and not board.has_neighbor(2, 2)
+        board.place_letter(1, 1, 'O')
+        assert (1, 1) not in board.frontier
+        assert len(board.frontier) == 7
+        board.remove_letter(0, 0)
+        assert set(board.frontier) == {(r, c) for r in range(3) for c in range(3)} - {(1, 1)}
+        board.remove_letter(1, 1)
+        assert len(board.frontier) == 0
+
+    def test_frontier_built_on_first_use(self):
+        rng = random.Random(5)
+        board = GameBoard(6)
+        cells = rng.sample([(r, c) for r in range(6) for c in range(6)], 20)
+        for row, col in cells[:10]:
+            board.place_letter(row, col, 'S')
+        assert board._frontier is None  # Plain play does not track it
+        bits = self.copy_to_bitboard(board)
+        assert all(board.has_neighbor(row, col) == bits.has_neighbor(row, col)
+                   for row in range(6) for col in range(6))
+        board.frontier
+        for row, col in cells[10:]:
+            board.place_letter(row, col, 'O')
+        board.remove_letter(*cells[0])
+        fresh = GameBoard(6)
+        for row, col in cells[1:]:
+            fresh.place_letter(row, col, board.get_cell(row, col))
+        assert set(board.frontier) == set(fresh.frontier)
+        assert set(board.frontier) == set(self.copy_to_bitboard(board).frontier)
+
+    def copy_to_bitboard(self, board):
+        bits = BitBoard(board.size)
+        for row in range(board.size):
+            for col in range(board.size):
+                if not board.is_cell_empty(row, col):
+                    bits.place_letter(row, col, board.get_cell(row, col))
+        return bits
+
+    def test_bitboard_grid_view_updates_counters(self):
+        board = BitBoard(3)
+        board.grid[0][0] = 'S'
+        assert board.filled_count == 1
+        board.grid[0][0] = 'O'
+        assert board.filled_count == 1
+        board.grid[0][0] = ' '
+        assert board.filled_count == 0
+        assert (0, 0) in board.empty_cells
+
+
 class TestPlayer:
     """Tests for Player base class"""
 
@@ -1016,4 +1256,1727 @@ class TestMixedGame:
 
         # Game should track scores correctly
         assert human.score >= 0
-        assert computer.score >= 0
\ No newline at end of file
+        assert computer.score >= 0
+
+
+class TestMinimaxComputerPlayer:
+    """Tests for the alpha-beta minimax computer player"""
+
+    def setup_game(self, mode, size, depth=2):
+        game = create_game(mode)
+        game.set_board_size(size)
+        computer = create_player("Minimax", "Blue", "blue", game, depth=depth)
+        red = create_player("Human", "Red", "red", game)
+        game.set_players(computer, red)
+        game.start_new_game()
+        return game, computer
+
+    def test_create_minimax_player(self):
+        game = SimpleGame()
+        player = create_player("Minimax", "Blue", "blue", game, depth=3)
+        assert isinstance(player, MinimaxComputerPlayer)
+        assert isinstance(player, ComputerPlayer)
+        assert player.depth == 3
+
+    @pytest.mark.parametrize("board_type", [GameBoard, BitBoard])
+    def test_remove_letter_undoes_place(self, board_type):
+        board = board_type(3)
+        board.place_letter(1, 1, 'O')
+        board.remove_letter(1, 1)
+        assert board.is_cell_empty(1, 1)
+        assert board.filled_count == 0
+        with pytest.raises(ValueError, match="Cell is already empty"):
+            board.remove_letter(1, 1)
+
+    @pytest.mark.parametrize("board_type", [GameBoard, BitBoard])
+    def test_count_sos_for_move(self, board_type):
+        board = board_type(3)
+        board.place_letter(0, 0, 'S')
+        board.place_letter(0, 2, 'S')
+        board.place_letter(2, 0, 'S')
+        board.place_letter(2, 2, 'S')
+        assert board.count_sos_for_move(1, 1, 'O') == 2
+        assert board.count_sos_for_move(1, 1, 'S') == 0
+        assert board.is_cell_empty(1, 1)
+
+    def test_minimax_takes_simple_win(self):
+        game, computer = self.setup_game(SOSGame.SIMPLE_MODE, 4)
+        game.board.place_letter(0, 0, 'S')
+        game.board.place_letter(0, 1, 'O')
+        assert computer.make_move() == (0, 2, 'S')
+
+    def test_minimax_avoids_giving_simple_win(self):
+        """Every move it picks leaves the opponent without an immediate SOS"""
+        game, computer = self.setup_game(SOSGame.SIMPLE_MODE, 4)
+        game.board.place_letter(0, 0, 'S')
+        game.board.place_letter(3, 3, 'S')
+
+        row, col, letter = computer.make_move()
+        game.board.place_letter(row, col, letter)
+        for r, c in list(game.board.empty_cells):
+            for reply in ('S', 'O'):
+                assert game.board.count_sos_for_move(r, c, reply) == 0
+
+    def test_minimax_prefers_double_score(self):
+        game, computer = self.setup_game(SOSGame.GENERAL_MODE, 3)
+        for row, col in [(0, 0), (0, 2), (2, 0), (2, 2)]:
+            game.board.place_letter(row, col, 'S')
+        assert computer.make_move() == (1, 1, 'O')
+
+    def test_minimax_search_leaves_board_unchanged(self):
+        game, computer = self.setup_game(SOSGame.GENERAL_MODE, 5, depth=3)
+        game.board.place_letter(2, 2, 'S')
+        before = [list(row) for row in game.board.grid]
+        computer.make_move()
+        assert [list(row) for row in game.board.grid] == before
+        assert len(game.board.empty_cells) == 24
+        assert computer.nodes > 0
+
+    def test_minimax_plays_complete_games(self):
+        for mode in (SOSGame.SIMPLE_MODE, SOSGame.GENERAL_MODE):
+            game = create_game(mode)
+            game.set_board_size(4)
+            blue = create_player("Minimax", "Blue", "blue", game)
+            red = create_player("Computer", "Red", "red", game)
+            game.set_players(blue, red)
+            game.start_new_game()
+            while not game.is_game_over():
+                row, col, letter = game.get_current_player().make_move()
+                game.make_move(row, col, letter)
+            assert game.get_winner() is not None
+
+
+class TestZobristHashing:
+    """Tests for incremental board hashing"""
+
+    @pytest.mark.parametrize("board_type", [GameBoard, BitBoard])
+    def test_hash_restored_by_undo(self, board_type):
+        board = board_type(4)
+        assert board.hash == 0
+        board.place_letter(1, 1, 'S')
+        after_one = board.hash
+        board.place_letter(2, 3, 'O')
+        assert board.hash not in (0, after_one)
+        board.remove_letter(2, 3)
+        assert board.hash == after_one
+        board.remove_letter(1, 1)
+        assert board.hash == 0
+
+    def test_hash_independent_of_move_order(self):
+        first = GameBoard(5)
+        second = BitBoard(5)
+        first.place_letter(0, 0, 'S')
+        first.place_letter(4, 4, 'O')
+        second.place_letter(4, 4, 'O')
+        second.place_letter(0, 0, 'S')
+        assert first.hash == second.hash
+
+    def test_hash_depends_on_letter(self):
+        first = GameBoard(3)
+        second = GameBoard(3)
+        first.place_letter(0, 0, 'S')
+        second.place_letter(0, 0, 'O')
+        assert first.hash != second.hash
+
+    def test_reset_clears_hash(self):
+        board = BitBoard(3)
+        board.place_letter(0, 1, 'O')
+        board.reset()
+        assert board.hash == 0
+
+
+class TestTranspositionTable:
+    """Tests for the bounded two-bucket transposition table"""
+
+    def test_store_and_probe(self):
+        table = TranspositionTable(slots=8)
+        table.store(42, 3, 5, TranspositionTable.EXACT, (0, 0, 'S'))
+        assert table.probe(42) == (42, 3, 5, TranspositionTable.EXACT, (0, 0, 'S'))
+        assert table.probe(43) is None
+        assert table.hits == 1
+        assert table.misses == 1
+
+    def test_depth_preferred_replacement(self):
+        """Shallower entries go to the always-replace bucket"""
+        table = TranspositionTable(slots=4)
+        table.store(1, 5, 10, TranspositionTable.EXACT)
+        table.store(5, 2, 20, TranspositionTable.EXACT)
+        table.store(9, 1, 30, TranspositionTable.EXACT)
+        assert table.probe(1)[2] == 10
+        assert table.probe(5) is None
+        assert table.probe(9)[2] == 30
+        assert len(table) == 2
+
+    def test_deeper_entry_displaces_to_always_bucket(self):
+        table = TranspositionTable(slots=4)
+        table.store(1, 2, 10, TranspositionTable.EXACT)
+        table.store(5, 6, 20, TranspositionTable.EXACT)
+        assert table.probe(5)[2] == 20
+        assert table.probe(1)[2] == 10
+
+    def test_collision_counter(self):
+        table = TranspositionTable(slots=4)
+        table.store(1, 2, 10, TranspositionTable.EXACT)
+        assert table.probe(5) is None
+        assert table.collisions == 1
+        assert table.probe(2) is None
+        assert table.collisions == 1
+
+    def test_shared_table_with_minimax(self):
+        table = TranspositionTable()
+        game = create_game(SOSGame.GENERAL_MODE)
+        game.set_board_size(4)
+        blue = create_player("Minimax", "Blue", "blue", game, depth=3, table=table)
+        red = create_player("Minimax", "Red", "red", game, depth=3, table=table)
+        game.set_players(blue, red)
+        game.start_new_game()
+        game.board.place_letter(0, 0, 'S')
+        game.board.place_letter(0, 1, 'O')
+
+        row, col, letter = blue.make_move()
+        assert game.board.count_sos_for_move(row, col, letter) == 1
+        assert table.stores > 0
+        red.make_move()
+        assert table.hits > 0
+
+
+class TestPushPopMove:
+    """Tests for undoable moves on SOSGame"""
+
+    def setup_game(self, mode, size=3):
+        game = create_game(mode)
+        game.set_board_size(size)
+        game.set_players(HumanPlayer("Blue", "blue"), HumanPlayer("Red", "red"))
+        game.start_new_game()
+        return game
+
+    def test_pop_restores_turn(self):
+        game = self.setup_game(SOSGame.SIMPLE_MODE)
+        game.push_move(0, 0, 'S')
+        assert game.current_player == game.red_player
+        game.pop_move()
+        assert game.current_player == game.blue_player
+        assert game.board.is_cell_empty(0, 0)
+        assert game.undo_stack == []
+
+    def test_pop_restores_simple_win(self):
+        game = self.setup_game(SOSGame.SIMPLE_MODE)
+        game.push_move(0, 0, 'S')
+        game.push_move(1, 0, 'S')
+        game.push_move(0, 1, 'O')
+        game.push_move(1, 1, 'O')
+        game.push_move(0, 2, 'S')
+        assert game.is_game_over()
+        assert game.get_winner() == game.blue_player
+
+        game.pop_move()
+        assert not game.is_game_over()
+        assert game.get_winner() is None
+        assert game.current_player == game.blue_player
+
+    def test_pop_restores_general_scores(self):
+        game = self.setup_game(SOSGame.GENERAL_MODE)
+        game.push_move(0, 0, 'S')
+        game.push_move(0, 1, 'O')
+        game.push_move(0, 2, 'S')  # Blue scores and keeps the turn
+        assert game.blue_player.score == 1
+        assert game.current_player == game.blue_player
+
+        game.pop_move()
+        assert game.blue_player.score == 0
+        assert game.current_player == game.blue_player
+        assert game.board.hash == game.board.zobrist_keys[0]['S'] ^ game.board.zobrist_keys[1]['O']
+
+    def test_full_rollout_and_unwind(self):
+        game = self.setup_game(SOSGame.GENERAL_MODE, 5)
+        rng = random.Random(3)
+        while not game.is_game_over():
+            row, col = game.board.empty_cells.choice(rng)
+            game.push_move(row, col, rng.choice(['S', 'O']))
+        assert game.board.is_board_full()
+
+        while game.undo_stack:
+            game.pop_move()
+        assert game.board.filled_count == 0
+        assert game.board.hash == 0
+        assert game.blue_player.score == 0
+        assert game.red_player.score == 0
+        assert game.current_player == game.blue_player
+        assert not game.is_game_over()
+
+    def test_pop_without_moves(self):
+        game = self.setup_game(SOSGame.SIMPLE_MODE)
+        with pytest.raises(RuntimeError, match="No move to undo"):
+            game.pop_move()
+
+    def test_invalid_push_records_nothing(self):
+        game = self.setup_game(SOSGame.SIMPLE_MODE)
+        game.push_move(0, 0, 'S')
+        with pytest.raises(ValueError):
+            game.push_move(0, 0, 'O')
+        assert len(game.undo_stack) == 1
+
+
+class TestMCTSComputerPlayer:
+    """Tests for the Monte Carlo Tree Search computer player"""
+
+    def setup_game(self, mode, size, **options):
+        game = create_game(mode)
+        game.set_board_size(size)
+        computer = create_player("MCTS", "Blue", "blue", game, **options)
+        red = create_player("Human", "Red", "red", game)
+        game.set_players(computer, red)
+        game.start_new_game()
+        return game, computer
+
+    def test_create_mcts_player(self):
+        game = GeneralGame()
+        player = create_player("MCTS", "Red", "red", game, time_limit=0.2)
+        assert isinstance(player, MCTSComputerPlayer)
+        assert player.time_limit == 0.2
+        assert player.is_human() == False
+
+    def test_iteration_budget(self):
+        game, computer = self.setup_game(SOSGame.GENERAL_MODE, 4,
+                                         time_limit=None, iterations=50, seed=1)
+        computer.make_move()
+        assert computer.iterations == 50
+        assert computer.iterations_per_second > 0
+
+    def test_time_budget(self):
+        game, computer = self.setup_game(SOSGame.GENERAL_MODE, 6, time_limit=0.05, seed=1)
+        start = time.perf_counter()
+        computer.make_move()
+        assert time.perf_counter() - start < 0.5
+        assert computer.iterations > 0
+
+    def test_zero_iterations_plays_legal_move(self):
+        game, computer = self.setup_game(SOSGame.GENERAL_MODE, 4,
+                                         time_limit=None, iterations=0, seed=1)
+        row, col, letter = computer.make_move()
+        assert game.board.is_cell_empty(row, col)
+        assert computer.iterations == 0
+
+    def test_requires_a_limit(self):
+        game = GeneralGame()
+        with pytest.raises(ValueError, match="time_limit or an iterations limit"):
+            create_player("MCTS", "Blue", "blue", game, time_limit=None)
+
+    def test_deadline_cuts_rollout(self, monkeypatch):
+        """A rollout longer than the budget is abandoned, not finished"""
+        monkeypatch.setattr(GameBoard, 'max_size', 100)
+        game, computer = self.setup_game(SOSGame.GENERAL_MODE, 100, time_limit=0.1, seed=1)
+        start = time.perf_counter()
+        row, col, letter = computer.make_move()
+        assert time.perf_counter() - start < 0.3
+        assert game.board.is_cell_empty(row, col)
+        assert game.undo_stack == []
+        assert game.board.filled_count == 0
+
+    def test_mcts_takes_simple_win(self):
+        game, computer = self.setup_game(SOSGame.SIMPLE_MODE, 3,
+                                         time_limit=None, iterations=500, seed=2)
+        game.make_move(0, 0, 'S')
+        game.make_move(2, 2, 'O')
+        game.make_move(0, 1, 'O')
+        game.make_move(2, 0, 'O')
+        assert computer.make_move() == (0, 2, 'S')
+
+    def test_search_leaves_game_unchanged(self):
+        game, computer = self.setup_game(SOSGame.GENERAL_MODE, 4,
+                                         time_limit=None, iterations=100, seed=3)
+        game.make_move(1, 1, 'S')
+        board_hash = game.board.hash
+        current = game.current_player
+        computer.make_move()
+        assert game.board.hash == board_hash
+        assert game.board.filled_count == 1
+        assert game.current_player == current
+        assert game.undo_stack == []
+        assert game.blue_player.score == 0
+        assert not game.is_game_over()
+
+    def test_mcts_plays_complete_game(self):
+        game = create_game(SOSGame.SIMPLE_MODE)
+        game.set_board_size(3)
+        blue = create_player("MCTS", "Blue", "blue", game, time_limit=None, iterations=30)
+        red = create_player("MCTS", "Red", "red", game, time_limit=None, iterations=30)
+        game.set_players(blue, red)
+        game.start_new_game()
+        while not game.is_game_over():
+            row, col, letter = game.get_current_player().make_move()
+            game.make_move(row, col, letter)
+        assert game.get_winner() is not None
+
+
+class TestSelfPlay:
+    """Tests for the headless self-play runner"""
+
+    def test_play_game_result(self):
+        result = selfplay.play_game("Computer", "Minimax", 4, SOSGame.GENERAL_MODE, seed=5)
+        assert result["winner"] in ("Blue", "Red", "Draw")
+        assert result["moves"] == 16
+        assert result["blue"] == "Computer"
+        assert result["red"] == "Minimax"
+        assert result["duration"] >= 0
+
+    def test_seeded_games_repeat(self):
+        options = {"time_limit": None, "iterations": 20}
+        first = selfplay.play_game("MCTS", "Computer", 4, SOSGame.GENERAL_MODE,
+                                   blue_options=options, seed=9)
+        second = selfplay.play_game("MCTS", "Computer", 4, SOSGame.GENERAL_MODE,
+                                    blue_options=options, seed=9)
+        first.pop("duration")
+        second.pop("duration")
+        assert first == second
+
+    def test_human_player_rejected(self):
+        with pytest.raises(ValueError, match="two computer players"):
+            selfplay.play_game("Human", "Computer")
+
+    def test_main_streams_json_lines(self):
+        out = io.StringIO()
+        selfplay.main(["--games", "3", "--size", "3", "--mode", "Simple",
+                       "--red", "Minimax", "--red-options", '{"depth": 1}',
+                       "--seed", "1"], out=out)
+        lines = out.getvalue().splitlines()
+        assert len(lines) == 3
+        results = [json.loads(line) for line in lines]
+        assert [r["game"] for r in results] == [0, 1, 2]
+        assert [r["seed"] for r in results] == [1, 2, 3]
+
+    def test_no_tk_import(self):
+        check = "import sys, selfplay; sys.exit('tkinter' in sys.modules)"
+        folder = os.path.dirname(os.path.abspath(__file__))
+        assert subprocess.run([sys.executable, "-c", check], cwd=folder).returncode == 0
+
+
+class TestTournament:
+    """Tests for the process-pool tournament scheduler"""
+
+    def test_schedule_covers_both_colors(self):
+        tasks = tournament.schedule_games(["Computer", "Minimax"], [3, 4],
+                                          [SOSGame.SIMPLE_MODE], 2, seed=100)
+        assert len(tasks) == 2 * 2 * 2
+        pairs = {(task[0], task[1]) for task in tasks}
+        assert pairs == {("Computer", "Minimax"), ("Minimax", "Computer")}
+        assert [task[-1] for task in tasks] == list(range(100, 108))
+
+    def test_aggregate_results(self):
+        results = [
+            {"blue": "A", "red": "B", "size": 3, "mode": "Simple",
+             "winner": "Blue", "blue_score": 0, "red_score": 0},
+            {"blue": "A", "red": "B", "size": 3, "mode": "Simple",
+             "winner": "Draw", "blue_score": 0, "red_score": 0},
+            {"blue": "B", "red": "A", "size": 3, "mode": "General",
+             "winner": "Red", "blue_score": 1, "red_score": 3},
+        ]
+        table = tournament.aggregate_results(results)
+        row = table[("A", "B", 3, "Simple")]
+        assert (row["games"], row["blue_wins"], row["draws"], row["red_wins"]) == (2, 1, 1, 0)
+        assert table[("B", "A", 3, "General")]["red_avg_score"] == 3
+
+        standings = tournament.player_standings(table)
+        assert standings["A"] == {"games": 3, "wins": 2, "draws": 1, "losses": 0}
+        assert standings["B"] == {"games": 3, "wins": 0, "draws": 1, "losses": 2}
+
+    def test_parallel_matches_serial(self):
+        tasks = tournament.schedule_games(["Computer", "Minimax"], [3],
+                                          [SOSGame.GENERAL_MODE], 2, seed=7)
+        serial = tournament.run_games_parallel(tasks, workers=1)
+        parallel = tournament.run_games_parallel(tasks, workers=2)
+        for result in serial + parallel:
+            result.pop("duration")
+        assert serial == parallel
+
+    def test_run_tournament(self):
+        summary = tournament.run_tournament(["Computer", "Minimax"], sizes=[3],
+                                            games_per_pairing=2, workers=1)
+        assert len(summary["table"]) == 2
+        assert summary["standings"]["Minimax"]["games"] == 4
+
+
+class TestBatchSOSEngine:
+    """Tests for the NumPy batch simulator (skipped without numpy)"""
+
+    @pytest.fixture(autouse=True)
+    def engine_module(self):
+        pytest.importorskip("numpy")
+        import batch_engine
+        self.batch = batch_engine
+
+    def test_simple_win_detected(self):
+        engine = self.batch.BatchSOSEngine(2, 3, SOSGame.SIMPLE_MODE)
+        S, O = self.batch.S, self.batch.O
+        engine.step([0, 0], [0, 0], [S, S])
+        engine.step([1, 1], [0, 0], [S, O])
+        gains = engine.step([0, 0], [1, 1], [O, O])
+        assert list(gains) == [0, 0]
+        gains = engine.step([1, 1], [1, 1], [O, O])
+        gains = engine.step([0, 0], [2, 2], [S, S])
+        assert list(gains) == [1, 1]
+        assert engine.game_over.all()
+        assert list(engine.winner) == [self.batch.BLUE, self.batch.BLUE]
+
+    def test_occupied_cell_rejected(self):
+        engine = self.batch.BatchSOSEngine(1, 3)
+        engine.step([1], [1], [self.batch.S])
+        with pytest.raises(ValueError, match="Cell is already occupied"):
+            engine.step([1], [1], [self.batch.O])
+
+    def test_gains_match_gameboard(self):
+        """Per-move SOS counts agree with GameBoard.check_sos_at_position"""
+        engine = self.batch.BatchSOSEngine(50, 5, SOSGame.GENERAL_MODE, seed=4)
+        boards = [GameBoard(5) for _ in range(50)]
+        while not engine.game_over.all():
+            rows, cols, letters = engine.random_moves()
+            active = engine.active().copy()
+            gains = engine.step(rows, cols, letters)
+            for k in range(50):
+                if active[k]:
+                    letter = 'S' if letters[k] == self.batch.S else 'O'
+                    boards[k].place_letter(int(rows[k]), int(cols[k]), letter)
+                    found = boards[k].check_sos_at_position(int(rows[k]), int(cols[k]))
+                    assert len(found) == gains[k]
+        assert list(engine.count_all_sos()) == list(engine.scores.sum(axis=1))
+
+    def test_gain_maps_match_count_sos_for_move(self):
+        engine = self.batch.BatchSOSEngine(10, 4, SOSGame.GENERAL_MODE, seed=8)
+        for _ in range(6):
+            engine.step(*engine.random_moves())
+        s_gain, o_gain = engine.gain_maps()
+        for k in range(10):
+            board = GameBoard(4)
+            for row in range(4):
+                for col in range(4):
+                    code = engine.boards[k, row, col]
+                    if code:
+                        board.place_letter(row, col, 'S' if code == self.batch.S else 'O')
+            for row, col in board.empty_cells:
+                assert s_gain[k, row, col] == board.count_sos_for_move(row, col, 'S')
+                assert o_gain[k, row, col] == board.count_sos_for_move(row, col, 'O')
+
+    def test_play_out_finishes_every_board(self):
+        for policy in ("random", "greedy"):
+            engine = self.batch.BatchSOSEngine(100, 4, SOSGame.GENERAL_MODE, seed=1)
+            results = engine.play_out(policy)
+            assert results["blue_wins"] + results["red_wins"] + results["draws"] == 100
+            assert results["avg_moves"] == 16
+
+
+class TestThreatMap:
+    """Tests for the incrementally updated threat map"""
+
+    def brute_force_count(self, board, row, col, letter):
+        """Place, check and clear: what the threat map must agree with"""
+        board.grid[row][col] = letter
+        count = len(board.check_sos_at_position(row, col))
+        board.grid[row][col] = ' '
+        return count
+
+    @pytest.mark.parametrize("board_type", [GameBoard, BitBoard])
+    def test_threats_after_moves(self, board_type):
+        board = board_type(3)
+        board.place_letter(0, 0, 'S')
+        assert list(board.scoring_cells) == []
+        board.place_letter(0, 1, 'O')
+        assert board.count_sos_for_move(0, 2, 'S') == 1
+        assert board.count_sos_for_move(0, 2, 'O') == 0
+        assert list(board.scoring_cells) == [(0, 2)]
+
+        board.place_letter(0, 2, 'O')
+        assert list(board.scoring_cells) == []
+
+    def test_threats_stored_flat(self):
+        board = GameBoard(4)
+        board.place_letter(0, 0, 'S')
+        board.place_letter(0, 1, 'O')
+        assert isinstance(board.s_threats, bytearray)
+        assert len(board.s_threats) == len(board.o_threats) == 16
+        assert board.s_threats[2] == 1
+        assert sum(board.o_threats) == 0
+
+    def test_threats_built_on_first_use(self):
+        rng = random.Random(8)
+        cells = rng.sample([(r, c) for r in range(6) for c in range(6)], 24)
+        lazy = GameBoard(6)
+        tracked = GameBoard(6)
+        tracked.scoring_cells
+        for index, (row, col) in enumerate(cells):
+            letter = rng.choice('SO')
+            lazy.place_letter(row, col, letter)
+            tracked.place_letter(row, col, letter)
+            if index == 12:
+                assert lazy._s_threats is None  # Plain play does not track it
+                lazy.count_sos_for_move(0, 0, 'S')
+        for row, col in cells[:5]:
+            lazy.remove_letter(row, col)
+            tracked.remove_letter(row, col)
+        assert lazy.s_threats == tracked.s_threats
+        assert lazy.o_threats == tracked.o_threats
+        assert set(lazy.scoring_cells) == set(tracked.scoring_cells)
+
+    @pytest.mark.parametrize("board_type", [GameBoard, BitBoard])
+    def test_threats_match_brute_force(self, board_type):
+        rng = random.Random(11)
+        board = board_type(6)
+        placed = []
+        for _ in range(120):
+            if placed and rng.random() < 0.3:
+                board.remove_letter(*placed.pop(rng.randrange(len(placed))))
+            elif len(board.empty_cells):
+                row, col = board.empty_cells.choice(rng)
+                board.place_letter(row, col, rng.choice(['S', 'O']))
+                placed.append((row, col))
+            for row, col in list(board.empty_cells):
+                for letter in ('S', 'O'):
+                    assert board.count_sos_for_move(row, col, letter) == \
+                        self.brute_force_count(board, row, col, letter)
+
+    def test_best_scoring_move(self):
+        board = GameBoard(3)
+        for row, col in [(0, 0), (0, 2), (2, 0), (2, 2)]:
+            board.place_letter(row, col, 'S')
+        board.place_letter(0, 1, 'O')
+        # 'O' in the centre completes both diagonals, edge cells only one line
+        assert board.best_scoring_move() == (1, 1, 'O')
+
+    def test_bitboard_overwrite_updates_threats(self):
+        board = BitBoard(3)
+        board.place_letter(0, 0, 'S')
+        board.grid[0][1] = 'S'
+        assert board.count_sos_for_move(0, 2, 'S') == 0
+        board.grid[0][1] = 'O'
+        assert board.count_sos_for_move(0, 2, 'S') == 1
+
+    def test_computer_uses_threat_map(self):
+        game = SimpleGame()
+        game.set_board_size(5)
+        computer = create_player("Computer", "Blue", "blue", game)
+        game.set_players(computer, create_player("Human", "Red", "red"))
+        game.start_new_game()
+        game.board.place_letter(4, 0, 'S')
+        game.board.place_letter(3, 1, 'O')
+        assert computer.find_winning_move() == (2, 2, 'S')
+
+
+class TestGameRecord:
+    """Tests for the move log and binary game record format"""
+
+    def test_move_log_records_moves(self):
+        game = GeneralGame()
+        game.set_players(HumanPlayer("Blue", "blue"), HumanPlayer("Red", "red"))
+        game.start_new_game()
+        game.make_move(0, 0, 'S')
+        game.make_move(0, 1, 'O')
+        game.make_move(0, 2, 'S')
+        assert game.move_log == [(0, 0, 'S', False), (0, 1, 'O', False), (0, 2, 'S', True)]
+
+        game.push_move(1, 1, 'O')
+        game.pop_move()
+        assert len(game.move_log) == 3
+
+    def test_move_packing(self):
+        value = game_record.encode_move(10, 9, 9, 'O', True)
+        assert value == 99 | game_record.O_BIT | game_record.SCORED_BIT
+        assert game_record.decode_move(10, value) == (9, 9, 'O', True)
+        assert len(game_record.encode_moves(5, [(0, 0, 'S', False)] * 7)) == 14
+
+    def test_write_read_replay(self, tmp_path):
+        path = tmp_path / "games.sos"
+        with game_record.GameRecordWriter(path) as writer:
+            results = list(selfplay.run_games(3, "Computer", "Minimax", 4,
+                                              SOSGame.GENERAL_MODE, seed=20, writer=writer))
+        records = list(game_record.read_games(path))
+        assert len(records) == 3
+        for record, result in zip(records, results):
+            assert (record.size, record.mode) == (4, SOSGame.GENERAL_MODE)
+            assert (record.blue_type, record.red_type) == ("Computer", "Minimax")
+            assert record.seed == result["seed"]
+            game = record.replay()
+            assert game.is_game_over()
+            assert game.blue_player.score == result["blue_score"]
+            assert game.red_player.score == result["red_score"]
+
+    def test_appender_adds_to_existing_file(self, tmp_path):
+        path = tmp_path / "games.sos"
+        game = SimpleGame()
+        game.set_players(HumanPlayer("Blue", "blue"), HumanPlayer("Red", "red"))
+        game.start_new_game()
+        game.make_move(1, 1, 'S')
+        for _ in range(2):
+            with game_record.GameRecordWriter(path) as writer:
+                writer.write_game(game, "Human", "Human")
+        records = list(game_record.read_games(path))
+        assert len(records) == 2
+        assert records[1].seed is None
+        assert records[1].moves == [(1, 1, 'S', False)]
+
+    def test_bad_record_rejected(self):
+        with pytest.raises(ValueError, match="Not an SOS game record"):
+            list(game_record.iter_records(io.BytesIO(b'X' * game_record.HEADER.size)))
+        with pytest.raises(ValueError, match="Truncated game record"):
+            list(game_record.iter_records(io.BytesIO(b'SOS')))
+
+    def test_selfplay_record_option(self, tmp_path):
+        path = tmp_path / "cli.sos"
+        selfplay.main(["--games", "2", "--record", str(path), "--seed", "4"], out=io.StringIO())
+        assert [r.seed for r in game_record.read_games(path)] == [4, 5]
+
+
+class TestGameArchive:
+    """Tests for the mmap game archive with offset index"""
+
+    def write_archive(self, path, games):
+        results = []
+        with game_record.GameArchiveWriter(path) as writer:
+            for seed in range(games):
+                results.append(selfplay.play_game("Computer", "Computer", 3 + seed % 3,
+                                                  SOSGame.GENERAL_MODE, seed=seed,
+                                                  writer=writer))
+        return results
+
+    def test_random_access(self, tmp_path):
+        path = tmp_path / "archive.sos"
+        results = self.write_archive(path, 6)
+        with game_record.GameArchive(path) as archive:
+            assert len(archive) == 6
+            for k in (5, 0, 3):
+                record = archive.game(k)
+                assert record.seed == k
+                assert record.size == 3 + k % 3
+                assert len(record.moves) == results[k]["moves"]
+                assert record.replay().blue_player.score == results[k]["blue_score"]
+
+    def test_move_bytes_is_zero_copy_view(self, tmp_path):
+        path = tmp_path / "archive.sos"
+        self.write_archive(path, 2)
+        archive = game_record.GameArchive(path)
+        view = archive.move_bytes(1)
+        assert isinstance(view, memoryview)
+        assert len(view) == 2 * archive.header(1)[5]
+        assert game_record.decode_moves(4, view) == archive.game(1).moves
+        view.release()
+        archive.close()
+
+    def test_archive_is_a_record_stream(self, tmp_path):
+        """Writers append, and the archive also reads as a plain record file"""
+        path = tmp_path / "archive.sos"
+        self.write_archive(path, 2)
+        self.write_archive(path, 3)
+        with game_record.GameArchive(path) as archive:
+            assert len(archive) == 5
+            assert archive.game(4).seed == 2
+        assert len(list(game_record.read_games(path))) == 5
+
+    def test_index_out_of_range(self, tmp_path):
+        path = tmp_path / "empty.sos"
+        game_record.GameArchiveWriter(path).close()
+        with game_record.GameArchive(path) as archive:
+            assert len(archive) == 0
+            with pytest.raises(IndexError):
+                archive.game(0)
+
+
+class TestGameServer:
+    """Tests for the asyncio multi-game server"""
+
+    async def start(self):
+        game_server = server.GameServer()
+        listener = await asyncio.start_server(game_server.handle_client, '127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        return game_server, listener, port
+
+    async def connect(self, port):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+        async def request(message):
+            writer.write((json.dumps(message) + "\n").encode('utf-8'))
+            await writer.drain()
+
+        async def receive():
+            return json.loads(await asyncio.wait_for(reader.readline(), 5))
+
+        return writer, request, receive
+
+    async def stop(self, listener, *writers):
+        for writer in writers:
+            writer.close()
+            await writer.wait_closed()
+        listener.close()
+        await listener.wait_closed()
+
+    def test_human_vs_computer_session(self):
+        async def scenario():
+            game_server, listener, port = await self.start()
+            writer, request, receive = await self.connect(port)
+
+            await request({"type": "new_game", "mode": "General", "size": 3,
+                           "blue": "Human", "red": "Minimax", "options": {"red": {"depth": 1}}})
+            created = await receive()
+            assert created["type"] == "game_created"
+            assert created["board"] == ["   ", "   ", "   "]
+
+            await request({"type": "move", "game_id": created["game_id"],
+                           "row": 0, "col": 0, "letter": "S"})
+            human = await receive()
+            computer = await receive()
+            assert (human["player"], human["row"], human["col"]) == ("Blue", 0, 0)
+            assert computer["player"] == "Red"
+
+            await request({"type": "move", "game_id": created["game_id"],
+                           "row": 0, "col": 0, "letter": "O"})
+            assert await receive() == {"type": "error", "message": "Cell is already occupied"}
+            await self.stop(listener, writer)
+
+        asyncio.run(scenario())
+
+    def test_moves_broadcast_to_joined_clients(self):
+        async def scenario():
+            game_server, listener, port = await self.start()
+            first, request_first, receive_first = await self.connect(port)
+            second, request_second, receive_second = await self.connect(port)
+
+            await request_first({"type": "new_game", "mode": "Simple", "size": 3})
+            game_id = (await receive_first())["game_id"]
+            await request_second({"type": "join", "game_id": game_id})
+            assert (await receive_second())["current"] == "Blue"
+
+            await request_second({"type": "move", "game_id": game_id,
+                                  "row": 1, "col": 1, "letter": "O"})
+            assert (await receive_first())["letter"] == "O"
+            assert (await receive_second())["current"] == "Red"
+
+            await request_first({"type": "state", "game_id": game_id})
+            assert (await receive_first())["board"][1] == " O "
+            await self.stop(listener, first, second)
+
+        asyncio.run(scenario())
+
+    def test_bad_requests(self):
+        async def scenario():
+            game_server = server.GameServer()
+            with pytest.raises(ValueError, match="Unknown game"):
+                await game_server.handle_request({"type": "state", "game_id": 99})
+            with pytest.raises(ValueError, match="Unknown request type"):
+                await game_server.handle_request({"type": "dance"})
+            with pytest.raises(ValueError, match="must be a JSON object"):
+                await game_server.handle_request([1, 2])
+
+        asyncio.run(scenario())
+
+    @pytest.mark.parametrize("options, message", [
+        ("x", "Options must be a JSON object"),
+        ({"red": "x"}, "Player options must be a JSON object"),
+        ({"red": {"time_limit": None}}, "time_limit must be a number"),
+        ({"red": {"workers": 500}}, "workers must be a number"),
+        ({"red": {"depth": True}}, "depth must be a number"),
+        ({"red": {"table": {}}}, "Unknown player option: table"),
+    ])
+    def test_bad_player_options(self, options, message):
+        async def scenario():
+            game_server = server.GameServer()
+            with pytest.raises(ValueError, match=message):
+                await game_server.handle_request({"type": "new_game", "red": "MCTS",
+                                                  "options": options})
+            assert game_server.sessions == {}
+
+        asyncio.run(scenario())
+
+    def test_minimax_gets_a_time_limit(self):
+        assert server.player_options("Minimax", {"depth": 3}) == \
+            {"depth": 3, "time_limit_ms": server.MAX_THINK_MS}
+        assert server.player_options("MCTS", {"iterations": 5}) == {"iterations": 5}
+
+    def test_unfinished_game_dropped_when_last_client_leaves(self):
+        async def scenario():
+            game_server, listener, port = await self.start()
+            writer, request, receive = await self.connect(port)
+            await request({"type": "new_game", "mode": "General", "size": 8,
+                           "blue": "MCTS", "red": "MCTS",
+                           "options": {"blue": {"time_limit": 10.0},
+                                       "red": {"time_limit": 10.0}}})
+            game_id = (await receive())["game_id"]
+            session = game_server.sessions[game_id]
+            await asyncio.sleep(0.05)
+            assert session.thinking
+
+            await self.stop(listener, writer)
+            for _ in range(100):
+                if session.task.done():
+                    break
+                await asyncio.sleep(0.01)
+            assert game_server.sessions == {}
+            assert session.task.cancelled()
+            assert session.game.blue_player.stop_requested
+
+        asyncio.run(scenario())
+
+    def test_computer_only_game_runs_in_background(self):
+        async def scenario():
+            game_server = server.GameServer()
+            created = await game_server.handle_request(
+                {"type": "new_game", "mode": "General", "size": 4,
+                 "blue": "Computer", "red": "Computer"})
+            session = game_server.sessions[created["game_id"]]
+            await session.task
+            assert session.state()["game_over"]
+            # Nobody is watching the finished game, so it is dropped
+            assert game_server.sessions == {}
+
+        asyncio.run(scenario())
+
+    def test_finished_game_dropped_when_last_client_leaves(self):
+        async def scenario():
+            game_server, listener, port = await self.start()
+            writer, request, receive = await self.connect(port)
+
+            await request([1, 2])
+            assert await receive() == {"type": "error",
+                                       "message": "Request must be a JSON object"}
+
+            await request({"type": "new_game", "mode": "Simple", "size": 3})
+            game_id = (await receive())["game_id"]
+            for row, col, letter in [(0, 0, 'S'), (1, 1, 'O'), (2, 2, 'S')]:
+                await request({"type": "move", "game_id": game_id,
+                               "row": row, "col": col, "letter": letter})
+                await receive()
+            assert game_server.sessions[game_id].game.is_game_over()
+
+            await self.stop(listener, writer)
+            for _ in range(100):
+                if not game_server.sessions:
+                    break
+                await asyncio.sleep(0.01)
+            assert game_server.sessions == {}
+
+        asyncio.run(scenario())
+
+
+class TestStopRequest:
+    """Tests for cutting a running search short (used by the GUI worker thread)"""
+
+    def test_mcts_stops_after_request(self):
+        game = GeneralGame()
+        game.set_board_size(8)
+        computer = create_player("MCTS", "Blue", "blue", game, time_limit=30)
+        game.set_players(computer, HumanPlayer("Red", "red"))
+        game.start_new_game()
+
+        timer = threading.Timer(0.05, computer.request_stop)
+        timer.start()
+        start = time.perf_counter()
+        move = computer.make_move()
+        timer.join()
+        assert time.perf_counter() - start < 5
+        assert game.board.is_cell_empty(move[0], move[1])
+        assert game.undo_stack == []
+
+    def test_early_stop_not_lost(self):
+        """A stop sent before the search starts is still honored"""
+        game = SimpleGame()
+        game.set_board_size(4)
+        computer = create_player("Minimax", "Blue", "blue", game)
+        game.set_players(computer, HumanPlayer("Red", "red"))
+        game.start_new_game()
+        computer.request_stop()
+        assert computer.make_move() is not None
+        assert computer.nodes == 0
+
+        computer.clear_stop()
+        assert computer.make_move() is not None
+        assert computer.nodes > 0
+
+
+class TestLargeBoards:
+    """Tests for the configurable board size limit"""
+
+    def test_default_limit_unchanged(self):
+        assert GameBoard.max_size == 10
+        with pytest.raises(ValueError, match="between 3 and 10"):
+            GameBoard(11)
+
+    def test_raised_limit(self, monkeypatch):
+        monkeypatch.setattr(GameBoard, 'max_size', 100)
+        game = SimpleGame()
+        game.set_board_size(100)
+        game.set_players(HumanPlayer("Blue", "blue"), HumanPlayer("Red", "red"))
+        game.start_new_game()
+        assert game.board.size == 100
+        assert len(game.board.empty_cells) == 100 * 100
+        game.make_move(99, 99, 'S')
+        assert len(game.board.empty_cells) == 100 * 100 - 1
+        assert not game.board.is_board_full()
+        with pytest.raises(ValueError, match="between 3 and 100"):
+            game.set_board_size(101)
+
+    def test_bitboard_follows_limit(self, monkeypatch):
+        monkeypatch.setattr(GameBoard, 'max_size', 50)
+        board = BitBoard(50)
+        board.place_letter(49, 49, 'S')
+        assert board.get_cell(49, 49) == 'S'
+
+    def test_computer_game_on_large_board(self, monkeypatch):
+        monkeypatch.setattr(GameBoard, 'max_size', 60)
+        random.seed(5)
+        result = selfplay.play_game("Computer", "Computer", size=60,
+                                    mode=SOSGame.GENERAL_MODE, seed=5)
+        assert result["moves"] == 60 * 60
+
+    def test_minimax_width_limits_branching(self, monkeypatch):
+        monkeypatch.setattr(GameBoard, 'max_size', 40)
+        game = GeneralGame()
+        game.set_board_size(40)
+        computer = create_player("Minimax", "Blue", "blue", game, depth=2, width=8)
+        game.set_players(computer, HumanPlayer("Red", "red"))
+        game.start_new_game()
+        game.make_move(20, 20, 'S')
+        game.make_move(20, 21, 'O')
+        assert computer.make_move() == (20, 22, 'S')
+        assert computer.nodes <= 8 + 8 * 8
+
+    def test_minimax_width_scans_only_frontier(self, monkeypatch):
+        """Candidates come from the cells next to letters, not all n*n cells"""
+        monkeypatch.setattr(GameBoard, 'max_size', 100)
+        game = GeneralGame()
+        game.set_board_size(100)
+        computer = create_player("Minimax", "Blue", "blue", game, depth=1, width=6)
+        game.set_players(computer, HumanPlayer("Red", "red"))
+        game.start_new_game()
+        assert len(computer.ordered_moves()) == 6
+        game.make_move(50, 50, 'S')
+        scored = []
+        monkeypatch.setattr(game.board, 'count_sos_for_move',
+                            lambda row, col, letter: scored.append((row, col)) or 0)
+        moves = computer.ordered_moves()
+        assert len(moves) == 6
+        assert len(scored) == 2 * 8
+        assert all(abs(row - 50) <= 1 and abs(col - 50) <= 1 for _, row, col, _ in moves)
+
+    def test_selfplay_max_size_option(self, monkeypatch):
+        monkeypatch.setattr(GameBoard, 'max_size', GameBoard.max_size)
+        out = io.StringIO()
+        selfplay.main(["--size", "12", "--max-size", "12", "--seed", "1"], out=out)
+        assert json.loads(out.getvalue())["moves"] > 0
+
+
+class TestBenchmark:
+    """Tests for the benchmark suite (tiny time budgets)"""
+
+    def test_every_case_reports_metrics(self):
+        results = benchmark.run_benchmarks([3, 4], min_time=0.001)
+        assert {entry["case"] for entry in results} == set(benchmark.CASES)
+        assert {entry["board"] for entry in results} == set(benchmark.BOARDS)
+        for entry in results:
+            assert entry["runs"] >= 5
+            assert entry["ops_per_sec"] > 0
+            assert entry["p50_us"] <= entry["p99_us"]
+            assert entry["peak_memory_bytes"] >= 0
+
+    def test_timing_runs_untraced(self):
+        """Only the extra memory pass runs under tracemalloc"""
+        traced = []
+
+        def op():
+            traced.append(tracemalloc.is_tracing())
+            return [0] * 1000
+        result = benchmark.measure(op, min_time=0.001)
+        assert traced.count(True) == 1 and traced[-1]
+        assert result["runs"] == len(traced) - 2  # Warm-up and memory pass
+        assert result["peak_memory_bytes"] >= 8000
+
+    def test_compare_flags_slowdowns(self):
+        baseline = [{"case": "is_board_full", "size": 3, "ops_per_sec": 1000.0},
+                    {"case": "check_sos_at_position", "size": 3, "ops_per_sec": 1000.0}]
+        results = [{"case": "is_board_full", "size": 3, "ops_per_sec": 950.0},
+                   {"case": "check_sos_at_position", "size": 3, "ops_per_sec": 500.0},
+                   {"case": "check_sos_at_position", "size": 3, "board": "BitBoard",
+                    "ops_per_sec": 10.0}]
+        assert benchmark.compare(results, baseline, threshold=0.1) == \
+            [("check_sos_at_position", 3, "GameBoard", 1000.0, 500.0)]
+
+    def test_main_writes_json_and_checks_baseline(self, tmp_path):
+        path = str(tmp_path / "bench.json")
+        argv = ["--sizes", "3", "--cases", "is_board_full", "--boards", "GameBoard",
+                "--min-time", "0.001"]
+        assert benchmark.main(argv + ["--out", path], out=io.StringIO()) == 0
+        with open(path) as f:
+            report = json.load(f)
+        report["results"][0]["ops_per_sec"] *= 1000
+        with open(path, 'w') as f:
+            json.dump(report, f)
+        out = io.StringIO()
+        assert benchmark.main(argv + ["--baseline", path], out=out) == 1
+        assert "REGRESSION is_board_full size 3 GameBoard" in out.getvalue()
+
+
+class TestInstrumentation:
+    """Tests for opt-in move phase timing"""
+
+    PHASES = {'placement', 'sos_detection', 'handle_sos_found',
+              'check_game_over', 'turn_switch', 'make_move'}
+
+    def test_disabled_by_default(self):
+        game = SimpleGame()
+        game.set_players(HumanPlayer("Blue", "blue"), HumanPlayer("Red", "red"))
+        game.start_new_game()
+        game.make_move(0, 0, 'S')
+        assert game.instrumentation is None
+
+    def test_records_every_phase(self):
+        game = GeneralGame()
+        game.set_board_size(4)
+        game.set_players(create_player("Computer", "Blue", "blue", game),
+                         create_player("Minimax", "Red", "red", game))
+        game.start_new_game()
+        sink = instrumentation.MemorySink()
+        metrics = instrumentation.Instrumentation(sink)
+        metrics.attach(game)
+        while not game.is_game_over():
+            game.make_move(*game.get_current_player().make_move())
+        snapshot = metrics.flush()
+
+        assert set(snapshot) == self.PHASES | {'ai_decision'}
+        assert snapshot['make_move']['count'] == 16
+        assert snapshot['ai_decision']['count'] == 16
+        assert sink.snapshots == [snapshot]
+
+    def test_detach_restores_untimed_path(self):
+        game = SimpleGame()
+        game.set_players(create_player("Computer", "Blue", "blue", game),
+                         HumanPlayer("Red", "red"))
+        game.start_new_game()
+        metrics = instrumentation.Instrumentation()
+        metrics.attach(game)
+        instrumentation.Instrumentation.detach(game)
+        game.make_move(*game.blue_player.make_move())
+        assert metrics.snapshot() == {}
+
+    def test_phases_add_up_to_move(self):
+        game = SimpleGame()
+        game.set_players(HumanPlayer("Blue", "blue"), HumanPlayer("Red", "red"))
+        game.start_new_game()
+        metrics = instrumentation.Instrumentation()
+        metrics.attach(game)
+        game.make_move(0, 0, 'S')
+        game.make_move(1, 1, 'O')
+        snapshot = metrics.snapshot()
+        phases = sum(data['sum'] for phase, data in snapshot.items() if phase != 'make_move')
+        assert phases == pytest.approx(snapshot['make_move']['sum'])
+        assert all(data['count'] == 2 for data in snapshot.values())
+
+    def test_search_moves_not_timed_as_phases(self):
+        game = GeneralGame()
+        game.set_players(HumanPlayer("Blue", "blue"), HumanPlayer("Red", "red"))
+        game.start_new_game()
+        metrics = instrumentation.Instrumentation()
+        metrics.attach(game)
+        game.push_move(0, 0, 'S')
+        game.pop_move()
+        assert metrics.snapshot() == {}
+
+    def test_errors_still_raised(self):
+        game = SimpleGame()
+        game.set_players(HumanPlayer("Blue", "blue"), HumanPlayer("Red", "red"))
+        game.start_new_game()
+        instrumentation.Instrumentation().attach(game)
+        game.make_move(0, 0, 'S')
+        with pytest.raises(ValueError, match="Cell is already occupied"):
+            game.make_move(0, 0, 'O')
+
+    def test_histogram_quantiles(self):
+        histogram = instrumentation.Histogram()
+        for _ in range(99):
+            histogram.record(3e-6)
+        histogram.record(0.3)
+        assert histogram.quantile(0.5) == 5e-6
+        assert histogram.quantile(0.99) == 5e-6
+        assert histogram.quantile(1.0) == 0.5
+        assert histogram.max == 0.3
+
+    def test_prometheus_sink(self, tmp_path):
+        path = str(tmp_path / "sos.prom")
+        metrics = instrumentation.Instrumentation(instrumentation.PrometheusSink(path))
+        metrics.record('placement', 2e-6)
+        metrics.record('placement', 2.0)
+        metrics.flush()
+        with open(path) as f:
+            text = f.read()
+        assert "# TYPE sos_phase_duration_seconds histogram" in text
+        assert 'sos_phase_duration_seconds_bucket{phase="placement",le="2e-06"} 1' in text
+        assert 'sos_phase_duration_seconds_bucket{phase="placement",le="+Inf"} 2' in text
+        assert 'sos_phase_duration_seconds_count{phase="placement"} 2' in text
+
+    def test_selfplay_metrics_file(self, tmp_path):
+        path = str(tmp_path / "metrics.jsonl")
+        selfplay.main(["--games", "2", "--seed", "3", "--metrics", path], out=io.StringIO())
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        assert len(lines) == 1
+        assert lines[0]["phases"]["ai_decision"]["count"] == \
+            lines[0]["phases"]["make_move"]["count"]
+
+
+class TestSolver:
+    """Tests for the exact small-board solver and its endgame tables"""
+
+    @pytest.fixture(autouse=True)
+    def no_installed_tables(self, monkeypatch):
+        monkeypatch.setattr(ComputerPlayer, 'endgame_tables', {})
+
+    def negamax(self, game):
+        """Brute-force value for the player to move, using push/pop_move"""
+        if game.is_game_over():
+            return 0
+        best = None
+        mover = game.current_player
+        for row, col in list(game.board.empty_cells):
+            for letter in ('S', 'O'):
+                before = mover.score
+                game.push_move(row, col, letter)
+                if game.game_mode == SOSGame.SIMPLE_MODE:
+                    if game.winner is mover:
+                        value = 1
+                    elif game.is_game_over():
+                        value = 0
+                    else:
+                        value = -self.negamax(game)
+                elif game.current_player is mover:
+                    value = mover.score - before + self.negamax(game)
+                else:
+                    value = -self.negamax(game)
+                game.pop_move()
+                best = value if best is None else max(best, value)
+        return best
+
+    def started_game(self, mode, moves):
+        game = create_game(mode)
+        game.set_players(HumanPlayer("Blue", "blue"), HumanPlayer("Red", "red"))
+        game.start_new_game()
+        for move in moves:
+            game.make_move(*move)
+        return game
+
+    @pytest.mark.parametrize("mode", [SOSGame.SIMPLE_MODE, SOSGame.GENERAL_MODE])
+    def test_values_match_brute_force(self, mode):
+        exact = solver.Solver(3, mode)
+        rng = random.Random(7)
+        checked = 0
+        for _ in range(10):
+            game = self.started_game(mode, [])
+            for _ in range(rng.randint(4, 6)):
+                if game.is_game_over():
+                    break
+                row, col = game.board.empty_cells.choice(rng)
+                game.make_move(row, col, rng.choice('SO'))
+            if game.is_game_over():
+                continue
+            s_mask, o_mask = game.board.letter_masks()
+            assert exact.solve(s_mask, o_mask) == self.negamax(game)
+            checked += 1
+        assert checked > 0
+
+    def test_empty_board_values(self):
+        assert solver.Solver(3, SOSGame.SIMPLE_MODE).solve() == 0
+        assert solver.Solver(3, SOSGame.GENERAL_MODE).solve() == 0
+
+    def test_symmetric_positions_share_a_key(self):
+        exact = solver.Solver(4, SOSGame.GENERAL_MODE)
+        board = GameBoard(4)
+        board.place_letter(0, 1, 'S')
+        board.place_letter(2, 3, 'O')
+        mirrored = GameBoard(4)
+        mirrored.place_letter(0, 2, 'S')
+        mirrored.place_letter(2, 0, 'O')
+        assert exact.canonical_key(*board.letter_masks()) == \
+            exact.canonical_key(*mirrored.letter_masks())
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "sos3.tbl")
+        exact = solver.Solver(3, SOSGame.GENERAL_MODE)
+        exact.solve()
+        exact.save(path)
+        loaded = solver.Solver.load(path)
+        assert (loaded.size, loaded.mode) == (3, SOSGame.GENERAL_MODE)
+        assert loaded.values == exact.values
+        assert loaded.moves == exact.moves
+
+    def test_simple_table_covers_every_reply(self):
+        exact = solver.Solver(3, SOSGame.SIMPLE_MODE)
+        exact.solve()
+        for _, _, child_s, child_o, gain in exact.children(0, 0):
+            assert exact.canonical_key(child_s, child_o) in exact.values
+
+    def test_best_move_is_a_lookup(self):
+        exact = solver.Solver(3, SOSGame.GENERAL_MODE)
+        exact.solve()
+        board = self.started_game(SOSGame.GENERAL_MODE, [(0, 1, 'S'), (2, 2, 'O')]).board
+        exact.solve = None  # best_move must not search
+        row, col, letter = exact.best_move(board)
+        del exact.solve
+        s_mask, o_mask = board.letter_masks()
+        values = {(index, letter_code): exact.move_value(child_s, child_o, gain)
+                  for index, letter_code, child_s, child_o, gain
+                  in exact.children(s_mask, o_mask)}
+        chosen = values[(row * 3 + col, solver.LETTERS.index(letter))]
+        assert chosen == max(values.values()) == exact.solve(s_mask, o_mask)
+
+    def test_unsolved_position_has_no_move(self):
+        exact = solver.Solver(3, SOSGame.SIMPLE_MODE)
+        assert exact.best_move(GameBoard(3)) is None
+
+    def test_computer_player_uses_installed_table(self):
+        exact = solver.Solver(3, SOSGame.SIMPLE_MODE)
+        exact.solve()
+        solver.install(exact)
+        game = self.started_game(SOSGame.SIMPLE_MODE, [(0, 0, 'S'), (2, 2, 'O')])
+        computer = ComputerPlayer("Blue", "blue", game)
+        assert computer.make_move() == exact.best_move(game.board)
+
+    def test_perfect_player_never_loses(self):
+        for mode in (SOSGame.SIMPLE_MODE, SOSGame.GENERAL_MODE):
+            exact = solver.Solver(3, mode)
+            exact.solve()
+            solver.install(exact)
+            rng = random.Random(11)
+            for _ in range(10):
+                game = create_game(mode)
+                blue = ComputerPlayer("Blue", "blue", game)
+                game.set_players(blue, HumanPlayer("Red", "red"))
+                game.start_new_game()
+                while not game.is_game_over():
+                    if game.current_player is blue:
+                        game.make_move(*blue.make_move())
+                    else:
+                        row, col = game.board.empty_cells.choice(rng)
+                        game.make_move(row, col, rng.choice('SO'))
+                assert game.get_winner() in (blue, "Draw")
+
+    def test_cli_writes_table(self, tmp_path):
+        path = str(tmp_path / "t.tbl")
+        out = io.StringIO()
+        solver.main(["--size", "3", "--mode", "General", "--out", path], out=out)
+        assert "value 0" in out.getvalue()
+        assert len(solver.Solver.load(path).values) > 0
+
+
+class TestSymmetry:
+    """Tests for dihedral canonicalization of positions"""
+
+    @pytest.fixture(params=[GameBoard, BitBoard])
+    def board_class(self, request):
+        return request.param
+
+    def symmetric_boards(self, board_class, size, letters):
+        """The position given by letters under every transform"""
+        boards = []
+        for transform in range(8):
+            board = board_class(size)
+            for row, col, letter in letters:
+                board.place_letter(*board.transform_cell(row, col, transform), letter)
+            boards.append(board)
+        return boards
+
+    def test_permutations_are_symmetries(self):
+        for size in (3, 4, 5):
+            perms = get_symmetries(size)
+            assert len({tuple(perm) for perm in perms}) == 8
+            for transform, perm in enumerate(perms):
+                inverse = perms[SYMMETRY_INVERSE[transform]]
+                assert [inverse[index] for index in perm] == list(range(size * size))
+                # Neighbouring cells stay neighbours
+                rows = [divmod(perm[index], size) for index in range(size)]
+                steps = {(r2 - r1, c2 - c1) for (r1, c1), (r2, c2) in zip(rows, rows[1:])}
+                assert len(steps) == 1 and abs(sum(steps.pop())) == 1
+
+    def test_symmetric_positions_share_canonical_form(self, board_class):
+        letters = [(0, 1, 'S'), (2, 3, 'O'), (4, 4, 'S')]
+        boards = self.symmetric_boards(board_class, 5, letters)
+        assert len({board.hash for board in boards}) == 8
+        assert len({board.canonical_hash()[0] for board in boards}) == 1
+        assert len({board.canonical_masks()[0] for board in boards}) == 1
+
+    def test_different_positions_differ(self, board_class):
+        first = board_class(4)
+        first.place_letter(0, 0, 'S')
+        second = board_class(4)
+        second.place_letter(0, 1, 'S')
+        assert first.canonical_hash()[0] != second.canonical_hash()[0]
+
+    def test_hashes_built_on_first_use(self):
+        board = GameBoard(5)
+        board.place_letter(0, 1, 'S')
+        board.place_letter(3, 2, 'O')
+        assert board._symmetry_hashes is None  # Plain play does not track them
+        board.canonical_hash()
+        board.place_letter(4, 4, 'S')
+        board.remove_letter(0, 1)
+        fresh = GameBoard(5)
+        fresh.place_letter(4, 4, 'S')
+        fresh.place_letter(3, 2, 'O')
+        assert board.symmetry_hashes == fresh.symmetry_hashes
+
+    def test_empty_cells_not_shared(self):
+        first = GameBoard(4)
+        first.place_letter(1, 1, 'S')
+        assert len(GameBoard(4).empty_cells) == 16
+        assert len(game_logic.get_cells(4)) == 16
+
+    def test_hashes_follow_remove_letter(self, board_class):
+        board = board_class(4)
+        board.place_letter(1, 2, 'O')
+        board.place_letter(3, 0, 'S')
+        board.remove_letter(1, 2)
+        board.remove_letter(3, 0)
+        assert board.symmetry_hashes == [0] * 8
+
+    def test_identity_hash_matches_zobrist(self, board_class):
+        board = board_class(4)
+        board.place_letter(2, 1, 'S')
+        assert board.symmetry_hashes[0] == board.hash
+
+    def test_move_maps_back_from_canonical(self, board_class):
+        letters = [(0, 0, 'S'), (1, 2, 'O')]
+        canonical = self.symmetric_boards(board_class, 4, letters)[0]
+        canonical_hash = canonical.canonical_hash()[0]
+        for board in self.symmetric_boards(board_class, 4, letters):
+            key, transform = board.canonical_hash()
+            # The canonical form is board seen through transform
+            image = board_class(4)
+            for row in range(4):
+                for col in range(4):
+                    if not board.is_cell_empty(row, col):
+                        image.place_letter(*board.transform_cell(row, col, transform),
+                                           board.get_cell(row, col))
+            assert image.hash == key == canonical_hash
+            for row in range(4):
+                for col in range(4):
+                    assert board.untransform_cell(
+                        *board.transform_cell(row, col, transform), transform) == (row, col)
+
+    def test_minimax_table_shared_across_symmetries(self):
+        table = TranspositionTable()
+        game = GeneralGame()
+        game.set_board_size(4)
+        computer = create_player("Minimax", "Blue", "blue", game, depth=2, table=table)
+        game.set_players(computer, HumanPlayer("Red", "red"))
+        game.start_new_game()
+        game.make_move(0, 0, 'S')
+        computer.make_move()
+        stores = table.stores
+
+        mirrored = GeneralGame()
+        mirrored.set_board_size(4)
+        other = create_player("Minimax", "Blue", "blue", mirrored, depth=2, table=table)
+        mirrored.set_players(other, HumanPlayer("Red", "red"))
+        mirrored.start_new_game()
+        mirrored.make_move(0, 3, 'S')
+        hits = table.hits
+        other.make_move()
+        assert table.hits - hits > 0
+        assert table.stores - stores < stores
+
+
+class TestIterativeDeepening:
+    """Tests for deadline-bound minimax searches"""
+
+    def start(self, game_class, size, **options):
+        game = game_class()
+        game.set_board_size(size)
+        computer = create_player("Minimax", "Blue", "blue", game, **options)
+        game.set_players(computer, HumanPlayer("Red", "red"))
+        game.start_new_game()
+        return game, computer
+
+    def test_respects_deadline(self):
+        game, computer = self.start(GeneralGame, 7, time_limit_ms=100)
+        start = time.perf_counter()
+        move = computer.make_move()
+        elapsed = time.perf_counter() - start
+        assert elapsed < 0.5
+        assert game.board.is_cell_empty(move[0], move[1])
+        assert computer.depth_reached >= 1
+        assert computer.nodes_per_second > 0
+
+    def test_deadline_counts_from_make_move(self, monkeypatch):
+        """Time spent ordering moves comes out of the budget"""
+        game, computer = self.start(GeneralGame, 7, time_limit_ms=150)
+        order = computer.ordered_moves
+
+        def slow_order(shuffle=False):
+            if shuffle:
+                time.sleep(0.1)
+            return order(shuffle)
+        monkeypatch.setattr(computer, 'ordered_moves', slow_order)
+        start = time.perf_counter()
+        computer.make_move()
+        assert computer.deadline - start < 0.16
+
+    def test_board_restored_after_timeout(self):
+        game, computer = self.start(GeneralGame, 6, time_limit_ms=30)
+        game.make_move(2, 2, 'S')
+        game.make_move(2, 3, 'O')
+        before = (game.board.hash, game.board.filled_count, set(game.board.empty_cells))
+        computer.make_move()
+        assert (game.board.hash, game.board.filled_count,
+                set(game.board.empty_cells)) == before
+
+    def test_completes_small_board(self):
+        game, computer = self.start(GeneralGame, 3, time_limit_ms=10000)
+        for move in [(0, 0, 'S'), (0, 1, 'O'), (1, 1, 'S'), (2, 2, 'O'), (2, 0, 'O')]:
+            game.make_move(*move)
+        computer.make_move()
+        # Four empty cells: every depth up to the end of the game completes
+        assert computer.depth_reached == len(game.board.empty_cells)
+
+    def test_finds_win(self):
+        game, computer = self.start(SimpleGame, 5, time_limit_ms=200)
+        game.make_move(1, 1, 'S')
+        game.make_move(1, 2, 'O')
+        assert computer.make_move() == (1, 3, 'S')
+        assert computer.depth_reached == 1
+
+    def test_fixed_depth_unchanged(self):
+        game, computer = self.start(GeneralGame, 4, depth=2)
+        computer.make_move()
+        assert computer.depth_reached == 2
+        assert computer.deadline is None
+
+    def test_think_budget(self):
+        game = GeneralGame()
+        minimax = create_player("Minimax", "Blue", "blue", game)
+        mcts = create_player("MCTS", "Red", "red", game)
+        greedy = create_player("Computer", "Red", "red", game)
+        for player in (minimax, mcts, greedy):
+            player.set_think_budget(250)
+        assert minimax.time_limit_ms == 250
+        assert mcts.time_limit == 0.25
+
+
+class TestOpeningBook:
+    """Tests for the self-play opening book"""
+
+    @pytest.fixture(autouse=True)
+    def no_installed_books(self, monkeypatch):
+        monkeypatch.setattr(ComputerPlayer, 'opening_books', {})
+
+    def build(self, games=30, size=4, mode=SOSGame.GENERAL_MODE, plies=2):
+        book = opening_book.OpeningBook(size, mode, plies=plies, min_games=1)
+        for _ in selfplay.run_games(games, "Computer", "Computer", size, mode,
+                                    seed=1, writer=book):
+            pass
+        return book
+
+    def test_counts_every_game_once_per_ply(self):
+        book = self.build(games=30)
+        empty_board = GameBoard(4)
+        first_moves = book.stats[empty_board.canonical_hash()[0]]
+        assert sum(games for games, points in first_moves.values()) == 30
+        for moves in book.stats.values():
+            for games, points in moves.values():
+                assert 0 <= points <= 2 * games
+
+    def test_mover_points(self):
+        book = opening_book.OpeningBook(3, SOSGame.SIMPLE_MODE, plies=3)
+        book.add_game([(0, 0, 'S'), (1, 1, 'O'), (2, 2, 'S')], "Red")
+        board = GameBoard(3)
+        blue_move = book.stats[board.canonical_hash()[0]]
+        assert list(blue_move.values()) == [[1, 0]]
+        board.place_letter(0, 0, 'S')
+        red_move = book.stats[board.canonical_hash()[0]]
+        assert list(red_move.values()) == [[1, 2]]
+
+    def test_symmetric_openings_share_statistics(self):
+        book = opening_book.OpeningBook(4, SOSGame.GENERAL_MODE, plies=2, min_games=2)
+        book.add_game([(0, 0, 'S'), (0, 1, 'O')], "Blue")
+        book.add_game([(3, 3, 'S'), (3, 2, 'O')], "Blue")
+        board = GameBoard(4)
+        board.place_letter(0, 3, 'S')
+        # Rotated image of both games: the reply is mapped onto this board,
+        # either of the two cells next to the corner (the position is
+        # symmetric about the diagonal)
+        assert book.best_move(board) in ((0, 2, 'O'), (1, 3, 'O'))
+
+    def test_equivalent_moves_merge(self):
+        book = opening_book.OpeningBook(4, SOSGame.GENERAL_MODE, plies=2)
+        book.add_game([(0, 0, 'S'), (0, 1, 'O')], "Blue")
+        book.add_game([(0, 0, 'S'), (1, 0, 'O')], "Red")
+        board = GameBoard(4)
+        board.place_letter(0, 0, 'S')
+        assert list(book.stats[board.canonical_hash()[0]].values()) == [[2, 2]]
+
+    def test_no_move_past_plies_or_below_min_games(self):
+        book = opening_book.OpeningBook(4, SOSGame.GENERAL_MODE, plies=1, min_games=2)
+        book.add_game([(0, 0, 'S'), (0, 1, 'O')], "Blue")
+        assert book.best_move(GameBoard(4)) is None
+        book.add_game([(0, 0, 'S'), (0, 1, 'O')], "Blue")
+        assert book.best_move(GameBoard(4)) == (0, 0, 'S')
+        board = GameBoard(4)
+        board.place_letter(0, 0, 'S')
+        assert book.best_move(board) is None
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "book.bin")
+        book = self.build(games=20)
+        book.save(path)
+        loaded = opening_book.OpeningBook.load(path, min_games=1)
+        assert (loaded.size, loaded.mode, loaded.plies) == (4, SOSGame.GENERAL_MODE, 2)
+        assert loaded.stats == book.stats
+
+    def test_players_open_from_installed_book(self):
+        book = opening_book.OpeningBook(5, SOSGame.GENERAL_MODE, plies=1, min_games=1)
+        book.add_game([(2, 2, 'O')], "Blue")
+        opening_book.install(book)
+        for player_type in ("Computer", "Minimax", "MCTS"):
+            game = GeneralGame()
+            game.set_board_size(5)
+            player = create_player(player_type, "Blue", "blue", game)
+            game.set_players(player, HumanPlayer("Red", "red"))
+            game.start_new_game()
+            assert player.make_move() == (2, 2, 'O')
+
+    def test_cli_from_records(self, tmp_path):
+        records = str(tmp_path / "games.sos")
+        out_path = str(tmp_path / "book.bin")
+        selfplay.main(["--games", "5", "--size", "4", "--mode", "General", "--seed", "2",
+                       "--record", records], out=io.StringIO())
+        out = io.StringIO()
+        opening_book.main(["--size", "4", "--mode", "General", "--records", records,
+                           "--out", out_path], out=out)
+        loaded = opening_book.OpeningBook.load(out_path, min_games=1)
+        first_moves = loaded.stats[GameBoard(4).canonical_hash()[0]]
+        assert sum(games for games, points in first_moves.values()) == 5
+
+
+class TestParallelMinimax:
+    """Tests for root-split search over worker processes"""
+
+    def start(self, size=4, **options):
+        game = GeneralGame()
+        game.set_board_size(size)
+        computer = create_player("ParallelMinimax", "Blue", "blue", game,
+                                 workers=2, **options)
+        game.set_players(computer, HumanPlayer("Red", "red"))
+        game.start_new_game()
+        return game, computer
+
+    def test_matches_serial_value(self):
+        game, computer = self.start(depth=2)
+        for move in [(0, 0, 'S'), (1, 1, 'O'), (3, 3, 'S'), (0, 3, 'O')]:
+            game.make_move(*move)
+        row, col, letter = computer.make_move()
+
+        serial = MinimaxComputerPlayer("Blue", "blue", game, depth=2)
+        moves = serial.ordered_moves()
+        best_value = serial.search_moves(moves)[0][2]
+        gain = game.board.count_sos_for_move(row, col, letter)
+        chosen_value = serial._search_move(row, col, letter, gain, 2,
+                                           -float('inf'), float('inf'))
+        assert chosen_value == best_value
+        assert computer.depth_reached == 2
+        assert computer.nodes > 0
+        assert game.undo_stack == [] and len(game.move_log) == 4
+
+    def test_takes_scoring_move(self):
+        game, computer = self.start(size=5, time_limit_ms=300)
+        # Start the workers first: a cold forkserver can take the whole budget
+        pool = game_logic.search_pool(2)
+        concurrent.futures.wait([pool.submit(int) for _ in range(2)])
+        game.make_move(2, 1, 'S')
+        game.make_move(2, 2, 'O')
+        start = time.perf_counter()
+        move = computer.make_move()
+        elapsed = time.perf_counter() - start
+        assert move == (2, 3, 'S')
+        assert elapsed < 3
+        assert computer.depth_reached >= 1
+
+    def test_players_share_one_pool(self):
+        game, computer = self.start(depth=1)
+        other = create_player("ParallelMinimax", "Red", "red", game, workers=2, depth=1)
+        computer.make_move()
+        pool = game_logic._search_pool
+        game.make_move(0, 0, 'S')
+        other.make_move()
+        assert pool is not None and game_logic._search_pool is pool
+        assert not hasattr(computer, 'executor')
+
+    def test_pool_does_not_fork_threads(self):
+        pool = game_logic.search_pool(2)
+        assert pool._mp_context.get_start_method() in ('forkserver', 'spawn')
+
+    def test_rejects_table(self):
+        with pytest.raises(TypeError):
+            create_player("ParallelMinimax", "Blue", "blue", GeneralGame(),
+                          table=TranspositionTable())
+
+    def test_serial_inside_worker_process(self, monkeypatch):
+        game, computer = self.start(depth=1)
+        game_logic.discard_search_pool()
+        monkeypatch.setattr(game_logic, '_in_worker_process', lambda: True)
+        game.make_move(0, 0, 'S')
+        row, col, letter = computer.make_move()
+        assert game.board.is_cell_empty(row, col)
+        assert game_logic._search_pool is None
+
+    def test_worker_rebuilds_position(self):
+        game, computer = self.start()
+        game.make_move(0, 0, 'S')
+        game.make_move(0, 1, 'O')
+        game.make_move(0, 2, 'S')
+        copy = game_logic._rebuild_game(game.game_mode, 4, GameBoard.max_size, game.move_log)
+        assert copy.board.hash == game.board.hash
+        assert copy.blue_player.score == game.blue_player.score == 1
+        assert copy.red_player.score == game.red_player.score == 0
+        assert copy.current_player.name == game.current_player.name
+
+
+def _slow_root_visits(*args):
+    """Worker share that overruns any short time limit"""
+    time.sleep(1.0)
+    return {}, 0
+
+
+class TestParallelMCTS:
+    """Tests for root-parallel MCTS"""
+
+    def start(self, game_class=GeneralGame, size=4, **options):
+        game = game_class()
+        game.set_board_size(size)
+        computer = create_player("ParallelMCTS", "Blue", "blue", game, workers=2, **options)
+        game.set_players(computer, HumanPlayer("Red", "red"))
+        game.start_new_game()
+        return game, computer
+
+    def test_sums_root_visits(self):
+        game, computer = self.start(time_limit=None, iterations=150, seed=3)
+        move = computer.make_move()
+        assert computer.iterations == 300
+        assert sum(computer.visits.values()) == 300
+        assert computer.visits[move] == max(computer.visits.values())
+        assert game.undo_stack == [] and game.move_log == []
+
+    def test_reproducible_with_seed(self):
+        moves = []
+        for _ in range(2):
+            game, computer = self.start(time_limit=None, iterations=100, seed=9)
+            game.make_move(1, 1, 'S')
+            moves.append((computer.make_move(), dict(computer.visits)))
+        assert moves[0] == moves[1]
+
+    def test_finds_simple_win(self):
+        game, computer = self.start(SimpleGame, 5, time_limit=0.2, seed=1)
+        game.make_move(0, 0, 'S')
+        game.make_move(0, 1, 'O')
+        assert computer.make_move() == (0, 2, 'S')
+
+    def test_deadline_leaves_out_late_trees(self, monkeypatch):
+        monkeypatch.setattr(game_logic, '_mcts_root_visits', _slow_root_visits)
+        game, computer = self.start(time_limit=0.1, seed=2)
+        game_logic.search_pool(2)
+        start = time.perf_counter()
+        row, col, letter = computer.make_move()
+        assert time.perf_counter() - start < 0.5
+        assert game.board.is_cell_empty(row, col)
+        assert computer.visits == {}
+        assert game_logic._search_pool is None  # Busy pool discarded
@@ -0,0 +1,152 @@
+"""
+Hashim Abdulla
+SOS Tournament Module - Sprint 4
+Runs self-play games between computer player types over a process pool
+and aggregates win/draw/loss tables per pairing, board size and mode
+
+Usage (from the sprint4 folder):
+    python -m tournament --players Computer Minimax MCTS --sizes 3 5 --games 20
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from game_logic import GameBoard, SOSGame
+from selfplay import play_game
+
+
+def schedule_games(player_types, sizes, modes, games_per_pairing, seed=0,
+                   player_options=None):
+    """
+    List of game tasks: every ordered pair of different player types (so
+    each plays both colors), for every size and mode. Each task carries its
+    own seed so results do not depend on which worker runs it
+    """
+    player_options = player_options or {}
+    tasks = []
+    for mode in modes:
+        for size in sizes:
+            for blue_type in player_types:
+                for red_type in player_types:
+                    if blue_type == red_type:
+                        continue
+                    for _ in range(games_per_pairing):
+                        tasks.append((blue_type, red_type, size, mode,
+                                      player_options.get(blue_type),
+                                      player_options.get(red_type),
+                                      seed + len(tasks)))
+    return tasks
+
+
+def _init_worker(max_size):
+    """Worker start-up: carry over the board size limit from the parent"""
+    GameBoard.max_size = max_size
+
+
+def _play_task(task):
+    """Worker entry point: play one scheduled game"""
+    return play_game(*task)
+
+
+def run_games_parallel(tasks, workers=None):
+    """
+    Play tasks and return their results in task order
+    workers: process count (None = all cores, 0 or 1 = in this process)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        return [_play_task(task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(GameBoard.max_size,)) as executor:
+        return list(executor.map(_play_task, tasks, chunksize=chunksize))
+
+
+def aggregate_results(results):
+    """
+    Win/draw/loss table keyed by (blue, red, size, mode)
+    Wins and losses are counted from the blue player's side
+    """
+    table = {}
+    for result in results:
+        key = (result["blue"], result["red"], result["size"], result["mode"])
+        row = table.setdefault(key, {
+            "games": 0, "blue_wins": 0, "red_wins": 0, "draws": 0,
+            "blue_score_total": 0, "red_score_total": 0,
+        })
+        row["games"] += 1
+        if result["winner"] == "Blue":
+            row["blue_wins"] += 1
+        elif result["winner"] == "Red":
+            row["red_wins"] += 1
+        else:
+            row["draws"] += 1
+        row["blue_score_total"] += result["blue_score"]
+        row["red_score_total"] += result["red_score"]
+
+    for row in table.values():
+        row["blue_avg_score"] = row["blue_score_total"] / row["games"]
+        row["red_avg_score"] = row["red_score_total"] / row["games"]
+    return table
+
+
+def player_standings(table):
+    """Per player type totals across both colors: wins, draws, losses, games"""
+    standings = {}
+    for (blue_type, red_type, size, mode), row in table.items():
+        for player, wins, losses in ((blue_type, row["blue_wins"], row["red_wins"]),
+                                     (red_type, row["red_wins"], row["blue_wins"])):
+            entry = standings.setdefault(player, {"games": 0, "wins": 0,
+                                                  "draws": 0, "losses": 0})
+            entry["games"] += row["games"]
+            entry["wins"] += wins
+            entry["draws"] += row["draws"]
+            entry["losses"] += losses
+    return standings
+
+
+def run_tournament(player_types, sizes=(3,), modes=(SOSGame.SIMPLE_MODE,),
+                   games_per_pairing=10, workers=None, seed=0, player_options=None):
+    """Schedule, play and aggregate a full tournament"""
+    tasks = schedule_games(player_types, sizes, modes, games_per_pairing,
+                           seed, player_options)
+    results = run_games_parallel(tasks, workers)
+    table = aggregate_results(results)
+    return {"table": table, "standings": player_standings(table)}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel SOS tournament")
+    parser.add_argument("--players", nargs="+", default=["Computer", "Minimax"],
+                        help="computer player types")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[3])
+    parser.add_argument("--modes", nargs="+", default=[SOSGame.SIMPLE_MODE],
+                        choices=[SOSGame.SIMPLE_MODE, SOSGame.GENERAL_MODE])
+    parser.add_argument("--games", type=int, default=10, help="games per pairing")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--options", type=json.loads, default=None,
+                        help='JSON settings per type, e.g. \'{"Minimax": {"depth": 3}}\'')
+    parser.add_argument("--max-size", type=int, default=None,
+                        help="raise the board size limit (default 10)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.max_size is not None:
+        GameBoard.max_size = args.max_size
+    summary = run_tournament(args.players, args.sizes, args.modes, args.games,
+                             args.workers, args.seed, args.options)
+    rows = [dict(zip(("blue", "red", "size", "mode"), key), **row)
+            for key, row in summary["table"].items()]
+    print(json.dumps({"pairings": rows, "standings": summary["standings"]}, indent=2))
+
+
+if __name__ == "__main__":
+    main()